@@ -3,8 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.schemas.user import UserCreate, UserLogin
-from app.schemas.auth import TokenResponse
-from app.services import user_service
+from app.schemas.auth import TokenResponse, RefreshTokenRequest
+from app.services import user_service, token_service
 from app.core.security import create_access_token
 
 router = APIRouter()
@@ -19,7 +19,7 @@ async def register(user_create: UserCreate, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists"
         )
-    
+
     await user_service.create_user(db, user_create)
     return {"message": "User created successfully"}
 
@@ -33,6 +33,30 @@ async def login(user_login: UserLogin, db: AsyncSession = Depends(get_db)):
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
     access_token = create_access_token(data={"sub": str(user.id)})
-    return TokenResponse(access_token=access_token)
\ No newline at end of file
+    refresh_token = await token_service.issue_refresh_token(db, user.id)
+    return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(request: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
+    """Exchange a refresh token for a new access token without re-checking the password."""
+    rotated = await token_service.rotate_refresh_token(db, request.refresh_token)
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user_id, refresh_token = rotated
+    access_token = create_access_token(data={"sub": str(user_id)})
+    return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+
+
+@router.post("/logout")
+async def logout(request: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
+    """Revoke a refresh token and all tokens rotated from the same login."""
+    await token_service.revoke_refresh_token(db, request.refresh_token)
+    return {"message": "Logged out successfully"}
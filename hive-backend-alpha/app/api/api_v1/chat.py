@@ -4,7 +4,7 @@ from uuid import UUID
 from typing import List
 
 from ...database import get_db
-from ...dependencies import get_current_user
+from ...dependencies import get_current_user, get_read_db
 from ...models.user import User
 from ...schemas.chat import (
     ChatMessageCreate,
@@ -45,7 +45,7 @@ async def get_task_chat_messages(
     task_id: UUID,
     limit: int = Query(50, le=100),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get chat messages for a specific task."""
@@ -64,7 +64,7 @@ async def get_task_chat_messages(
 
 @router.get("/task-rooms", response_model=List[TaskChatRoom])
 async def get_user_task_chat_rooms(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all task chat rooms for the current user."""
@@ -98,7 +98,7 @@ async def get_direct_messages(
     other_user_id: UUID,
     limit: int = Query(50, le=100),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get direct messages with another user."""
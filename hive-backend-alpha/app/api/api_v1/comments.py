@@ -4,7 +4,7 @@ from uuid import UUID
 from typing import List
 
 from ...database import get_db
-from ...dependencies import get_current_user
+from ...dependencies import get_current_user, get_read_db
 from ...models.user import User
 from ...schemas.comment import CommentCreate, CommentUpdate, CommentResponse, CommentWithAuthor
 from ...services.comment_service import CommentService
@@ -27,7 +27,7 @@ async def create_comment(
 @router.get("/task/{task_id}", response_model=List[CommentWithAuthor])
 async def get_task_comments(
     task_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all comments for a specific task."""
@@ -76,7 +76,7 @@ async def delete_comment(
 @router.get("/{comment_id}", response_model=CommentResponse)
 async def get_comment(
     comment_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific comment by ID."""
@@ -8,7 +8,7 @@ import os
 import shutil
 from pathlib import Path
 
-from app.dependencies import get_current_user, get_db
+from app.dependencies import get_authorized_file, get_current_user, get_db
 from app.models.user import User
 from app.models.file import TaskFile
 from app.models.task import Task
@@ -39,7 +39,7 @@ async def upload_files(
     if task.owner_id != current_user.id and task.assignee_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to upload files to this task")
     
-    uploaded_files = []
+    db_files = []
     
     for file in files:
         # Generate unique filename
@@ -63,15 +63,20 @@ async def upload_files(
         )
         
         db.add(db_file)
-        await db.commit()
-        await db.refresh(db_file)
-        
-        uploaded_files.append({
+        db_files.append(db_file)
+    
+    # Record every upload in one transaction
+    await db.commit()
+    
+    uploaded_files = [
+        {
             "id": str(db_file.id),
             "name": db_file.original_filename,
             "size": db_file.file_size,
             "uploaded_at": db_file.created_at.isoformat()
-        })
+        }
+        for db_file in db_files
+    ]
     
     return {
         "status": "success",
@@ -80,27 +85,9 @@ async def upload_files(
 
 
 @router.get("/{file_id}/download")
-async def download_file(
-    file_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
+async def download_file(file_record: TaskFile = Depends(get_authorized_file)):
     """Download a file"""
     
-    # Get file record
-    result = await db.execute(select(TaskFile).where(TaskFile.id == file_id))
-    file_record = result.scalar_one_or_none()
-    
-    if not file_record:
-        raise HTTPException(status_code=404, detail="File not found")
-    
-    # Check if user has permission to access this file's task
-    task_result = await db.execute(select(Task).where(Task.id == file_record.task_id))
-    task = task_result.scalar_one_or_none()
-    
-    if not task or (task.owner_id != current_user.id and task.assignee_id != current_user.id):
-        raise HTTPException(status_code=403, detail="Not authorized to download this file")
-    
     # Check if file exists on disk
     if not os.path.exists(file_record.file_path):
         raise HTTPException(status_code=404, detail="File not found on disk")
@@ -114,26 +101,11 @@ async def download_file(
 
 @router.delete("/{file_id}")
 async def delete_file(
-    file_id: UUID,
-    current_user: User = Depends(get_current_user),
+    file_record: TaskFile = Depends(get_authorized_file),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a file"""
     
-    # Get file record
-    result = await db.execute(select(TaskFile).where(TaskFile.id == file_id))
-    file_record = result.scalar_one_or_none()
-    
-    if not file_record:
-        raise HTTPException(status_code=404, detail="File not found")
-    
-    # Check if user has permission to delete this file
-    task_result = await db.execute(select(Task).where(Task.id == file_record.task_id))
-    task = task_result.scalar_one_or_none()
-    
-    if not task or (task.owner_id != current_user.id and task.assignee_id != current_user.id):
-        raise HTTPException(status_code=403, detail="Not authorized to delete this file")
-    
     # Delete file from disk
     try:
         if os.path.exists(file_record.file_path):
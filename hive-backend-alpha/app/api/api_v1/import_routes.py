@@ -361,12 +361,14 @@ def validate_master_plan(content: str):
         return ["Master plan seems too short (less than 10 words)"]
     return []
 
+from app.database import unit_of_work
 from app.dependencies import get_current_user, get_db
 from app.models.user import User
 from app.schemas.task import TaskCreate
 from app.schemas.project import ProjectCreate
 from app.services.task_service import create_task
 from app.services.project_service import create_project
+from app.services.dependency_service import link_project_dependencies
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
@@ -431,65 +433,71 @@ async def confirm_import(
         imported_tasks = 0
         project_id_map = {}  # Map project names to created project IDs
         
-        # First, create projects from the preview data
-        if "projects" in preview_data:
-            for project_data in preview_data["projects"]:
-                print(f"DEBUG: Creating project '{project_data.get('name')}'")
+        # Create everything in one transaction; services flush instead of committing
+        async with unit_of_work(db):
+            # First, create projects from the preview data
+            if "projects" in preview_data:
+                for project_data in preview_data["projects"]:
+                    print(f"DEBUG: Creating project '{project_data.get('name')}'")
                 
-                # Convert parsed project to ProjectCreate schema
-                project_create = ProjectCreate(
-                    title=project_data.get("name", ""),
-                    description=project_data.get("description", "Project imported from master plan"),
-                    category=project_data.get("category", "General"),
-                    priority="medium",  # Default priority
-                    impact_points=project_data.get("impact_points", 100),
-                    deliverables=project_data.get("deliverables", []),
-                    definition_of_done=project_data.get("definition_of_done", "")
-                )
+                    # Convert parsed project to ProjectCreate schema
+                    project_create = ProjectCreate(
+                        title=project_data.get("name", ""),
+                        description=project_data.get("description", "Project imported from master plan"),
+                        category=project_data.get("category", "General"),
+                        priority="medium",  # Default priority
+                        impact_points=project_data.get("impact_points", 100),
+                        deliverables=project_data.get("deliverables", []),
+                        definition_of_done=project_data.get("definition_of_done", "")
+                    )
                 
-                # Create the project
-                created_project = await create_project(db, project_create, current_user.id)
-                project_id_map[project_data.get("name")] = created_project.id
-                imported_projects += 1
-                print(f"DEBUG: Created project with ID: {created_project.id}")
+                    # Create the project
+                    created_project = await create_project(db, project_create, current_user.id)
+                    project_id_map[project_data.get("name")] = created_project.id
+                    imported_projects += 1
+                    print(f"DEBUG: Created project with ID: {created_project.id}")
         
-        # Then, import tasks and associate them with projects
-        if "tasks" in preview_data:
-            for task_data in preview_data["tasks"]:
-                print(f"DEBUG: Creating task '{task_data.get('title')}'")
+            # Then, import tasks and associate them with projects
+            if "tasks" in preview_data:
+                for task_data in preview_data["tasks"]:
+                    print(f"DEBUG: Creating task '{task_data.get('title')}'")
                 
-                # Try to find which project this task belongs to
-                project_id = None
-                task_project = task_data.get("project")
-                if task_project and task_project in project_id_map:
-                    project_id = project_id_map[task_project]
-                    print(f"DEBUG: Associating task with project ID: {project_id}")
+                    # Try to find which project this task belongs to
+                    project_id = None
+                    task_project = task_data.get("project")
+                    if task_project and task_project in project_id_map:
+                        project_id = project_id_map[task_project]
+                        print(f"DEBUG: Associating task with project ID: {project_id}")
                 
-                # Convert parsed task to TaskCreate schema
-                task_create = TaskCreate(
-                    title=task_data.get("title", ""),
-                    description=task_data.get("description", ""),
-                    priority=task_data.get("priority", "medium"),
-                    category=task_data.get("category"),
-                    impact_points=task_data.get("impact_points", 100),
-                    estimated_hours=task_data.get("estimated_hours"),
-                    required_skills=task_data.get("required_skills", []),
-                    dependencies=task_data.get("dependencies", []),
-                    definition_of_done=task_data.get("definition_of_done"),
-                    success_metrics=task_data.get("success_metrics"),
-                    deliverables=task_data.get("deliverables"),
-                    project_id=project_id  # Associate with project
-                )
+                    # Convert parsed task to TaskCreate schema
+                    task_create = TaskCreate(
+                        title=task_data.get("title", ""),
+                        description=task_data.get("description", ""),
+                        priority=task_data.get("priority", "medium"),
+                        category=task_data.get("category"),
+                        impact_points=task_data.get("impact_points", 100),
+                        estimated_hours=task_data.get("estimated_hours"),
+                        required_skills=task_data.get("required_skills", []),
+                        dependencies=task_data.get("dependencies", []),
+                        definition_of_done=task_data.get("definition_of_done"),
+                        success_metrics=task_data.get("success_metrics"),
+                        deliverables=task_data.get("deliverables"),
+                        project_id=project_id  # Associate with project
+                    )
                 
-                # Create the task
-                await create_task(db, task_create, current_user)
-                imported_tasks += 1
+                    # Create the task
+                    await create_task(db, task_create, current_user)
+                    imported_tasks += 1
+            
+            # Tasks name their dependencies by title; link them now that all exist
+            linked_dependencies = await link_project_dependencies(db, project_id_map.values())
         
         return {
             "status": "success",
             "imported_projects": imported_projects,
             "imported_tasks": imported_tasks,
-            "total_imported": imported_projects + imported_tasks
+            "total_imported": imported_projects + imported_tasks,
+            "linked_dependencies": linked_dependencies
         }
         
     except Exception as e:
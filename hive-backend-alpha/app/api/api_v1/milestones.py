@@ -1,10 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
 from uuid import UUID
 
-from app.dependencies import get_current_user, get_db
+from app.core.conditional import entity_etag, is_not_modified, not_modified_response, validator_headers
+from app.dependencies import get_authorized_milestone, get_current_user, get_db
 from app.models.user import User
 from app.models.milestone import Milestone
 from app.models.task import Task
@@ -65,70 +66,34 @@ async def get_task_milestones(
 
 @router.get("/{milestone_id}", response_model=MilestoneResponse)
 async def get_milestone(
-    milestone_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    milestone: Milestone = Depends(get_authorized_milestone)
 ):
-    """Get a specific milestone"""
-    result = await db.execute(select(Milestone).where(Milestone.id == milestone_id))
-    milestone = result.scalar_one_or_none()
-    
-    if not milestone:
-        raise HTTPException(status_code=404, detail="Milestone not found")
-    
-    # Check if user has permission to view this milestone
-    task_result = await db.execute(select(Task).where(Task.id == milestone.task_id))
-    task = task_result.scalar_one_or_none()
-    
-    if not task or (task.owner_id != current_user.id and task.assignee_id != current_user.id):
-        raise HTTPException(status_code=403, detail="Not authorized to view this milestone")
+    """Get a specific milestone (supports If-None-Match / If-Modified-Since)"""
+    etag = entity_etag(milestone.id, milestone.updated_at)
+    if is_not_modified(request.headers, etag, milestone.updated_at):
+        return not_modified_response(etag, milestone.updated_at)
     
+    response.headers.update(validator_headers(etag, milestone.updated_at))
     return milestone
 
 
 @router.put("/{milestone_id}", response_model=MilestoneResponse)
 async def update_milestone_endpoint(
-    milestone_id: UUID,
     milestone_data: MilestoneUpdate,
-    current_user: User = Depends(get_current_user),
+    milestone: Milestone = Depends(get_authorized_milestone),
     db: AsyncSession = Depends(get_db)
 ):
     """Update a milestone"""
-    result = await db.execute(select(Milestone).where(Milestone.id == milestone_id))
-    milestone = result.scalar_one_or_none()
-    
-    if not milestone:
-        raise HTTPException(status_code=404, detail="Milestone not found")
-    
-    # Check if user has permission to update this milestone
-    task_result = await db.execute(select(Task).where(Task.id == milestone.task_id))
-    task = task_result.scalar_one_or_none()
-    
-    if not task or (task.owner_id != current_user.id and task.assignee_id != current_user.id):
-        raise HTTPException(status_code=403, detail="Not authorized to update this milestone")
-    
-    return await update_milestone(db, milestone_id, milestone_data)
+    return await update_milestone(db, milestone, milestone_data)
 
 
 @router.delete("/{milestone_id}")
 async def delete_milestone_endpoint(
-    milestone_id: UUID,
-    current_user: User = Depends(get_current_user),
+    milestone: Milestone = Depends(get_authorized_milestone),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a milestone"""
-    result = await db.execute(select(Milestone).where(Milestone.id == milestone_id))
-    milestone = result.scalar_one_or_none()
-    
-    if not milestone:
-        raise HTTPException(status_code=404, detail="Milestone not found")
-    
-    # Check if user has permission to delete this milestone
-    task_result = await db.execute(select(Task).where(Task.id == milestone.task_id))
-    task = task_result.scalar_one_or_none()
-    
-    if not task or (task.owner_id != current_user.id and task.assignee_id != current_user.id):
-        raise HTTPException(status_code=403, detail="Not authorized to delete this milestone")
-    
-    await delete_milestone(db, milestone_id)
+    await delete_milestone(db, milestone)
     return {"message": "Milestone deleted successfully"}
\ No newline at end of file
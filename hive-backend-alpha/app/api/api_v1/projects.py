@@ -1,29 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import List, Optional
 
 from ...database import get_db
-from ...dependencies import get_current_user
+from ...core.conditional import (
+    entity_etag, entity_version, is_conditional, is_not_modified, not_modified_response, validator_headers
+)
+from ...core.dependency_graph import DependencyCycleError
+from ...core.fieldsets import pick_fields
+from ...core.pagination import decode_score_cursor, encode_score_cursor
+from ...dependencies import get_current_user, get_read_db, sparse_fields
+from ...models.project import Project
 from ...models.user import User
 from ...schemas.project import (
     ProjectCreate, 
     ProjectUpdate, 
     ProjectResponse, 
     ProjectWithTasks,
-    ProjectSummary
+    ProjectSummary,
+    ProjectSearchHit,
+    ProjectSearchPage,
+    ProjectDependencyGraph
 )
-from ...services import project_service
+from ...schemas.task import TaskResponse
+from ...services import dependency_service, project_service, search_service
 
 router = APIRouter()
 
+project_fields = sparse_fields(ProjectWithTasks.model_fields)
+task_fields = sparse_fields(TaskResponse.model_fields)
+
 
 @router.get("/", response_model=List[ProjectWithTasks])
 async def get_projects(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
+    fields: Optional[List[str]] = Depends(project_fields),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all projects with task counts"""
@@ -31,9 +47,10 @@ async def get_projects(
         db=db, 
         skip=skip, 
         limit=limit,
-        status=status
+        status=status,
+        fields=fields
     )
-    return projects
+    return JSONResponse(projects) if fields else projects
 
 
 @router.get("/my", response_model=List[ProjectWithTasks])
@@ -41,7 +58,8 @@ async def get_my_projects(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
+    fields: Optional[List[str]] = Depends(project_fields),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get projects owned by current user"""
@@ -50,14 +68,15 @@ async def get_my_projects(
         skip=skip, 
         limit=limit,
         owner_id=current_user.id,
-        status=status
+        status=status,
+        fields=fields
     )
-    return projects
+    return JSONResponse(projects) if fields else projects
 
 
 @router.get("/summary", response_model=ProjectSummary)
 async def get_projects_summary(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get project summary statistics"""
@@ -65,6 +84,36 @@ async def get_projects_summary(
     return summary
 
 
+@router.get("/search", response_model=ProjectSearchPage)
+async def search_projects(
+    q: str = Query(..., min_length=1, description="Search text"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Ranked full-text search over projects (see GET /tasks/search)"""
+    try:
+        after = decode_score_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    hits, next_key = await search_service.search_projects(db, q, limit=limit, after=after)
+    items = [
+        ProjectSearchHit(
+            **ProjectResponse.model_validate(project).model_dump(),
+            score=score,
+            highlight=highlight,
+            snippet=snippet
+        )
+        for project, score, highlight, snippet in hits
+    ]
+    return ProjectSearchPage(items=items, next_cursor=encode_score_cursor(*next_key) if next_key else None)
+
+
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
@@ -83,19 +132,51 @@ async def create_project(
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get a specific project"""
+    """Get a specific project (supports If-None-Match)"""
+    version = await project_service.get_project_version(db, project_id) if is_conditional(request.headers) else None
+    if version is not None:
+        etag = entity_etag(project_id, *version)
+        # Counter changes don't move Last-Modified, so only the ETag can answer 304
+        if is_not_modified(request.headers, etag):
+            return not_modified_response(etag, version.updated_at)
+
     project = await project_service.get_project(db, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
+    etag = entity_etag(project.id, project.updated_at, *project_service.project_version_parts(project))
+    response.headers.update(validator_headers(etag, project.updated_at))
     return project
 
 
+@router.get("/{project_id}/dependencies", response_model=ProjectDependencyGraph)
+async def get_project_dependencies(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Task dependency graph of a project: topological order, critical path, ready and blocked tasks"""
+    if await entity_version(db, Project, project_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    try:
+        return await dependency_service.get_project_dependency_graph(db, project_id)
+    except DependencyCycleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: UUID,
@@ -140,7 +221,8 @@ async def delete_project(
 @router.get("/{project_id}/tasks")
 async def get_project_tasks(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    fields: Optional[List[str]] = Depends(task_fields),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all tasks for a project"""
@@ -152,5 +234,5 @@ async def get_project_tasks(
             detail="Project not found"
         )
     
-    tasks = await project_service.get_project_tasks(db, project_id)
-    return tasks
\ No newline at end of file
+    tasks = await project_service.get_project_tasks(db, project_id, fields=fields)
+    return JSONResponse(pick_fields(tasks, fields)) if fields else tasks
\ No newline at end of file
@@ -1,13 +1,28 @@
-from typing import List
+from typing import List, Literal, Optional, Union
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.conditional import (
+    entity_etag, entity_version, is_conditional, is_not_modified, not_modified_response, validator_headers
+)
+from app.core.dependency_graph import DependencyCycleError
+from app.core.fieldsets import pick_fields
+from app.core.pagination import decode_cursor, decode_score_cursor, encode_cursor, encode_score_cursor
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, get_read_db, sparse_fields
+from app.models.task import Task
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskAssign, TaskStatusUpdate
-from app.services import task_service, user_service, assignment_service
+from app.schemas.task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskAssign, TaskStatusUpdate, TaskPage, TaskFilter,
+    TaskBulkRequest, TaskBulkResponse, TaskSearchHit, TaskSearchPage, TaskRecommendationPage,
+    TaskDependencies
+)
+from app.services import (
+    task_service, user_service, assignment_service, search_service, dependency_service
+)
 
 router = APIRouter()
 
@@ -21,31 +36,220 @@ async def create_new_task(
     return await task_service.create_task(db, task_create, current_user)
 
 
-@router.get("/", response_model=List[TaskResponse])
+def _check_bulk_size(bulk: TaskBulkRequest) -> None:
+    if len(bulk.tasks) > settings.bulk_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.bulk_max_items} tasks per request"
+        )
+
+
+def _bulk_response(results) -> TaskBulkResponse:
+    succeeded = sum(1 for result in results if result.ok)
+    return TaskBulkResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def bulk_create_tasks(
+    bulk: TaskBulkRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many tasks in one transaction, reporting a result per item."""
+    _check_bulk_size(bulk)
+    results = await task_service.bulk_create_tasks(db, bulk.tasks, current_user)
+    return _bulk_response(results)
+
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+async def bulk_update_tasks(
+    bulk: TaskBulkRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Update many tasks (e.g. statuses) in one transaction, reporting a result per item."""
+    _check_bulk_size(bulk)
+    results = await task_service.bulk_update_tasks(db, bulk.tasks, current_user)
+    return _bulk_response(results)
+
+
+@router.get("/", response_model=Union[TaskPage, List[TaskResponse]])
 async def list_tasks(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    owner_id: Optional[UUID] = None,
+    assignee_id: Optional[UUID] = None,
+    project_id: Optional[UUID] = None,
+    skills: Optional[List[str]] = Query(None),
+    skills_match: Literal["all", "any"] = "all",
+    sort: str = task_service.DEFAULT_TASK_SORT,
+    fields: Optional[List[str]] = Depends(sparse_fields(TaskResponse.model_fields)),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
+):
+    """List tasks, newest first unless ``sort`` says otherwise.
+
+    Filters combine with AND; ``skills`` may be repeated and matches tasks
+    requiring all of them (or any, with ``skills_match=any``). ``sort`` is one
+    of updated_at, created_at, impact_points, title or priority, prefixed with
+    "-" for descending.
+
+    Pass ``cursor`` (empty for the first page, then each response's
+    ``next_cursor``) for keyset pagination; the response is then a
+    ``TaskPage``. Without it, ``skip``/``limit`` return a plain list.
+
+    ``fields=id,title,status`` SELECTs and returns only those columns.
+    """
+    filters = TaskFilter(
+        status=status_filter,
+        priority=priority,
+        category=category,
+        owner_id=owner_id,
+        assignee_id=assignee_id,
+        project_id=project_id,
+        skills=skills,
+        skills_match=skills_match
+    )
+
+    if cursor is None:
+        try:
+            tasks = await task_service.get_tasks(
+                db, skip=skip, limit=limit, filters=filters, sort=sort, fields=fields
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        return JSONResponse(pick_fields(tasks, fields)) if fields else tasks
+
+    if sort != task_service.DEFAULT_TASK_SORT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination only supports the default sort"
+        )
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    tasks, next_key = await task_service.get_tasks_page(
+        db, limit=limit, after=after, filters=filters, fields=fields
+    )
+    next_cursor = encode_cursor(*next_key) if next_key else None
+    if fields:
+        return JSONResponse({"items": pick_fields(tasks, fields), "next_cursor": next_cursor})
+    return TaskPage(items=tasks, next_cursor=next_cursor)
+
+
+@router.get("/search", response_model=TaskSearchPage)
+async def search_tasks(
+    q: str = Query(..., min_length=1, description="Search text"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    return await task_service.get_tasks(db, skip=skip, limit=limit)
+    """Full-text search over title, category, description and definition of done.
+
+    Results are ranked by relevance, with matches wrapped in <mark> in
+    ``highlight`` (title) and ``snippet`` (description). Pass ``next_cursor``
+    back as ``cursor`` for the next page.
+    """
+    try:
+        after = decode_score_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    hits, next_key = await search_service.search_tasks(db, q, limit=limit, after=after)
+    items = [
+        TaskSearchHit(
+            **TaskResponse.model_validate(task).model_dump(),
+            score=score,
+            highlight=highlight,
+            snippet=snippet
+        )
+        for task, score, highlight, snippet in hits
+    ]
+    return TaskSearchPage(items=items, next_cursor=encode_score_cursor(*next_key) if next_key else None)
+
+
+@router.get("/recommended", response_model=TaskRecommendationPage)
+async def recommended_tasks(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Available, unassigned tasks ranked by how many of your skills they require.
+
+    Pass ``next_cursor`` back as ``cursor`` for the next page. Results are
+    cached per user for a short time and refreshed when tasks change.
+    """
+    try:
+        after = decode_score_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    items, next_key = await task_service.get_recommended_tasks(db, current_user, limit=limit, after=after)
+    return TaskRecommendationPage(items=items, next_cursor=encode_score_cursor(*next_key) if next_key else None)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
+    # Answer conditional requests from updated_at alone, before loading the task
+    version = await entity_version(db, Task, task_id) if is_conditional(request.headers) else None
+    if version is not None:
+        etag = entity_etag(task_id, version)
+        if is_not_modified(request.headers, etag, version):
+            return not_modified_response(etag, version)
+
     task = await task_service.get_task_by_id(db, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
+    response.headers.update(validator_headers(entity_etag(task.id, task.updated_at), task.updated_at))
     return task
 
 
+@router.get("/{task_id}/dependencies", response_model=TaskDependencies)
+async def get_task_dependencies(
+    task_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Which unfinished tasks block this one, and which tasks it blocks or would unblock."""
+    dependencies = await dependency_service.get_task_dependencies(db, task_id)
+    if not dependencies:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+    return dependencies
+
+
 @router.put("/{task_id}", response_model=TaskResponse)
 async def update_existing_task(
     task_id: UUID,
@@ -67,7 +271,13 @@ async def update_existing_task(
             detail="Not authorized to update this task"
         )
     
-    return await task_service.update_task(db, task, task_update)
+    try:
+        return await task_service.update_task(db, task, task_update)
+    except DependencyCycleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 
 @router.delete("/{task_id}")
@@ -133,6 +343,11 @@ async def claim_task(
     db: AsyncSession = Depends(get_db)
 ):
     """Allow a user to claim an available task for themselves."""
+    task = await assignment_service.claim_task(db, task_id, current_user)
+    if task:
+        return task
+
+    # Lost the race or not claimable; look the task up only to say why
     task = await task_service.get_task_by_id(db, task_id)
     if not task:
         raise HTTPException(
@@ -147,20 +362,17 @@ async def claim_task(
             detail="Task is already assigned"
         )
     
-    if task.status != "available":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Task is not available for claiming"
-        )
-    
     # User cannot claim their own task
-    if task.owner_id == current_user.id:
+    if task.status == "available" and task.owner_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot claim your own task"
         )
     
-    return await assignment_service.assign_task(db, task, current_user, current_user)
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Task is not available for claiming"
+    )
 
 
 @router.put("/{task_id}/status", response_model=TaskResponse)
@@ -185,11 +397,10 @@ async def update_task_status(
         )
     
     # Validate status transition
-    valid_statuses = ["draft", "available", "in_progress", "completed"]
-    if status_update.status not in valid_statuses:
+    if status_update.status not in task_service.VALID_TASK_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
+            detail=f"Invalid status. Must be one of: {', '.join(task_service.VALID_TASK_STATUSES)}"
         )
     
     return await task_service.update_task_status(db, task, status_update.status)
\ No newline at end of file
@@ -7,6 +7,7 @@ from typing import Optional
 from app.core.auth import verify_access_token
 from app.database import get_db
 from app.websockets.connection_manager import manager
+from app.websockets.dashboard_feed import dashboard_feed
 from app.schemas.websocket import WebSocketMessage, ChatMessage, TaskChatMessage
 from app.services.chat_service import ChatService
 from app.models.task import Task
@@ -78,6 +79,13 @@ async def websocket_endpoint(websocket: WebSocket, token: Optional[str] = Query(
                         finally:
                             db.close()
                 
+                elif message.type == "subscribe_dashboard":
+                    # Snapshot now, then coalesced dashboard_delta frames
+                    await dashboard_feed.subscribe(websocket)
+                
+                elif message.type == "unsubscribe_dashboard":
+                    dashboard_feed.unsubscribe(websocket)
+                
                 elif message.type == "ping":
                     # Respond to ping with pong
                     await manager.send_personal_message(
@@ -95,4 +103,5 @@ async def websocket_endpoint(websocket: WebSocket, token: Optional[str] = Query(
                 )
                 
     except WebSocketDisconnect:
+        dashboard_feed.unsubscribe(websocket)
         manager.disconnect(websocket, user_id)
\ No newline at end of file
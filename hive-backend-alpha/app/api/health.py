@@ -1,8 +1,34 @@
 from fastapi import APIRouter
 
+from app import database
+from app.core.cache import get_cache_stats
+from app.core.security import password_hasher
+from app.database import get_pool_status
+
 router = APIRouter()
 
 
 @router.get("/health")
 async def health_check():
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+
+@router.get("/health/db")
+async def database_health():
+    """Connection pool diagnostics: checked out, overflow and checkout wait histogram."""
+    result = {"status": "ok", "pool": get_pool_status()}
+    if database.read_engine is not None:
+        result["read_pool"] = get_pool_status(database.read_engine)
+    return result
+
+
+@router.get("/health/caches")
+async def cache_health():
+    """Hit/miss statistics for the in-process caches."""
+    return {"status": "ok", "caches": get_cache_stats()}
+
+
+@router.get("/health/password-hasher")
+async def password_hasher_health():
+    """Queue depth and timings of the bcrypt worker pool."""
+    return {"status": "ok", "password_hasher": password_hasher.stats()}
@@ -0,0 +1,87 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app import database
+from app.core.cache import get_cache_stats
+from app.core.metrics import Counter, Gauge, HistogramMetric, registry
+from app.core.security import password_hasher
+from app.database import InstrumentedAsyncQueuePool, get_pool_status
+from app.websockets.connection_manager import manager
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _websocket_connections():
+    return [((), sum(len(sockets) for sockets in manager.active_connections.values()))]
+
+
+def _websocket_users():
+    return [((), len(manager.active_connections))]
+
+
+def _pool_gauge(field: str):
+    def collect():
+        samples = []
+        for name, engine in (("primary", database.engine), ("replica", database.read_engine)):
+            if engine is None:
+                continue
+            value = get_pool_status(engine).get(field)
+            if value is not None:
+                samples.append(((name,), value))
+        return samples
+    return collect
+
+
+def _pool_wait_histogram():
+    pool = database.engine.pool
+    return pool.wait_histogram if isinstance(pool, InstrumentedAsyncQueuePool) else None
+
+
+def _cache_stat(field: str):
+    def collect():
+        return [((stats["name"],), stats[field]) for stats in get_cache_stats()]
+    return collect
+
+
+registry.register(Gauge(
+    "websocket_connections", "Open WebSocket connections.", collect=_websocket_connections
+))
+registry.register(Gauge(
+    "websocket_connected_users", "Users with at least one open WebSocket.", collect=_websocket_users
+))
+for _field, _doc in (
+    ("size", "Configured connection pool size."),
+    ("checked_out", "Connections currently checked out of the pool."),
+    ("checked_in", "Idle connections in the pool."),
+    ("overflow", "Connections open beyond pool_size."),
+):
+    registry.register(Gauge(f"db_pool_{_field}", _doc, ("pool",), collect=_pool_gauge(_field)))
+registry.register(HistogramMetric(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection (primary).",
+    source=_pool_wait_histogram
+))
+registry.register(Counter(
+    "cache_hits_total", "In-process cache hits.", ("cache",), collect=_cache_stat("hits")
+))
+registry.register(Counter(
+    "cache_misses_total", "In-process cache misses.", ("cache",), collect=_cache_stat("misses")
+))
+registry.register(Gauge(
+    "cache_entries", "Entries held in each in-process cache.", ("cache",), collect=_cache_stat("size")
+))
+registry.register(Gauge(
+    "password_hash_queued", "bcrypt operations waiting for a worker.",
+    collect=lambda: [((), password_hasher.queued)]
+))
+registry.register(HistogramMetric(
+    "password_hash_queue_wait_seconds", "Time bcrypt operations waited for a worker.",
+    source=lambda: password_hasher.queue_wait
+))
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of request, WebSocket, pool and cache metrics."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
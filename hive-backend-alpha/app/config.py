@@ -6,11 +6,57 @@ import json
 class Settings(BaseSettings):
     # Database
     database_url: str
-    
+
+    # Database connection pool (ignored for SQLite)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds; -1 disables recycling
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100  # asyncpg prepared statement cache, 0 disables
+    db_pgbouncer_mode: bool = False  # transaction-pooling compatible (no named prepared statements)
+
+    # Read replica (optional). Reads fall back to the primary for this many
+    # seconds after a user's own write so they always see it.
+    database_read_url: Optional[str] = None
+    read_your_writes_window: float = 5.0
+
     # Security
     secret_key: str
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 30
+    refresh_token_expire_days: int = 30
+
+    # Authenticated user cache (set either value to 0 to disable)
+    user_cache_ttl: float = 60.0  # seconds
+    user_cache_max_size: int = 10000
+
+    # Decoded access token cache; entries never outlive the token's exp
+    token_cache_ttl: float = 300.0  # seconds
+    token_cache_max_size: int = 10000
+
+    # Skill-matched task recommendations, cached per user
+    recommendation_cache_ttl: float = 30.0  # seconds
+    recommendation_cache_max_size: int = 5000
+
+    # Per-project task dependency graphs
+    dependency_graph_cache_ttl: float = 300.0  # seconds
+    dependency_graph_cache_max_size: int = 1000
+
+    # Project summary (GET /projects/summary); writes through the API invalidate it
+    project_summary_cache_ttl: float = 60.0  # seconds
+
+    # In-process dashboard counters are re-seeded from the database this often
+    dashboard_counter_reconcile_interval: float = 60.0  # seconds
+
+    # Most delta frames per second sent to WebSocket dashboard subscribers
+    dashboard_feed_max_frames_per_second: float = 2.0
+
+    # How often the Celery beat job re-derives project task counters from tasks
+    project_counter_reconcile_interval: float = 3600.0  # seconds
+
+    # Max concurrent bcrypt operations (run off the event loop)
+    password_hash_workers: int = 4
     
     # CORS
     cors_origins: Union[str, List[str]] = ["http://localhost:3000", "http://localhost:8080"]
@@ -33,6 +79,12 @@ class Settings(BaseSettings):
     environment: str = "development"
     debug: bool = False
 
+    # Max items accepted by the bulk task endpoints in one request
+    bulk_max_items: int = 500
+
+    # Same statement shape repeated this often in one request is flagged as N+1
+    query_repeat_threshold: int = 5
+
     @property
     def jwt_secret_key(self) -> str:
         """JWT secret key derived from secret_key"""
@@ -1,15 +1,37 @@
-from typing import Optional
+import time
+from typing import Optional, Tuple
 from uuid import UUID
 from jose import JWTError, jwt
 from app.config import settings
+from app.core.cache import TTLCache
 
+# Validated access tokens -> user id. Each entry expires at the token's own
+# ``exp`` so a cached token is never accepted past its expiry.
+token_cache = TTLCache("access_tokens", max_size=settings.token_cache_max_size, ttl=settings.token_cache_ttl)
 
-def verify_access_token(token: str) -> Optional[UUID]:
+
+def decode_access_token(token: str) -> Optional[Tuple[UUID, Optional[float]]]:
+    """Fully validate a token, returning (user_id, exp timestamp) or None."""
     try:
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
         user_id: str = payload.get("sub")
         if user_id is None:
             return None
-        return UUID(user_id)
+        return UUID(user_id), payload.get("exp")
     except (JWTError, ValueError):
-        return None
\ No newline at end of file
+        return None
+
+
+def verify_access_token(token: str) -> Optional[UUID]:
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+
+    decoded = decode_access_token(token)
+    if decoded is None:
+        return None
+
+    user_id, expires_at = decoded
+    ttl = expires_at - time.time() if expires_at is not None else None
+    token_cache.set(token, user_id, ttl=ttl)
+    return user_id
@@ -0,0 +1,143 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from fastapi import Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import Headers
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over the given version parts."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def entity_etag(entity_id: UUID, updated_at: datetime, *parts: Any) -> str:
+    """ETag of one row; ``parts`` are columns that change without touching updated_at."""
+    return make_etag(entity_id, updated_at.isoformat(), *parts)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive timestamps; the database clock is UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified).astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def is_conditional(headers: Headers) -> bool:
+    """Whether the request carries a validator worth checking before loading the entity."""
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def is_not_modified(headers: Headers, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Whether the client's cached copy is current (RFC 9110 §13.1.2-3).
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    without it, at one-second resolution.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return _as_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
+
+
+async def entity_version(db: AsyncSession, model, entity_id: UUID) -> Optional[datetime]:
+    """updated_at of one row, without hydrating the entity; None if it doesn't exist."""
+    result = await db.execute(select(model.updated_at).where(model.id == entity_id))
+    return result.scalar_one_or_none()
+
+
+class ETagMiddleware:
+    """ASGI middleware adding body-hash ETags to JSON GET responses.
+
+    Endpoints that set their own ETag (from updated_at) are left alone. For
+    the rest, the body is hashed and a matching If-None-Match gets a 304,
+    which saves transfer but not the query; list endpoints rely on this.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        start_message = None
+        buffering = False
+        body = []
+
+        async def send_with_etag(message):
+            nonlocal start_message, buffering
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                buffering = (
+                    message["status"] == 200
+                    and "etag" not in headers
+                    and headers.get("content-type", "").startswith("application/json")
+                )
+                if buffering:
+                    start_message = message
+                else:
+                    await send(message)
+                return
+
+            if not buffering or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            content = b"".join(body)
+            etag = f'"{hashlib.sha1(content).hexdigest()}"'
+            if is_not_modified(request_headers, etag):
+                # Keep Cache-Control, Vary, CORS etc.; a 304 carries no body headers
+                headers = [
+                    (name, value) for name, value in start_message.get("headers", [])
+                    if name.lower() not in (b"content-length", b"content-type")
+                ]
+                headers.append((b"etag", etag.encode()))
+                await send({**start_message, "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            headers = list(start_message.get("headers", []))
+            headers.append((b"etag", etag.encode()))
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": content})
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,293 @@
+import re
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+DEFAULT_TASK_HOURS = 1.0
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def parse_hours(estimated_hours: Optional[str]) -> float:
+    """Duration used for the critical path: the largest number in "4-6 hours", else a default."""
+    numbers = [float(n) for n in _NUMBER.findall(estimated_hours or "")]
+    return max(numbers) if numbers else DEFAULT_TASK_HOURS
+
+
+def normalize_title(title: str) -> str:
+    return _WHITESPACE.sub(" ", title).strip().casefold()
+
+
+def as_task_id(value: str) -> Optional[UUID]:
+    try:
+        return UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class DependencyCycleError(ValueError):
+    def __init__(self, cycle: List[UUID]):
+        self.cycle = cycle
+        super().__init__("Dependencies would form a cycle: " + " -> ".join(str(task_id) for task_id in cycle))
+
+
+class DependencyGraph:
+    """Dependency graph of the tasks in one project.
+
+    ``prerequisites[t]`` holds the ids task ``t`` lists; only ids that are
+    tasks in the graph count as edges, so dangling or cross-project ids are
+    inert until (unless) a task with that id is added. Per-task counts of
+    unfinished prerequisites, and the ready/blocked sets, are maintained
+    incrementally, so blocked/unblocked queries cost O(degree). Topological
+    order and the critical path are computed on demand and cached until the
+    edges (or, for the critical path, durations and completion) change.
+
+    Not thread-safe; intended to be used from the event loop only.
+    """
+
+    def __init__(self):
+        self.titles: Dict[UUID, str] = {}
+        self.hours: Dict[UUID, float] = {}
+        self.completed: Set[UUID] = set()
+        self.prerequisites: Dict[UUID, Set[UUID]] = {}
+        self.dependents: Dict[UUID, Set[UUID]] = defaultdict(set)
+        self.open_prerequisites: Dict[UUID, int] = {}
+        self.ready: Set[UUID] = set()
+        self.blocked: Set[UUID] = set()
+        self._by_title: Dict[str, UUID] = {}
+        self._order: Optional[List[UUID]] = None
+        self._critical_path: Optional[Tuple[List[UUID], float]] = None
+
+    def __contains__(self, task_id: UUID) -> bool:
+        return task_id in self.titles
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    # -- building and incremental updates ---------------------------------
+
+    def upsert(
+        self,
+        task_id: UUID,
+        title: str,
+        prerequisites: Iterable[UUID],
+        hours: float = DEFAULT_TASK_HOURS,
+        completed: bool = False,
+        check_cycles: bool = True,
+    ) -> None:
+        """Add a task or bring an existing one up to date."""
+        if task_id not in self:
+            self._add_node(task_id)
+        self._set_title(task_id, title)
+        if self.hours.get(task_id) != hours:
+            self.hours[task_id] = hours
+            self._critical_path = None
+        self.set_prerequisites(task_id, prerequisites, check_cycles=check_cycles)
+        self.set_completed(task_id, completed)
+
+    def remove(self, task_id: UUID) -> None:
+        if task_id not in self:
+            return
+        self.set_prerequisites(task_id, (), check_cycles=False)
+        if task_id not in self.completed:
+            for dependent in self.dependents.get(task_id, ()):
+                if dependent in self:
+                    self._adjust_open(dependent, -1)
+        self._by_title.pop(normalize_title(self.titles[task_id]), None)
+        for index in (self.titles, self.hours, self.prerequisites, self.open_prerequisites):
+            index.pop(task_id, None)
+        self.completed.discard(task_id)
+        self.ready.discard(task_id)
+        self.blocked.discard(task_id)
+        self._invalidate()
+
+    def set_prerequisites(self, task_id: UUID, prerequisites: Iterable[UUID], check_cycles: bool = True) -> None:
+        """Replace a task's prerequisites; raises DependencyCycleError (leaving the graph as is)."""
+        new = set(prerequisites) - {task_id}
+        old = self.prerequisites[task_id]
+        if new == old:
+            return
+        if check_cycles:
+            self.check_prerequisites(task_id, new)
+
+        for prerequisite in old - new:
+            self.dependents[prerequisite].discard(task_id)
+            if not self.dependents[prerequisite]:
+                del self.dependents[prerequisite]
+            if prerequisite in self and prerequisite not in self.completed:
+                self._adjust_open(task_id, -1)
+        for prerequisite in new - old:
+            self.dependents[prerequisite].add(task_id)
+            if prerequisite in self and prerequisite not in self.completed:
+                self._adjust_open(task_id, 1)
+        self.prerequisites[task_id] = new
+        self._invalidate()
+
+    def set_completed(self, task_id: UUID, completed: bool) -> None:
+        if (task_id in self.completed) == completed:
+            return
+        if completed:
+            self.completed.add(task_id)
+            self.ready.discard(task_id)
+            self.blocked.discard(task_id)
+        else:
+            self.completed.discard(task_id)
+            self._classify(task_id)
+        delta = -1 if completed else 1
+        for dependent in self.dependents.get(task_id, ()):
+            if dependent in self:
+                self._adjust_open(dependent, delta)
+        self._critical_path = None
+
+    def check_prerequisites(self, task_id: UUID, prerequisites: Iterable[UUID]) -> None:
+        """Raise DependencyCycleError if ``task_id`` depending on ``prerequisites`` would close a loop."""
+        targets = {p for p in prerequisites if p in self} - self.prerequisites.get(task_id, set())
+        if task_id in set(prerequisites):
+            raise DependencyCycleError([task_id, task_id])
+        if not targets or task_id not in self:
+            return
+
+        # A new edge task -> p closes a loop iff task is already upstream of p
+        parents: Dict[UUID, UUID] = {task_id: task_id}
+        queue = deque([task_id])
+        while queue:
+            current = queue.popleft()
+            for dependent in self.dependents.get(current, ()):
+                if dependent not in self or dependent in parents:
+                    continue
+                parents[dependent] = current
+                if dependent in targets:
+                    path = [dependent]
+                    while path[-1] != task_id:
+                        path.append(parents[path[-1]])
+                    raise DependencyCycleError([task_id] + path)
+                queue.append(dependent)
+
+    # -- queries -------------------------------------------------------------
+
+    def blocked_by(self, task_id: UUID) -> List[UUID]:
+        """Unfinished prerequisites of a task."""
+        return [p for p in self.prerequisites.get(task_id, ()) if p in self and p not in self.completed]
+
+    def blocks(self, task_id: UUID) -> List[UUID]:
+        """Tasks that list this one as a prerequisite."""
+        return [d for d in self.dependents.get(task_id, ()) if d in self]
+
+    def unblocks(self, task_id: UUID) -> List[UUID]:
+        """Tasks that would become ready if this one were completed now."""
+        if task_id not in self or task_id in self.completed:
+            return []
+        return [
+            d for d in self.dependents.get(task_id, ())
+            if d in self and d not in self.completed and self.open_prerequisites[d] == 1
+        ]
+
+    def resolve(self, dependencies: Iterable[str], task_id: Optional[UUID] = None) -> List[str]:
+        """Rewrite free-text dependencies that name a task in this graph to that task's id.
+
+        Ids and text that matches nothing are kept as they are.
+        """
+        resolved = []
+        for dependency in dependencies:
+            match = None if as_task_id(dependency) else self._by_title.get(normalize_title(dependency))
+            value = str(match) if match is not None and match != task_id else dependency
+            if value not in resolved:
+                resolved.append(value)
+        return resolved
+
+    def topological_order(self) -> List[UUID]:
+        """Tasks with every prerequisite before its dependents; raises DependencyCycleError."""
+        if self._order is None:
+            remaining = {task_id: self._edge_count(task_id) for task_id in self.titles}
+            queue = deque(task_id for task_id, count in remaining.items() if count == 0)
+            order = []
+            while queue:
+                current = queue.popleft()
+                order.append(current)
+                for dependent in self.blocks(current):
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        queue.append(dependent)
+            if len(order) < len(self.titles):
+                raise DependencyCycleError(self._find_cycle(set(self.titles) - set(order)))
+            self._order = order
+        return self._order
+
+    def critical_path(self) -> Tuple[List[UUID], float]:
+        """Longest chain of remaining work (completed tasks count as zero hours) and its length."""
+        if self._critical_path is None:
+            finish: Dict[UUID, float] = {}
+            previous: Dict[UUID, Optional[UUID]] = {}
+            for task_id in self.topological_order():
+                start, before = 0.0, None
+                for prerequisite in self.prerequisites[task_id]:
+                    if prerequisite in finish and finish[prerequisite] > start:
+                        start, before = finish[prerequisite], prerequisite
+                duration = 0.0 if task_id in self.completed else self.hours[task_id]
+                finish[task_id] = start + duration
+                previous[task_id] = before
+
+            path, length = [], 0.0
+            if finish:
+                end = max(finish, key=finish.get)
+                length = finish[end]
+                while end is not None:
+                    path.append(end)
+                    end = previous[end]
+                path.reverse()
+            self._critical_path = (path, length)
+        return self._critical_path
+
+    # -- internals -------------------------------------------------------------
+
+    def _add_node(self, task_id: UUID) -> None:
+        self.titles[task_id] = ""
+        self.hours[task_id] = DEFAULT_TASK_HOURS
+        self.prerequisites[task_id] = set()
+        self.open_prerequisites[task_id] = 0
+        self.ready.add(task_id)
+        # Tasks that already listed this id now have a live (unfinished) prerequisite
+        for dependent in self.dependents.get(task_id, ()):
+            if dependent in self:
+                self._adjust_open(dependent, 1)
+        self._invalidate()
+
+    def _set_title(self, task_id: UUID, title: str) -> None:
+        old = self.titles[task_id]
+        if old and self._by_title.get(normalize_title(old)) == task_id:
+            del self._by_title[normalize_title(old)]
+        self.titles[task_id] = title
+        self._by_title.setdefault(normalize_title(title), task_id)
+
+    def _edge_count(self, task_id: UUID) -> int:
+        return sum(1 for p in self.prerequisites[task_id] if p in self)
+
+    def _adjust_open(self, task_id: UUID, delta: int) -> None:
+        self.open_prerequisites[task_id] += delta
+        if task_id not in self.completed:
+            self._classify(task_id)
+
+    def _classify(self, task_id: UUID) -> None:
+        if self.open_prerequisites[task_id] > 0:
+            self.ready.discard(task_id)
+            self.blocked.add(task_id)
+        else:
+            self.blocked.discard(task_id)
+            self.ready.add(task_id)
+
+    def _invalidate(self) -> None:
+        self._order = None
+        self._critical_path = None
+
+    def _find_cycle(self, candidates: Set[UUID]) -> List[UUID]:
+        # Every node Kahn's algorithm couldn't place is on or downstream of a cycle;
+        # walking prerequisites inside that set must revisit a node
+        current = next(iter(candidates))
+        seen: Dict[UUID, int] = {}
+        path: List[UUID] = []
+        while current not in seen:
+            seen[current] = len(path)
+            path.append(current)
+            current = next(p for p in self.prerequisites[current] if p in candidates)
+        return path[seen[current]:] + [current]
@@ -0,0 +1,34 @@
+from typing import Any, Iterable, List, Optional, Sequence
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import load_only
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[List[str]]:
+    """Parse a comma-separated ``fields`` parameter.
+
+    Returns None when every field is wanted. ``id`` is always included.
+    Raises ValueError naming any field not in ``allowed``.
+    """
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(["id", *requested]))
+
+
+def load_only_columns(model, fields: Iterable[str]):
+    """Loader option that SELECTs only the given mapped columns of ``model``."""
+    columns = model.__table__.columns
+    return load_only(*[getattr(model, field) for field in fields if field in columns])
+
+
+def pick_fields(rows: Iterable[Any], fields: Sequence[str]) -> List[dict]:
+    """JSON-ready dicts holding only ``fields`` from ORM objects or dicts."""
+    picked = [
+        {field: row[field] if isinstance(row, dict) else getattr(row, field) for field in fields}
+        for row in rows
+    ]
+    return jsonable_encoder(picked)
@@ -0,0 +1,280 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Default latency buckets in seconds (1ms .. 10s)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram with cumulative bucket counts."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Dict:
+        """Return cumulative bucket counts keyed by upper bound, plus count and sum."""
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = total_count
+
+        return {
+            "buckets": cumulative,
+            "count": total_count,
+            "sum": total_sum,
+        }
+
+
+# Response size buckets in bytes (100B .. 10MB)
+DEFAULT_SIZE_BUCKETS: Tuple[float, ...] = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """A named metric family in Prometheus text exposition format."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonic counter, or one read from an existing source by ``collect`` at scrape time."""
+
+    type_name = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], List[Tuple[LabelValues, float]]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _render_samples(self) -> List[str]:
+        if self._collect is not None:
+            items = self._collect()
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(Counter):
+    """Gauge set directly, or computed at scrape time by ``collect``.
+
+    ``collect`` returns a list of (label values tuple, value) pairs.
+    """
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class HistogramMetric(Metric):
+    """Labelled family of histograms, or a single externally owned ``Histogram``."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        source: Optional[Callable[[], Optional[Histogram]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[LabelValues, Histogram] = {}
+        self._source = source
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def _render_samples(self) -> List[str]:
+        if self._source is not None:
+            histogram = self._source()
+            items = [((), histogram)] if histogram is not None else []
+        else:
+            with self._lock:
+                items = list(self._histograms.items())
+
+        lines = []
+        for key, histogram in items:
+            snapshot = histogram.snapshot()
+            for bound, count in snapshot["buckets"].items():
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {count}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(snapshot['sum'])}")
+            lines.append(f"{self.name}_count{labels} {snapshot['count']}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total", "Total HTTP requests.", ("method", "route", "status")
+))
+http_request_duration_seconds = registry.register(HistogramMetric(
+    "http_request_duration_seconds", "HTTP request latency in seconds.", ("method", "route")
+))
+http_response_size_bytes = registry.register(HistogramMetric(
+    "http_response_size_bytes", "HTTP response body size in bytes.", ("method", "route"),
+    buckets=DEFAULT_SIZE_BUCKETS
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ("method",)
+))
+
+
+def route_template(scope) -> str:
+    """Full path template of the matched route, e.g. /api/v1/tasks/{task_id}.
+
+    ``scope["route"].path`` may be relative to the router it was declared on,
+    so the mount prefix is taken from the part of the request path in front
+    of what the route's own pattern matched.
+    """
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if not path:
+        return "unmatched"
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is not None:
+        match = re.search(path_regex.pattern.removeprefix("^"), scope["path"])
+        if match is not None:
+            return scope["path"][:match.start()] + path
+    return path
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route request counts, latency, size and in-flight gauges.
+
+    Routes are labelled by their path template (e.g. /api/v1/tasks/{task_id})
+    to keep label cardinality bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_with_metrics(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        http_requests_in_flight.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            duration = time.perf_counter() - start
+            http_requests_in_flight.dec(method=method)
+            route_path = route_template(scope)
+            http_requests_total.inc(method=method, route=route_path, status=str(status_code))
+            http_request_duration_seconds.observe(duration, method=method, route=route_path)
+            http_response_size_bytes.observe(response_size, method=method, route=route_path)
@@ -0,0 +1,53 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+# Keyset position: (updated_at, id) of the last row on the previous page
+CursorKey = Tuple[datetime, UUID]
+
+
+# Search position: (relevance score, id) of the last hit on the previous page
+ScoreCursorKey = Tuple[float, UUID]
+
+
+def _encode(payload: dict) -> str:
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> dict:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
+
+
+def encode_cursor(updated_at: datetime, row_id: UUID) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor."""
+    return _encode({"u": updated_at.isoformat(), "i": str(row_id)})
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """Decode a cursor from encode_cursor; raises ValueError if it is malformed."""
+    try:
+        payload = _decode(cursor)
+        return datetime.fromisoformat(payload["u"]), UUID(payload["i"])
+    except (TypeError, KeyError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_score_cursor(score: float, row_id: UUID) -> str:
+    """Encode a ranked search position as an opaque cursor."""
+    return _encode({"s": score, "i": str(row_id)})
+
+
+def decode_score_cursor(cursor: str) -> ScoreCursorKey:
+    """Decode a cursor from encode_score_cursor; raises ValueError if it is malformed."""
+    try:
+        payload = _decode(cursor)
+        return float(payload["s"]), UUID(payload["i"])
+    except (TypeError, KeyError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
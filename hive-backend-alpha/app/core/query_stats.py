@@ -0,0 +1,112 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)\s*,?)+\)")
+_NUMBER = re.compile(r"\b\d+\b")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize SQL so the same query with different parameters compares equal."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _NUMBER.sub("N", shape)
+
+
+class QueryStats:
+    """Counts and times the SQL statements executed in one scope (usually a request)."""
+
+    def __init__(self, parent: Optional["QueryStats"] = None):
+        self.parent = parent
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.shapes[statement_shape(statement)] += 1
+        if self.parent is not None:
+            self.parent.record(statement, duration)
+
+    def suspected_n_plus_one(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Statement shapes repeated at least ``threshold`` times."""
+        threshold = threshold or settings.query_repeat_threshold
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect query stats for everything executed inside the block."""
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    started = conn.info.get("query_start_time")
+    duration = time.perf_counter() - started.pop() if started else 0.0
+    stats.record(statement, duration)
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    """Attach query counting to an engine (pass ``async_engine.sync_engine``)."""
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware that scopes query stats to each HTTP request.
+
+    In debug mode the totals are returned as X-DB-Queries / X-DB-Time (ms)
+    headers, and repeated statement shapes are reported as suspected N+1.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_stats(message):
+                if message["type"] == "http.response.start" and settings.debug:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-queries", str(stats.count).encode()))
+                    headers.append((b"x-db-time", f"{stats.total_time * 1000:.2f}".encode()))
+                    suspects = stats.suspected_n_plus_one()
+                    if suspects:
+                        headers.append((b"x-db-suspected-n-plus-one", str(len(suspects)).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+            if settings.debug:
+                for shape, count in stats.suspected_n_plus_one():
+                    print(f"Suspected N+1 in {scope['method']} {scope['path']}: {count}x {shape[:200]}")
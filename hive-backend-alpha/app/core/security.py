@@ -1,8 +1,13 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from app.config import settings
+from app.core.metrics import Histogram
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -15,13 +20,73 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHasher:
+    """Runs bcrypt hashing and verification on a bounded thread pool.
+
+    bcrypt deliberately burns tens of milliseconds of CPU per call; running it
+    inline in an async handler stalls every other request and WebSocket on the
+    event loop. At most ``max_workers`` hashes run at once, further calls queue.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.queue_wait = Histogram()
+        self.duration = Histogram()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, password, hashed_password)
+
+    async def _run(self, func: Callable, *args):
+        submitted = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+
+        def work():
+            started = time.perf_counter()
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            self.queue_wait.observe(started - submitted)
+            try:
+                return func(*args)
+            finally:
+                self.duration.observe(time.perf_counter() - started)
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, work)
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = {"queued": self.queued, "running": self.running, "completed": self.completed}
+        return {
+            "max_workers": self.max_workers,
+            **counts,
+            "queue_wait_seconds": self.queue_wait.snapshot(),
+            "duration_seconds": self.duration.snapshot(),
+        }
+
+
+password_hasher = PasswordHasher(max_workers=settings.password_hash_workers)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
-    
+
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
-    return encoded_jwt
\ No newline at end of file
+    return encoded_jwt
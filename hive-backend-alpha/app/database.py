@@ -1,13 +1,88 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy import MetaData
 
 from app.config import settings
+from app.core.metrics import Histogram
+from app.core.query_stats import instrument_engine
+
+# Pool checkout wait buckets in seconds
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = Histogram(POOL_WAIT_BUCKETS)
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_histogram.observe(time.perf_counter() - start)
+
+
+def _engine_options(database_url: str) -> dict:
+    """Build create_async_engine keyword arguments from settings."""
+    options = {"echo": settings.debug}
+    if database_url.startswith("sqlite"):
+        # SQLite uses its own pooling; sizing options do not apply
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+
+    if "+asyncpg" in database_url:
+        if settings.db_pgbouncer_mode:
+            # PgBouncer in transaction mode cannot keep named prepared statements
+            # across transactions, so disable both caches and use unique names
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        else:
+            options["connect_args"] = {
+                "statement_cache_size": settings.db_statement_cache_size,
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+            }
+
+    return options
+
 
 # Create async engine
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+engine = create_async_engine(settings.database_url, **_engine_options(settings.database_url))
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Optional read replica; None when DATABASE_READ_URL is not configured
+read_engine = (
+    create_async_engine(settings.database_read_url, **_engine_options(settings.database_read_url))
+    if settings.database_read_url else None
+)
+read_async_session = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None else None
+)
+
+instrument_engine(engine.sync_engine)
+if read_engine is not None:
+    instrument_engine(read_engine.sync_engine)
+
 # Base with consistent naming convention
 metadata = MetaData(naming_convention={
     "ix": "ix_%(column_0_label)s",
@@ -28,7 +103,105 @@ async def get_db():
             await session.close()
 
 
+@asynccontextmanager
+async def unit_of_work(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Group service writes on ``db`` into a single transaction.
+
+    Services that call commit_or_flush() only flush while a unit of work is
+    open; the outermost block commits once on success (then runs any
+    after_commit callbacks) and rolls back on error. Blocks may be nested.
+    """
+    depth = db.info.get("uow_depth", 0)
+    db.info["uow_depth"] = depth + 1
+    if depth == 0:
+        db.info["uow_after_commit"] = []
+    try:
+        yield db
+    except BaseException:
+        if depth == 0:
+            db.info.pop("uow_after_commit", None)
+            await db.rollback()
+        raise
+    finally:
+        db.info["uow_depth"] = depth
+        if depth == 0:
+            db.info.pop("uow_cache", None)
+
+    if depth == 0:
+        await db.commit()
+        for callback in db.info.pop("uow_after_commit", []):
+            await callback()
+
+
+def in_unit_of_work(db: AsyncSession) -> bool:
+    return db.info.get("uow_depth", 0) > 0
+
+
+def uow_cache(db: AsyncSession) -> dict:
+    """Scratch space that is dropped when the outermost unit of work ends, on commit or rollback."""
+    return db.info.setdefault("uow_cache", {})
+
+
+async def commit_or_flush(db: AsyncSession) -> None:
+    """Commit, or just flush when the caller has opened a unit of work."""
+    if in_unit_of_work(db):
+        await db.flush()
+    else:
+        await db.commit()
+
+
+async def after_commit(db: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run ``callback`` now, or once the enclosing unit of work has committed."""
+    if in_unit_of_work(db):
+        db.info["uow_after_commit"].append(callback)
+    else:
+        await callback()
+
+
+class RecentWriters:
+    """Tracks when each user last wrote so their reads can stick to the primary."""
+
+    def __init__(self, window: float):
+        self.window = window
+        self._last_write: Dict[UUID, float] = {}
+
+    def mark(self, user_id: UUID) -> None:
+        now = time.monotonic()
+        self._last_write[user_id] = now
+        # Opportunistically drop expired entries so the map stays small
+        if len(self._last_write) > 1024:
+            cutoff = now - self.window
+            self._last_write = {uid: ts for uid, ts in self._last_write.items() if ts >= cutoff}
+
+    def wrote_recently(self, user_id: UUID) -> bool:
+        last = self._last_write.get(user_id)
+        return last is not None and time.monotonic() - last < self.window
+
+
+recent_writers = RecentWriters(settings.read_your_writes_window)
+
+
+def get_pool_status(async_engine: AsyncEngine = engine) -> dict:
+    """Live connection pool statistics for diagnostics."""
+    pool = async_engine.pool
+    stats = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats["checkout_wait_seconds"] = pool.wait_histogram.snapshot()
+
+    return stats
+
+
 # For Alembic migrations
 def get_database_url() -> str:
     """Get database URL for Alembic."""
-    return settings.database_url
\ No newline at end of file
+    return settings.database_url
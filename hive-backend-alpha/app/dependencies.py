@@ -1,15 +1,31 @@
-from fastapi import Depends, HTTPException, status
+from typing import Iterable, List, Optional, TypeVar
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app import database
+from app.database import get_db, recent_writers
 from app.core.auth import verify_access_token
+from app.core.fieldsets import parse_fields
+from app.models.file import TaskFile
+from app.models.milestone import Milestone
+from app.models.task import Task
+from app.models.user import User
 from app.services import user_service
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+TaskScoped = TypeVar("TaskScoped")
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
@@ -18,16 +34,108 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
     try:
         user_id = verify_access_token(credentials.credentials)
         if user_id is None:
             raise credentials_exception
     except Exception:
         raise credentials_exception
-    
-    user = await user_service.get_user_by_id(db, user_id)
+
+    user = await user_service.get_cached_user_by_id(db, user_id)
     if user is None:
         raise credentials_exception
-    
-    return user
\ No newline at end of file
+
+    # Pin this user's reads to the primary for a while after a write
+    if request.method not in SAFE_METHODS:
+        recent_writers.mark(user.id)
+
+    return user
+
+
+async def get_read_db(
+    primary: AsyncSession = Depends(get_db),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    """Session for read-only endpoints.
+
+    Uses the read replica when one is configured, except for users who wrote
+    within the read-your-writes window; those stay on the primary.
+    """
+    if database.read_async_session is None:
+        yield primary
+        return
+
+    if credentials is not None:
+        user_id = verify_access_token(credentials.credentials)
+        if user_id is not None and recent_writers.wrote_recently(user_id):
+            yield primary
+            return
+
+    async with database.read_async_session() as session:
+        yield session
+
+
+def sparse_fields(allowed: Iterable[str]):
+    """Dependency parsing a ``fields=a,b,c`` query parameter against ``allowed``.
+
+    Resolves to None when the parameter is absent, otherwise to the list of
+    requested fields (always including ``id``); unknown fields are a 400.
+    """
+    allowed = frozenset(allowed)
+
+    def dependency(
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return")
+    ) -> Optional[List[str]]:
+        try:
+            return parse_fields(fields, allowed)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+    return dependency
+
+
+async def fetch_task_scoped(
+    db: AsyncSession, model: type[TaskScoped], entity_id: UUID, user: User, name: str
+) -> TaskScoped:
+    """Load a row that belongs to a task and check the user owns or is assigned that task.
+
+    The row and its task's owner_id/assignee_id come back from one joined
+    query, so callers can hand the loaded entity straight to the service.
+    """
+    result = await db.execute(
+        select(model, Task.owner_id, Task.assignee_id)
+        .outerjoin(Task, Task.id == model.task_id)
+        .where(model.id == entity_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{name.capitalize()} not found"
+        )
+    if user.id not in (row.owner_id, row.assignee_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to access this {name}"
+        )
+    return row[0]
+
+
+async def get_authorized_milestone(
+    milestone_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Milestone:
+    return await fetch_task_scoped(db, Milestone, milestone_id, current_user, "milestone")
+
+
+async def get_authorized_file(
+    file_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> TaskFile:
+    return await fetch_task_scoped(db, TaskFile, file_id, current_user, "file")
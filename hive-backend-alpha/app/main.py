@@ -1,9 +1,15 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.api.health import router as health_router
+from app.api.metrics import router as metrics_router
 from app.api.api_v1.api import api_router
+from app.config import settings
+from app.core.conditional import ETagMiddleware
+from app.core.metrics import MetricsMiddleware
+from app.core.query_stats import QueryStatsMiddleware
 
 
 @asynccontextmanager
@@ -21,10 +27,21 @@ async def lifespan(app: FastAPI):
         print(f"Celery connection failed: {e}")
         print("Continuing without Celery (some features may be limited)")
     
+    # Seed the dashboard counters; if this fails the first dashboard read seeds them
+    from app.services import dashboard_service
+    try:
+        await dashboard_service.seed_counters_from_database()
+    except Exception as e:
+        print(f"Failed to seed dashboard counters: {e}")
+    reconcile_task = asyncio.create_task(
+        dashboard_service.reconcile_counters_periodically(settings.dashboard_counter_reconcile_interval)
+    )
+    
     yield
     
     # Shutdown
     print("Shutting down HIVE Backend Alpha...")
+    reconcile_task.cancel()
 
 
 app = FastAPI(
@@ -47,8 +64,18 @@ app.add_middleware(
     max_age=3600,
 )
 
+# ETag / 304 handling for JSON GET responses without their own validators
+app.add_middleware(ETagMiddleware)
+
+# Per-request SQL query counting (headers and N+1 warnings in debug mode)
+app.add_middleware(QueryStatsMiddleware)
+
+# Per-route request metrics served from /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(api_router, prefix="/api/v1")
 
 
@@ -7,5 +7,7 @@ from .file import TaskFile
 from .user_task_association import UserTaskAssociation
 from .comment import Comment
 from .chat_message import ChatMessage, MessageType
+from .refresh_token import RefreshToken
+from . import search  # registers full-text search DDL on tasks/projects
 
-__all__ = ["BaseModel", "Base", "User", "Project", "Task", "Milestone", "TaskFile", "UserTaskAssociation", "Comment", "ChatMessage", "MessageType"]
\ No newline at end of file
+__all__ = ["BaseModel", "Base", "User", "Project", "Task", "Milestone", "TaskFile", "UserTaskAssociation", "Comment", "ChatMessage", "MessageType", "RefreshToken"]
\ No newline at end of file
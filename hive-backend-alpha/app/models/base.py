@@ -7,7 +7,11 @@ from app.database import Base
 
 class BaseModel(Base):
     __abstract__ = True
+
+    # Fetch server-generated values (created_at/updated_at) with RETURNING in the
+    # INSERT/UPDATE itself, so services don't need a refresh() round trip after commit.
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, Boolean, Integer, ForeignKey, Index
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Float, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -41,6 +41,18 @@ class Project(BaseModel):
     # Definition of Done
     definition_of_done = Column(JSONB, nullable=True)  # List of DoD items
     
+    # Task counters, maintained by task writes (project_service.record_task_changes)
+    # and corrected by the reconcile job; the project list reads these instead of
+    # aggregating tasks
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    draft_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    available_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    in_progress_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    task_impact_points = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_impact_points = Column(Integer, nullable=False, default=0, server_default="0")
+    progress = Column(Float, nullable=False, default=0.0, server_default="0")  # completed_impact_points / task_impact_points
+    
     # Timestamps
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -58,6 +70,7 @@ class Project(BaseModel):
         Index('idx_project_priority', 'priority'),
         Index('idx_project_owner_id', 'owner_id'),
         Index('idx_project_assignee_id', 'assignee_id'),
+        Index('idx_project_updated_at', 'updated_at'),
         Index('idx_project_due_date', 'due_date'),
         Index('idx_project_required_skills', 'required_skills', postgresql_using='gin'),
     )
\ No newline at end of file
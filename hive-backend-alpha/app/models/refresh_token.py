@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from .base import BaseModel
+
+
+class RefreshToken(BaseModel):
+    __tablename__ = "refresh_tokens"
+    
+    token_hash = Column(String(64), unique=True, nullable=False)  # SHA-256 hex of the token
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    family_id = Column(UUID(as_uuid=True), nullable=False)  # All tokens from one login share a family
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        Index('idx_refresh_token_user_id', 'user_id'),
+        Index('idx_refresh_token_family_id', 'family_id'),
+    )
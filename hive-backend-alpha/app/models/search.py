@@ -0,0 +1,73 @@
+"""Full-text search DDL for tasks and projects.
+
+On PostgreSQL each table gets a generated, weighted ``search_vector``
+tsvector column with a GIN index. On SQLite (tests, local runs) an FTS5
+table keyed by the row id mirrors the same columns via triggers. Neither is
+mapped on the models; app/services/search_service.py queries them.
+The DDL runs when the tables are created; existing PostgreSQL databases
+get it from the add_full_text_search migration.
+"""
+from sqlalchemy import DDL, event
+
+from .project import Project
+from .task import Task
+
+SEARCH_LANGUAGE = "english"
+
+# Searchable columns per table, most important first (weights A-D on PostgreSQL)
+SEARCH_COLUMNS = {
+    "tasks": ("title", "category", "description", "definition_of_done"),
+    "projects": ("title", "category", "description", "definition_of_done"),
+}
+
+# Columns that are JSONB on PostgreSQL and need a text cast
+_JSON_COLUMNS = {("projects", "definition_of_done")}
+
+_INDEX_NAMES = {"tasks": "idx_task_search_vector", "projects": "idx_project_search_vector"}
+
+
+def search_vector_expression(table: str) -> str:
+    parts = []
+    for weight, column in zip("ABCD", SEARCH_COLUMNS[table]):
+        value = f"{column}::text" if (table, column) in _JSON_COLUMNS else column
+        parts.append(f"setweight(to_tsvector('{SEARCH_LANGUAGE}', coalesce({value}, '')), '{weight}')")
+    return " || ".join(parts)
+
+
+def postgresql_search_ddl(table: str) -> list:
+    return [
+        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({search_vector_expression(table)}) STORED",
+        f"CREATE INDEX IF NOT EXISTS {_INDEX_NAMES[table]} ON {table} USING gin (search_vector)",
+    ]
+
+
+def sqlite_search_ddl(table: str) -> list:
+    # The FTS table keeps its own copy of the text, keyed by the row's id:
+    # VACUUM may renumber the implicit rowid of the UUID-keyed tables, so an
+    # external-content table tied to it could point at the wrong rows
+    columns = SEARCH_COLUMNS[table]
+    fts = f"{table}_fts"
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    assignments = ", ".join(f"{column} = new.{column}" for column in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(id UNINDEXED, {column_list})",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_fts_insert AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(id, {column_list}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_fts_delete AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE id = old.id; END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_fts_update AFTER UPDATE OF {column_list} ON {table} BEGIN "
+        f"UPDATE {fts} SET {assignments} WHERE id = old.id; END",
+    ]
+
+
+for _model in (Task, Project):
+    _table = _model.__table__
+    for _statement in postgresql_search_ddl(_table.name):
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+    for _statement in sqlite_search_ddl(_table.name):
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    event.listen(
+        _table, "before_drop", DDL(f"DROP TABLE IF EXISTS {_table.name}_fts").execute_if(dialect="sqlite")
+    )
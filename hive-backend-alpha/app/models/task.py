@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Integer, Index
+from sqlalchemy import Column, String, Text, ForeignKey, Float, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from .base import BaseModel
@@ -26,6 +26,11 @@ class Task(BaseModel):
     assignee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=True)  # Tasks can belong to projects
     
+    # Milestone rollup, maintained by milestone_service on milestone writes
+    milestone_count = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_milestones = Column(Integer, nullable=False, default=0, server_default="0")
+    progress = Column(Float, nullable=False, default=0.0, server_default="0")  # completed_milestones / milestone_count
+    
     # Relationships
     owner = relationship("User", foreign_keys=[owner_id], backref="owned_tasks")
     assignee = relationship("User", foreign_keys=[assignee_id], backref="assigned_tasks")
@@ -41,4 +46,5 @@ class Task(BaseModel):
         Index('idx_task_assignee_id', 'assignee_id'),
         Index('idx_task_project_id', 'project_id'),
         Index('idx_task_required_skills', 'required_skills', postgresql_using='gin'),
+        Index('idx_task_updated_at_id', 'updated_at', 'id'),
     )
\ No newline at end of file
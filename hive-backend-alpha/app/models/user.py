@@ -1,11 +1,9 @@
 from sqlalchemy import Column, String, Boolean, Integer, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from passlib.context import CryptContext
+from app.core.security import pwd_context
 from .base import BaseModel
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class User(BaseModel):
     __tablename__ = "users"
@@ -23,6 +21,8 @@ class User(BaseModel):
     owned_projects = relationship("Project", foreign_keys="Project.owner_id", back_populates="owner")
     assigned_projects = relationship("Project", foreign_keys="Project.assignee_id", back_populates="assignee")
     
+    # Synchronous helpers for scripts and fixtures; request handlers should use
+    # app.core.security.password_hasher so bcrypt runs off the event loop.
     def set_password(self, password: str):
         self.hashed_password = pwd_context.hash(password)
     
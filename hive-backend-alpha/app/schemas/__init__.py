@@ -1,9 +1,17 @@
 from .user import UserCreate, UserLogin, UserResponse, UserUpdate
-from .auth import TokenResponse
-from .task import TaskCreate, TaskUpdate, TaskResponse, TaskAssign, TaskStatusUpdate
+from .auth import TokenResponse, RefreshTokenRequest
+from .task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskAssign, TaskStatusUpdate, TaskPage, TaskFilter,
+    TaskBulkRequest, TaskBulkUpdateItem, TaskBulkItemResult, TaskBulkResponse,
+    TaskSearchHit, TaskSearchPage, TaskRecommendation, TaskRecommendationPage,
+    TaskDependencies
+)
 
 __all__ = [
     "UserCreate", "UserLogin", "UserResponse", "UserUpdate",
-    "TokenResponse",
-    "TaskCreate", "TaskUpdate", "TaskResponse", "TaskAssign", "TaskStatusUpdate"
+    "TokenResponse", "RefreshTokenRequest",
+    "TaskCreate", "TaskUpdate", "TaskResponse", "TaskAssign", "TaskStatusUpdate", "TaskPage", "TaskFilter",
+    "TaskBulkRequest", "TaskBulkUpdateItem", "TaskBulkItemResult", "TaskBulkResponse",
+    "TaskSearchHit", "TaskSearchPage", "TaskRecommendation", "TaskRecommendationPage",
+    "TaskDependencies"
 ]
\ No newline at end of file
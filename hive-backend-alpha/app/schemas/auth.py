@@ -1,6 +1,12 @@
+from typing import Optional
 from pydantic import BaseModel
 
 
 class TokenResponse(BaseModel):
     access_token: str
-    token_type: str = "bearer"
\ No newline at end of file
+    token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
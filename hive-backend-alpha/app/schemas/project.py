@@ -55,6 +55,7 @@ class ProjectResponse(ProjectBase):
     completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+    progress: float = 0.0  # share of task impact points in completed tasks
     
     class Config:
         from_attributes = True
@@ -62,14 +63,40 @@ class ProjectResponse(ProjectBase):
 
 class ProjectWithTasks(ProjectResponse):
     task_count: int = 0
+    draft_tasks: int = 0
+    available_tasks: int = 0
+    in_progress_tasks: int = 0
     completed_tasks: int = 0
+    task_impact_points: int = 0
+    completed_impact_points: int = 0
     
     class Config:
         from_attributes = True
 
 
+class ProjectSearchHit(ProjectResponse):
+    score: float
+    highlight: Optional[str] = None  # title with matches wrapped in <mark>
+    snippet: Optional[str] = None  # description excerpt around the matches
+
+
+class ProjectSearchPage(BaseModel):
+    items: List[ProjectSearchHit]
+    next_cursor: Optional[str] = None
+
+
+class ProjectDependencyGraph(BaseModel):
+    project_id: UUID
+    order: List[UUID]  # topological: prerequisites before their dependents
+    critical_path: List[UUID]
+    critical_path_hours: float  # remaining estimated hours along the critical path
+    ready: List[UUID]  # open tasks whose prerequisites are all completed
+    blocked: List[UUID]
+
+
 class ProjectSummary(BaseModel):
     total_projects: int
     by_status: dict
     by_priority: dict
-    recent_activity: List[dict]
\ No newline at end of file
+    recent_activity: List[dict]
+    cache_age: float = 0.0  # seconds since these figures were computed
\ No newline at end of file
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel
-from typing import Optional, List, Union, TYPE_CHECKING
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional, List, Literal, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .milestone import MilestoneResponse
@@ -43,6 +43,17 @@ class TaskUpdate(BaseModel):
     deliverables: Optional[List[str]] = None
 
 
+class TaskFilter(BaseModel):
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    category: Optional[str] = None
+    owner_id: Optional[UUID] = None
+    assignee_id: Optional[UUID] = None
+    project_id: Optional[UUID] = None
+    skills: Optional[List[str]] = None
+    skills_match: Literal["all", "any"] = "all"
+
+
 class TaskAssign(BaseModel):
     user_id: UUID
 
@@ -70,8 +81,67 @@ class TaskResponse(BaseModel):
     deliverables: Optional[List[str]] = None
     owner_id: UUID
     assignee_id: Optional[UUID]
+    milestone_count: int = 0
+    completed_milestones: int = 0
+    progress: float = 0.0  # completed_milestones / milestone_count
     created_at: datetime
     updated_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class TaskPage(BaseModel):
+    items: List[TaskResponse]
+    next_cursor: Optional[str] = None
+
+
+class TaskSearchHit(TaskResponse):
+    score: float
+    highlight: Optional[str] = None  # title with matches wrapped in <mark>
+    snippet: Optional[str] = None  # description excerpt around the matches
+
+
+class TaskSearchPage(BaseModel):
+    items: List[TaskSearchHit]
+    next_cursor: Optional[str] = None
+
+
+class TaskRecommendation(TaskResponse):
+    score: int  # how many of the user's skills the task requires
+
+
+class TaskRecommendationPage(BaseModel):
+    items: List[TaskRecommendation]
+    next_cursor: Optional[str] = None
+
+
+class TaskDependencies(BaseModel):
+    task_id: UUID
+    blocked_by: List[UUID]  # unfinished prerequisites
+    blocks: List[UUID]  # tasks that list this one as a prerequisite
+    unblocks: List[UUID]  # dependents that become ready once this task is completed
+    is_blocked: bool
+
+
+class TaskBulkRequest(BaseModel):
+    # Items are validated one by one so a bad item fails alone, not the batch.
+    # POST items follow TaskCreate; PATCH items are TaskUpdate fields plus "id".
+    tasks: List[Dict[str, Any]] = Field(..., min_length=1)
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: UUID
+
+
+class TaskBulkItemResult(BaseModel):
+    index: int
+    id: Optional[UUID] = None
+    ok: bool
+    error: Optional[str] = None
+
+
+class TaskBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[TaskBulkItemResult]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 
 
@@ -15,6 +15,11 @@ class TaskStatusUpdate(BaseModel):
     assignee_id: Optional[UUID] = None
 
 
+class TaskStatusBulkUpdate(BaseModel):
+    type: str = "task_status_bulk_update"
+    updates: List[TaskStatusUpdate]
+
+
 class TaskAssignmentUpdate(BaseModel):
     type: str = "task_assignment_update"
     task_id: UUID
@@ -22,6 +27,18 @@ class TaskAssignmentUpdate(BaseModel):
     assigned_by: UUID
 
 
+class DashboardSnapshot(BaseModel):
+    type: str = "dashboard_snapshot"
+    sequence: int
+    stats: Dict[str, int]
+
+
+class DashboardDelta(BaseModel):
+    type: str = "dashboard_delta"
+    sequence: int
+    changes: Dict[str, int]  # only the stats that changed, with their new values
+
+
 class ChatMessage(BaseModel):
     type: str = "chat_message"
     message: str
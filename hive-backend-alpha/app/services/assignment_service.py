@@ -1,12 +1,17 @@
 from typing import Optional
 from uuid import UUID
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import after_commit, commit_or_flush
 from app.models.task import Task
 from app.models.user import User
 from app.models.user_task_association import UserTaskAssociation
 from app.websockets.connection_manager import manager
 from app.schemas.websocket import TaskAssignmentUpdate
+from app.services import dashboard_service
+from app.services.project_service import record_task_changes, task_counter_state
+from app.services.task_service import invalidate_recommendations
 
 
 async def assign_task(
@@ -20,8 +25,12 @@ async def assign_task(
     task.assignee_id = assignee.id
     
     # Update status to in_progress if not already
+    counter_changes = []
     if task.status == "available":
+        before = task_counter_state(task)
         task.status = "in_progress"
+        counter_changes.append((before, task_counter_state(task)))
+        await record_task_changes(db, counter_changes)
     
     # Create association record
     association = UserTaskAssociation(
@@ -30,25 +39,62 @@ async def assign_task(
     )
     db.add(association)
     
-    await db.commit()
-    await db.refresh(task)
+    await commit_or_flush(db)
+    await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+    await after_commit(db, invalidate_recommendations)
     
     # Broadcast assignment update
-    await broadcast_assignment_update(task, assigned_by.id)
+    await after_commit(db, lambda: broadcast_assignment_update(task, assigned_by.id))
     
     return task
 
 
+async def claim_task(db: AsyncSession, task_id: UUID, user: User) -> Optional[Task]:
+    """Atomically assign an available, unassigned task to ``user``.
+
+    The availability checks live in the UPDATE's WHERE clause, so of any
+    number of concurrent claimers exactly one matches the row; the rest get
+    None. The association row is written in the same transaction.
+    """
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .where(Task.assignee_id.is_(None))
+        .where(Task.status == "available")
+        .where(Task.owner_id != user.id)
+        .values(assignee_id=user.id, status="in_progress")
+        .returning(Task)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    task = result.scalar_one_or_none()
+    if task is None:
+        return None
+
+    db.add(UserTaskAssociation(user_id=user.id, task_id=task.id))
+    counter_changes = [((task.project_id, "available", task.impact_points), task_counter_state(task))]
+    await record_task_changes(db, counter_changes)
+    await commit_or_flush(db)
+    await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+    await after_commit(db, invalidate_recommendations)
+    await after_commit(db, lambda: broadcast_assignment_update(task, user.id))
+    return task
+
+
 async def unassign_task(db: AsyncSession, task: Task) -> Task:
     """Remove assignment from a task."""
     task.assignee_id = None
     
     # Update status back to available if it was in_progress
+    counter_changes = []
     if task.status == "in_progress":
+        before = task_counter_state(task)
         task.status = "available"
+        counter_changes.append((before, task_counter_state(task)))
+        await record_task_changes(db, counter_changes)
     
-    await db.commit()
-    await db.refresh(task)
+    await commit_or_flush(db)
+    await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+    await after_commit(db, invalidate_recommendations)
     return task
 
 
@@ -70,7 +116,7 @@ async def broadcast_assignment_update(task: Task, assigned_by_id: UUID):
             assignee_id=task.assignee_id,
             assigned_by=assigned_by_id
         )
-        await manager.broadcast(update_message.model_dump())
+        await manager.broadcast(update_message.model_dump(mode="json"))
     except Exception as e:
         # Log error but don't fail the operation
         print(f"Failed to broadcast assignment update: {e}")
\ No newline at end of file
@@ -24,7 +24,6 @@ class ChatService:
         )
         self.db.add(message)
         await self.db.commit()
-        await self.db.refresh(message)
         return message
     
     async def create_direct_message(self, sender_id: UUID, recipient_id: UUID, content: str) -> ChatMessage:
@@ -37,7 +36,6 @@ class ChatService:
         )
         self.db.add(message)
         await self.db.commit()
-        await self.db.refresh(message)
         return message
     
     async def get_task_chat_messages(
@@ -226,10 +224,11 @@ class ChatService:
     
     async def can_user_access_task_chat(self, user_id: UUID, task_id: UUID) -> bool:
         """Check if a user can access a task's chat (owner or assignee)."""
-        stmt = select(Task).where(Task.id == task_id)
+        # Ownership columns only; the task itself isn't needed
+        stmt = select(Task.owner_id, Task.assignee_id).where(Task.id == task_id)
         result = await self.db.execute(stmt)
-        task = result.scalar_one_or_none()
-        if not task:
+        row = result.one_or_none()
+        if not row:
             return False
         
-        return task.owner_id == user_id or task.assignee_id == user_id
\ No newline at end of file
+        return user_id in (row.owner_id, row.assignee_id)
\ No newline at end of file
@@ -21,7 +21,6 @@ class CommentService:
         )
         self.db.add(comment)
         await self.db.commit()
-        await self.db.refresh(comment)
         return comment
     
     async def get_task_comments(self, task_id: UUID) -> List[CommentWithAuthor]:
@@ -66,7 +65,6 @@ class CommentService:
         
         comment.content = comment_data.content
         await self.db.commit()
-        await self.db.refresh(comment)
         return comment
     
     async def delete_comment(self, comment_id: UUID, author_id: UUID) -> bool:
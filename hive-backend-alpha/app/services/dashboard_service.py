@@ -1,8 +1,11 @@
+import asyncio
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
+from app.database import async_session
 from app.models.user import User
 from app.models.task import Task
 from app.schemas.dashboard import (
@@ -12,6 +15,128 @@ from app.schemas.dashboard import (
     LiveStatusResponse
 )
 
+TASK_STATUSES = ["draft", "available", "in_progress", "completed"]
+
+# What the counters see of a user: (is_active, is_online)
+UserCounterState = Tuple[bool, bool]
+
+
+class DashboardCounters:
+    """In-process task and user counts behind the public dashboard endpoints.
+
+    Seeded from the database (at startup, or on the first read), adjusted by
+    the services after each committed write, and re-seeded periodically to
+    correct drift from other processes and out-of-band writes. Reads never
+    touch the database once seeded.
+
+    Listeners are called (synchronously) after every change.
+
+    Not thread-safe; intended to be used from the event loop only.
+    """
+
+    def __init__(self):
+        self._listeners: List[Callable[[], None]] = []
+        self.reset()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        self._listeners.append(listener)
+
+    def _changed(self) -> None:
+        for listener in self._listeners:
+            listener()
+
+    def reset(self) -> None:
+        self.seeded = False
+        self.tasks_by_status: Counter = Counter()
+        self.total_users = 0
+        self.active_users = 0
+        self.online_users = 0
+
+    @property
+    def total_tasks(self) -> int:
+        return sum(self.tasks_by_status.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Every counter as a flat mapping (the dashboard feed's frame format)."""
+        stats = {
+            "total_tasks": self.total_tasks,
+            "active_tasks": self.tasks_by_status["in_progress"],
+        }
+        for status in sorted(set(TASK_STATUSES) | set(self.tasks_by_status)):
+            stats[f"{status}_tasks"] = self.tasks_by_status[status]
+        stats.update(
+            total_users=self.total_users,
+            active_users=self.active_users,
+            online_users=self.online_users
+        )
+        return stats
+
+    def load(self, task_stats: TaskStats, user_stats: UserStats) -> None:
+        self.tasks_by_status = Counter({status: count for status, count in task_stats.by_status.items() if count})
+        self.total_users = user_stats.total_users
+        self.active_users = user_stats.active_users
+        self.online_users = user_stats.online_users
+        self.seeded = True
+        self._changed()
+
+    def task_changed(self, before: Optional[str], after: Optional[str]) -> None:
+        """Apply a task status change; None before a create or after a delete."""
+        if before == after:
+            return
+        if before is not None:
+            self.tasks_by_status[before] -= 1
+        if after is not None:
+            self.tasks_by_status[after] += 1
+        self._changed()
+
+    def user_changed(self, before: Optional[UserCounterState], after: Optional[UserCounterState]) -> None:
+        """Apply a user change; None before a create or after a delete."""
+        for state, sign in ((before, -1), (after, 1)):
+            if state is None:
+                continue
+            is_active, is_online = state
+            self.total_users += sign
+            self.active_users += sign if is_active else 0
+            self.online_users += sign if is_online else 0
+        self._changed()
+
+
+counters = DashboardCounters()
+
+
+def user_counter_state(user: User) -> UserCounterState:
+    return (bool(user.is_active), bool(user.is_online))
+
+
+async def tasks_changed(changes: Iterable[Tuple[Optional[tuple], Optional[tuple]]]) -> None:
+    """after_commit callback applying (before, after) task_counter_state() pairs."""
+    for before, after in changes:
+        counters.task_changed(before[1] if before else None, after[1] if after else None)
+
+
+async def seed_counters(db: AsyncSession) -> None:
+    """Load the counters from the database (startup and periodic reconciliation)."""
+    task_stats = await get_task_statistics(db)
+    user_stats = await get_user_statistics(db)
+    counters.load(task_stats, user_stats)
+
+
+async def seed_counters_from_database() -> None:
+    """seed_counters() with a session of its own."""
+    async with async_session() as db:
+        await seed_counters(db)
+
+
+async def reconcile_counters_periodically(interval: float) -> None:
+    """Re-seed the counters every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await seed_counters_from_database()
+        except Exception as e:
+            # Keep serving the current counts; the next round retries
+            print(f"Failed to reconcile dashboard counters: {e}")
+
 
 async def get_task_statistics(db: AsyncSession) -> TaskStats:
     """Get task statistics and breakdowns."""
@@ -27,8 +152,7 @@ async def get_task_statistics(db: AsyncSession) -> TaskStats:
     status_breakdown = {status: count for status, count in status_result.fetchall()}
     
     # Ensure all status types are represented
-    all_statuses = ["draft", "available", "in_progress", "completed"]
-    for status in all_statuses:
+    for status in TASK_STATUSES:
         if status not in status_breakdown:
             status_breakdown[status] = 0
     
@@ -66,40 +190,45 @@ async def get_user_statistics(db: AsyncSession) -> UserStats:
 
 
 async def get_dashboard_summary(db: AsyncSession) -> DashboardSummaryResponse:
-    """Get complete dashboard summary with all statistics."""
-    task_stats = await get_task_statistics(db)
-    user_stats = await get_user_statistics(db)
+    """Get complete dashboard summary with all statistics.
+
+    Served from the in-process counters; ``db`` is only used to seed them.
+    """
+    if not counters.seeded:
+        await seed_counters(db)
+    
+    by_status = {status: counters.tasks_by_status[status] for status in TASK_STATUSES}
+    by_status.update({status: count for status, count in counters.tasks_by_status.items() if count})
     
     return DashboardSummaryResponse(
-        tasks=task_stats,
-        users=user_stats,
+        tasks=TaskStats(
+            total=counters.total_tasks,
+            by_status=by_status,
+            by_priority={},  # Placeholder for future implementation
+            by_category={}   # Placeholder for future implementation
+        ),
+        users=UserStats(
+            total_users=counters.total_users,
+            active_users=counters.active_users,
+            online_users=counters.online_users
+        ),
         last_updated=datetime.utcnow()
     )
 
 
 async def get_live_status(db: AsyncSession) -> LiveStatusResponse:
-    """Get live status indicators for real-time dashboard updates."""
-    # Get online users count
-    online_users_result = await db.execute(
-        select(func.count(User.id)).where(User.is_online == True)
-    )
-    online_users = online_users_result.scalar() or 0
-    
-    # Get active tasks (in_progress status)
-    active_tasks_result = await db.execute(
-        select(func.count(Task.id)).where(Task.status == "in_progress")
-    )
-    active_tasks = active_tasks_result.scalar() or 0
-    
-    # Get recent activity count (tasks updated in last hour - placeholder)
-    # For alpha, we'll just count total tasks as "recent activity"
-    recent_activity_result = await db.execute(select(func.count(Task.id)))
-    recent_activity = recent_activity_result.scalar() or 0
+    """Get live status indicators for real-time dashboard updates.
+
+    Served from the in-process counters; ``db`` is only used to seed them.
+    """
+    if not counters.seeded:
+        await seed_counters(db)
     
+    # For alpha, total tasks stand in for "recent activity"
     return LiveStatusResponse(
-        online_users_count=online_users,
-        active_tasks_count=active_tasks,
-        recent_activity_count=recent_activity,
+        online_users_count=counters.online_users,
+        active_tasks_count=counters.tasks_by_status["in_progress"],
+        recent_activity_count=counters.total_tasks,
         system_status="operational"
     )
 
@@ -0,0 +1,249 @@
+import copy
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.dependency_graph import (
+    DependencyCycleError, DependencyGraph, as_task_id, parse_hours
+)
+from app.database import after_commit, in_unit_of_work, uow_cache
+from app.models.task import Task
+from app.schemas.project import ProjectDependencyGraph
+from app.schemas.task import TaskDependencies
+
+# One DependencyGraph per project id (None for tasks outside any project).
+# Graphs are updated in place after each committed task write; the TTL bounds
+# how stale another worker process's copy can get.
+graph_cache = TTLCache(
+    "dependency_graphs",
+    max_size=settings.dependency_graph_cache_max_size,
+    ttl=settings.dependency_graph_cache_ttl
+)
+
+_GRAPH_COLUMNS = (Task.id, Task.title, Task.dependencies, Task.status, Task.estimated_hours)
+
+
+def prerequisite_ids(dependencies: Optional[Iterable[str]]) -> List[UUID]:
+    """Dependency entries that are task ids (the rest is free text)."""
+    return [task_id for task_id in map(as_task_id, dependencies or []) if task_id is not None]
+
+
+def _upsert(graph: DependencyGraph, task, check_cycles: bool = True) -> None:
+    graph.upsert(
+        task.id,
+        task.title,
+        prerequisite_ids(task.dependencies),
+        hours=parse_hours(task.estimated_hours),
+        completed=task.status == "completed",
+        check_cycles=check_cycles
+    )
+
+
+async def get_project_graph(db: AsyncSession, project_id: Optional[UUID]) -> DependencyGraph:
+    """The dependency graph of a project's tasks, built with one query on a cache miss.
+
+    Inside a unit of work the rows may be uncommitted and could still roll
+    back, so the graph is kept only for that unit of work.
+    """
+    cache = uow_cache(db) if in_unit_of_work(db) else None
+    graph = graph_cache.get(project_id) if cache is None else cache.get(("dependency_graph", project_id))
+    if graph is not None:
+        return graph
+
+    in_project = Task.project_id.is_(None) if project_id is None else Task.project_id == project_id
+    result = await db.execute(select(*_GRAPH_COLUMNS).where(in_project))
+    graph = DependencyGraph()
+    for row in result.all():
+        # Stored data may predate cycle checks; topological_order() reports any cycle
+        _upsert(graph, row, check_cycles=False)
+    if cache is None:
+        graph_cache.set(project_id, graph)
+    else:
+        cache[("dependency_graph", project_id)] = graph
+    return graph
+
+
+async def get_task_dependencies(db: AsyncSession, task_id: UUID) -> Optional[TaskDependencies]:
+    """What blocks a task and what it blocks; O(degree) once its project graph is cached."""
+    result = await db.execute(select(Task.project_id).where(Task.id == task_id))
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    graph = await get_project_graph(db, row.project_id)
+    if task_id not in graph:
+        # Created by another process since this graph was cached
+        graph_cache.invalidate(row.project_id)
+        graph = await get_project_graph(db, row.project_id)
+
+    blocked_by = graph.blocked_by(task_id)
+    return TaskDependencies(
+        task_id=task_id,
+        blocked_by=blocked_by,
+        blocks=graph.blocks(task_id),
+        unblocks=graph.unblocks(task_id),
+        is_blocked=bool(blocked_by) and task_id not in graph.completed
+    )
+
+
+async def get_project_dependency_graph(db: AsyncSession, project_id: UUID) -> ProjectDependencyGraph:
+    """Topological order, critical path and ready/blocked tasks; raises DependencyCycleError."""
+    graph = await get_project_graph(db, project_id)
+    order = graph.topological_order()
+    critical_path, hours = graph.critical_path()
+    position = {task_id: index for index, task_id in enumerate(order)}
+    return ProjectDependencyGraph(
+        project_id=project_id,
+        order=order,
+        critical_path=critical_path,
+        critical_path_hours=hours,
+        ready=sorted(graph.ready, key=position.get),
+        blocked=sorted(graph.blocked, key=position.get)
+    )
+
+
+async def prepare_dependencies(
+    db: AsyncSession, project_id: Optional[UUID], dependencies: List[str], task_id: Optional[UUID] = None
+) -> List[str]:
+    """Resolve task titles in ``dependencies`` to ids and reject cycles.
+
+    Raises DependencyCycleError if ``task_id`` would end up depending on itself.
+    """
+    if not dependencies:
+        return dependencies
+    graph = await get_project_graph(db, project_id)
+    resolved = graph.resolve(dependencies, task_id)
+    if task_id is not None:
+        graph.check_prerequisites(task_id, prerequisite_ids(resolved))
+    return resolved
+
+
+async def check_batch_dependencies(
+    db: AsyncSession, graphs: Dict[Optional[UUID], DependencyGraph], task: Task, dependencies: List[str]
+) -> List[str]:
+    """Like prepare_dependencies for one item of a batch.
+
+    Items are applied to private copies of the project graphs in ``graphs``,
+    so a cycle formed across several items of the batch is caught too.
+    """
+    if task.project_id not in graphs:
+        graphs[task.project_id] = copy.deepcopy(await get_project_graph(db, task.project_id))
+    graph = graphs[task.project_id]
+    if task.id not in graph:
+        _upsert(graph, task, check_cycles=False)
+    resolved = graph.resolve(dependencies, task.id)
+    graph.set_prerequisites(task.id, prerequisite_ids(resolved))
+    return resolved
+
+
+def batch_cycle_errors(prerequisites: Dict[UUID, Set[UUID]], titles: Dict[UUID, str]) -> Dict[UUID, str]:
+    """Errors for the new tasks of a batch that can't be created without a loop.
+
+    ``prerequisites`` maps each new task to the other new tasks it names.
+    Existing tasks can't depend on new ones, so any loop lies within the
+    batch. Every task on a loop is rejected, and so is every task depending
+    on a rejected one, so nothing gets stored pointing at a task that wasn't
+    created.
+    """
+    # Peel off tasks whose prerequisites are all placed; the rest are stuck
+    dependents = defaultdict(set)
+    open_counts = {}
+    for task_id, prerequisite_set in prerequisites.items():
+        open_counts[task_id] = len(prerequisite_set)
+        for prerequisite in prerequisite_set:
+            dependents[prerequisite].add(task_id)
+    queue = deque(task_id for task_id, count in open_counts.items() if count == 0)
+    while queue:
+        current = queue.popleft()
+        for dependent in dependents[current]:
+            open_counts[dependent] -= 1
+            if open_counts[dependent] == 0:
+                queue.append(dependent)
+    stuck = {task_id for task_id, count in open_counts.items() if count > 0}
+
+    errors = {}
+    for task_id in stuck:
+        # Every stuck task has a stuck prerequisite; follow them until one repeats
+        path = [task_id]
+        positions = {task_id: 0}
+        current = min(prerequisites[task_id] & stuck)
+        while current not in positions:
+            positions[current] = len(path)
+            path.append(current)
+            current = min(prerequisites[current] & stuck)
+        if positions[current] == 0:
+            errors[task_id] = "Dependencies would form a cycle: " + " -> ".join(
+                titles[step] for step in path + [task_id]
+            )
+        else:
+            errors[task_id] = f"Depends on a task that would form a cycle: {titles[path[1]]}"
+    return errors
+
+
+async def task_saved(task: Task) -> None:
+    """Apply a committed task write to its project's cached graph, if one is cached."""
+    graph = graph_cache.get(task.project_id)
+    if graph is None:
+        return
+    try:
+        _upsert(graph, task)
+    except DependencyCycleError:
+        # A concurrent write elsewhere got in first; rebuild from the database
+        graph_cache.invalidate(task.project_id)
+
+
+async def task_removed(task_id: UUID, project_id: Optional[UUID]) -> None:
+    graph = graph_cache.get(project_id)
+    if graph is not None:
+        graph.remove(task_id)
+
+
+async def invalidate_projects(project_ids: Iterable[Optional[UUID]]) -> None:
+    for project_id in set(project_ids):
+        graph_cache.invalidate(project_id)
+
+
+async def link_project_dependencies(db: AsyncSession, project_ids: Iterable[UUID]) -> int:
+    """Resolve free-text dependencies to task ids across whole projects.
+
+    Meant for imports, where tasks name each other by title before they all
+    exist. Entries that would close a cycle are left as text. Returns the
+    number of dependencies linked; the rows are flushed, not committed.
+    """
+    project_ids = set(project_ids)
+    if not project_ids:
+        return 0
+
+    result = await db.execute(select(Task).where(Task.project_id.in_(project_ids)))
+    tasks = result.scalars().all()
+    graphs = {project_id: DependencyGraph() for project_id in project_ids}
+    for task in tasks:
+        _upsert(graphs[task.project_id], task, check_cycles=False)
+
+    linked = 0
+    for task in tasks:
+        graph = graphs[task.project_id]
+        dependencies = list(task.dependencies or [])
+        kept = []
+        for dependency in dependencies:
+            value = graph.resolve([dependency], task.id)[0]
+            if value != dependency:
+                try:
+                    graph.set_prerequisites(task.id, graph.prerequisites[task.id] | {UUID(value)})
+                except DependencyCycleError as e:
+                    print(f"Leaving dependency '{dependency}' of task {task.id} unlinked: {e}")
+                    value = dependency
+                else:
+                    linked += 1
+            if value not in kept:
+                kept.append(value)
+        if kept != dependencies:
+            task.dependencies = kept
+    await db.flush()
+    await after_commit(db, lambda: invalidate_projects(project_ids))
+    return linked
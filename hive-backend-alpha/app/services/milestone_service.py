@@ -1,10 +1,45 @@
+from uuid import UUID
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import datetime
-from uuid import UUID
 
+from app.database import after_commit, commit_or_flush
 from app.models.milestone import Milestone
+from app.models.task import Task
 from app.schemas.milestone import MilestoneCreate, MilestoneUpdate
+from app.services.project_service import progress_ratio
+from app.services.task_service import invalidate_recommendations
+
+
+async def record_milestone_change(db: AsyncSession, task_id: UUID, added: int = 0, completed: int = 0) -> None:
+    """Roll a milestone write up into its task's counters and progress.
+
+    One UPDATE ... RETURNING in the caller's transaction; it also bumps the
+    task's updated_at, since the task's representation changed. A copy of the
+    task already loaded in this session is brought up to date.
+    """
+    if not added and not completed:
+        return
+    table = Task.__table__
+    milestone_count = table.c.milestone_count + added
+    completed_milestones = table.c.completed_milestones + completed
+    result = await db.execute(
+        update(table)
+        .where(table.c.id == task_id)
+        .values(
+            milestone_count=milestone_count,
+            completed_milestones=completed_milestones,
+            progress=progress_ratio(completed_milestones, milestone_count)
+        )
+        .returning(table.c.milestone_count, table.c.completed_milestones, table.c.progress, table.c.updated_at)
+    )
+    row = result.one_or_none()
+    task = db.identity_map.get(db.sync_session.identity_key(Task, task_id))
+    if row is not None and task is not None:
+        for name, value in row._mapping.items():
+            set_committed_value(task, name, value)
+    await after_commit(db, invalidate_recommendations)
 
 
 async def create_milestone(db: AsyncSession, milestone_data: MilestoneCreate) -> Milestone:
@@ -17,16 +52,13 @@ async def create_milestone(db: AsyncSession, milestone_data: MilestoneCreate) ->
     )
     
     db.add(milestone)
-    await db.commit()
-    await db.refresh(milestone)
+    await record_milestone_change(db, milestone.task_id, added=1)
+    await commit_or_flush(db)
     return milestone
 
 
-async def update_milestone(db: AsyncSession, milestone_id: UUID, milestone_data: MilestoneUpdate) -> Milestone:
+async def update_milestone(db: AsyncSession, milestone: Milestone, milestone_data: MilestoneUpdate) -> Milestone:
     """Update an existing milestone"""
-    result = await db.execute(select(Milestone).where(Milestone.id == milestone_id))
-    milestone = result.scalar_one()
-    
     # Update fields if provided
     if milestone_data.title is not None:
         milestone.title = milestone_data.title
@@ -35,6 +67,10 @@ async def update_milestone(db: AsyncSession, milestone_id: UUID, milestone_data:
     if milestone_data.status is not None:
         milestone.status = milestone_data.status
     if milestone_data.is_completed is not None:
+        if bool(milestone.is_completed) != milestone_data.is_completed:
+            await record_milestone_change(
+                db, milestone.task_id, completed=1 if milestone_data.is_completed else -1
+            )
         milestone.is_completed = milestone_data.is_completed
         if milestone_data.is_completed and not milestone.completed_at:
             milestone.completed_at = datetime.utcnow()
@@ -43,15 +79,14 @@ async def update_milestone(db: AsyncSession, milestone_id: UUID, milestone_data:
     if milestone_data.due_date is not None:
         milestone.due_date = milestone_data.due_date
     
-    await db.commit()
-    await db.refresh(milestone)
+    await commit_or_flush(db)
     return milestone
 
 
-async def delete_milestone(db: AsyncSession, milestone_id: UUID) -> None:
+async def delete_milestone(db: AsyncSession, milestone: Milestone) -> None:
     """Delete a milestone"""
-    result = await db.execute(select(Milestone).where(Milestone.id == milestone_id))
-    milestone = result.scalar_one()
-    
     await db.delete(milestone)
-    await db.commit()
\ No newline at end of file
+    await record_milestone_change(
+        db, milestone.task_id, added=-1, completed=-1 if milestone.is_completed else 0
+    )
+    await commit_or_flush(db)
\ No newline at end of file
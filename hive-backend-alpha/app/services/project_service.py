@@ -1,12 +1,42 @@
+import time
+from datetime import datetime
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, case
-from typing import List, Optional
+from collections import Counter, defaultdict
+from sqlalchemy import Float, bindparam, cast, select, func, desc, case, literal, null, tuple_, union_all, update
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
+from ..config import settings
+from ..core.cache import TTLCache
+from ..core.fieldsets import load_only_columns, pick_fields
+from ..database import after_commit, commit_or_flush
 from ..models.project import Project
 from ..models.task import Task
 from ..models.user import User
 from ..schemas.project import ProjectCreate, ProjectUpdate, ProjectWithTasks, ProjectSummary
+from . import dashboard_service
+
+# Per-status task counters on projects; other statuses only count towards task_count
+TASK_STATUS_COUNTERS = {
+    "draft": "draft_tasks",
+    "available": "available_tasks",
+    "in_progress": "in_progress_tasks",
+    "completed": "completed_tasks",
+}
+TASK_COUNTER_COLUMNS = (
+    "task_count", *TASK_STATUS_COUNTERS.values(), "task_impact_points", "completed_impact_points"
+)
+
+# What the counters see of a task: (project_id, status, impact_points)
+TaskCounterState = Tuple[Optional[UUID], Optional[str], Optional[int]]
+
+RECENT_ACTIVITY_LIMIT = 5
+
+# The project summary, as (time.monotonic() when computed, ProjectSummary)
+SUMMARY_CACHE_KEY = "summary"
+summary_cache = TTLCache("project_summary", max_size=1, ttl=settings.project_summary_cache_ttl)
 
 
 async def get_projects(
@@ -14,15 +44,18 @@ async def get_projects(
     skip: int = 0, 
     limit: int = 100,
     owner_id: Optional[UUID] = None,
-    status: Optional[str] = None
-) -> List[ProjectWithTasks]:
-    """Get projects with task counts"""
-    stmt = select(
-        Project,
-        func.count(Task.id).label('task_count'),
-        func.sum(case((Task.status == 'completed', 1), else_=0)).label('completed_tasks')
-    ).outerjoin(Task).group_by(Project.id)
-    
+    status: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> Union[List[ProjectWithTasks], List[dict]]:
+    """Get projects with task counts.
+
+    Counts come from the projects' counter columns, so this is a plain scan
+    of projects. With ``fields``, only those columns are loaded and plain
+    dicts are returned.
+    """
+    stmt = select(Project)
+    if fields:
+        stmt = stmt.options(load_only_columns(Project, fields))
     if owner_id:
         stmt = stmt.where(Project.owner_id == owner_id)
     if status:
@@ -31,39 +64,10 @@ async def get_projects(
     stmt = stmt.order_by(desc(Project.updated_at)).offset(skip).limit(limit)
     
     result = await db.execute(stmt)
-    projects_data = result.all()
-    
-    projects = []
-    for project, task_count, completed_tasks in projects_data:
-        project_dict = {
-            "id": project.id,
-            "title": project.title,
-            "description": project.description,
-            "status": project.status,
-            "priority": project.priority,
-            "category": project.category,
-            "impact_points": project.impact_points,
-            "budget": project.budget,
-            "location": project.location,
-            "team_size": project.team_size,
-            "start_date": project.start_date,
-            "due_date": project.due_date,
-            "success_metrics": project.success_metrics,
-            "deliverables": project.deliverables,
-            "dependencies": project.dependencies,
-            "required_skills": project.required_skills,
-            "definition_of_done": project.definition_of_done,
-            "owner_id": project.owner_id,
-            "assignee_id": project.assignee_id,
-            "completed_at": project.completed_at,
-            "created_at": project.created_at,
-            "updated_at": project.updated_at,
-            "task_count": task_count or 0,
-            "completed_tasks": completed_tasks or 0
-        }
-        projects.append(ProjectWithTasks(**project_dict))
-    
-    return projects
+    projects = result.scalars().all()
+    if fields:
+        return pick_fields(projects, fields)
+    return [ProjectWithTasks.model_validate(project) for project in projects]
 
 
 async def get_project(db: AsyncSession, project_id: UUID) -> Optional[Project]:
@@ -73,6 +77,18 @@ async def get_project(db: AsyncSession, project_id: UUID) -> Optional[Project]:
     return result.scalar_one_or_none()
 
 
+async def get_project_version(db: AsyncSession, project_id: UUID) -> Optional[tuple]:
+    """updated_at, task_count and progress of a project, without loading it; None if it doesn't exist."""
+    stmt = select(Project.updated_at, Project.task_count, Project.progress).where(Project.id == project_id)
+    result = await db.execute(stmt)
+    return result.one_or_none()
+
+
+def project_version_parts(project: Project) -> tuple:
+    # Task counter writes leave updated_at alone, so they are part of the version
+    return project.task_count, project.progress
+
+
 async def create_project(db: AsyncSession, project_data: ProjectCreate, owner_id: UUID) -> Project:
     """Create a new project"""
     project = Project(
@@ -80,8 +96,8 @@ async def create_project(db: AsyncSession, project_data: ProjectCreate, owner_id
         owner_id=owner_id
     )
     db.add(project)
-    await db.commit()
-    await db.refresh(project)
+    await commit_or_flush(db)
+    await after_commit(db, invalidate_summary)
     return project
 
 
@@ -112,64 +128,256 @@ async def update_project(
     for field, value in update_data.items():
         setattr(project, field, value)
     
-    await db.commit()
-    await db.refresh(project)
+    await commit_or_flush(db)
+    await after_commit(db, invalidate_summary)
     return project
 
 
 async def delete_project(db: AsyncSession, project_id: UUID, user_id: UUID) -> bool:
     """Delete a project (only by owner)"""
-    stmt = select(Project).where(Project.id == project_id)
+    # task_service imports this module
+    from .task_service import invalidate_recommendations
+
+    # The tasks go with the project by ORM cascade, which needs them loaded anyway
+    stmt = select(Project).where(Project.id == project_id).options(selectinload(Project.tasks))
     result = await db.execute(stmt)
     project = result.scalar_one_or_none()
     
     if not project or project.owner_id != user_id:
         return False
     
+    counter_changes = [(task_counter_state(task), None) for task in project.tasks]
     await db.delete(project)
-    await db.commit()
+    await commit_or_flush(db)
+    await after_commit(db, invalidate_summary)
+    if counter_changes:
+        await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+        await after_commit(db, invalidate_recommendations)
     return True
 
 
-async def get_project_tasks(db: AsyncSession, project_id: UUID) -> List[Task]:
-    """Get all tasks for a project"""
+async def get_project_tasks(
+    db: AsyncSession, project_id: UUID, fields: Optional[List[str]] = None
+) -> List[Task]:
+    """Get all tasks for a project, optionally loading only ``fields``"""
     stmt = select(Task).where(Task.project_id == project_id).order_by(desc(Task.updated_at))
+    if fields:
+        stmt = stmt.options(load_only_columns(Task, fields))
     result = await db.execute(stmt)
     return result.scalars().all()
 
 
+def _summary_statement(dialect_name: str):
+    """Project totals by status and priority plus the most recently updated
+    projects, as one UNION ALL; rows are tagged by ``kind``."""
+    recent = (
+        select(Project.title, Project.status, Project.updated_at)
+        .order_by(desc(Project.updated_at))
+        .limit(RECENT_ACTIVITY_LIMIT)
+        .subquery()
+    )
+    # First, so the union's column types (notably updated_at) come from here
+    recent_rows = select(
+        literal("recent").label("kind"),
+        recent.c.status.label("key"),
+        null().label("count"),
+        recent.c.title,
+        recent.c.updated_at
+    )
+
+    if dialect_name == "postgresql":
+        kind = case(
+            (func.grouping(Project.status) == 0, "status"),
+            (func.grouping(Project.priority) == 0, "priority"),
+            else_="total"
+        )
+        aggregates = [
+            select(kind, func.coalesce(Project.status, Project.priority), func.count(), null(), null())
+            .group_by(func.grouping_sets(Project.status, Project.priority, tuple_()))
+        ]
+    else:
+        # No GROUPING SETS (SQLite): one GROUP BY per set
+        aggregates = [
+            select(literal("total"), null(), func.count(), null(), null()).select_from(Project),
+            select(literal("status"), Project.status, func.count(), null(), null()).group_by(Project.status),
+            select(literal("priority"), Project.priority, func.count(), null(), null()).group_by(Project.priority),
+        ]
+    return union_all(recent_rows, *aggregates)
+
+
 async def get_projects_summary(db: AsyncSession) -> ProjectSummary:
-    """Get summary statistics for projects"""
-    # Total projects
-    total_stmt = select(func.count(Project.id))
-    total_result = await db.execute(total_stmt)
-    total_projects = total_result.scalar()
-    
-    # By status
-    status_stmt = select(Project.status, func.count(Project.id)).group_by(Project.status)
-    status_result = await db.execute(status_stmt)
-    by_status = dict(status_result.all())
-    
-    # By priority
-    priority_stmt = select(Project.priority, func.count(Project.id)).group_by(Project.priority)
-    priority_result = await db.execute(priority_stmt)
-    by_priority = dict(priority_result.all())
-    
-    # Recent activity (last 5 updated projects)
-    recent_stmt = select(Project.title, Project.status, Project.updated_at).order_by(desc(Project.updated_at)).limit(5)
-    recent_result = await db.execute(recent_stmt)
+    """Get summary statistics for projects.
+
+    Computed with one statement and cached until a project is created,
+    updated or deleted (or the TTL passes); ``cache_age`` says how old the
+    figures are.
+    """
+    cached = summary_cache.get(SUMMARY_CACHE_KEY)
+    if cached is not None:
+        computed_at, summary = cached
+        return summary.model_copy(update={"cache_age": time.monotonic() - computed_at})
+
+    result = await db.execute(_summary_statement(db.get_bind().dialect.name))
+    total_projects = 0
+    by_status = {}
+    by_priority = {}
+    recent = []
+    for row in result.all():
+        if row.kind == "total":
+            total_projects = row.count
+        elif row.kind == "status":
+            by_status[row.key] = row.count
+        elif row.kind == "priority":
+            by_priority[row.key] = row.count
+        else:
+            recent.append(row)
+
+    # UNION ALL doesn't promise to keep the subquery's order
+    recent.sort(key=lambda row: row.updated_at or datetime.min, reverse=True)
     recent_activity = [
         {
-            "title": title,
-            "status": status,
-            "updated_at": updated_at.isoformat() if updated_at else None
+            "title": row.title,
+            "status": row.key,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None
         }
-        for title, status, updated_at in recent_result.all()
+        for row in recent
     ]
-    
-    return ProjectSummary(
+
+    summary = ProjectSummary(
         total_projects=total_projects,
         by_status=by_status,
         by_priority=by_priority,
         recent_activity=recent_activity
-    )
\ No newline at end of file
+    )
+    summary_cache.set(SUMMARY_CACHE_KEY, (time.monotonic(), summary))
+    return summary
+
+
+async def invalidate_summary() -> None:
+    summary_cache.invalidate(SUMMARY_CACHE_KEY)
+
+
+def task_counter_state(task) -> TaskCounterState:
+    return (task.project_id, task.status, task.impact_points)
+
+
+def _counter_values(state: TaskCounterState) -> Dict[str, int]:
+    _, status, impact_points = state
+    values = {"task_count": 1, "task_impact_points": impact_points or 0}
+    if status in TASK_STATUS_COUNTERS:
+        values[TASK_STATUS_COUNTERS[status]] = 1
+    if status == "completed":
+        values["completed_impact_points"] = impact_points or 0
+    return values
+
+
+def progress_ratio(done, total):
+    """SQL for done / total as a float, 0 when total is 0; operands may be expressions."""
+    return case((total > 0, cast(done, Float) / total), else_=0.0)
+
+
+def _ratio(done: int, total: int) -> float:
+    return done / total if total > 0 else 0.0
+
+
+def _counter_update():
+    # Core UPDATE so projects.updated_at keeps its value: counters aren't an edit
+    table = Project.__table__
+    values = {column: table.c[column] + bindparam(f"delta_{column}") for column in TASK_COUNTER_COLUMNS}
+    # SET expressions read the old row, so progress is computed from the new totals here
+    progress = progress_ratio(values["completed_impact_points"], values["task_impact_points"])
+    return (
+        update(table)
+        .where(table.c.id == bindparam("project_id"))
+        .values(**values, progress=progress, updated_at=table.c.updated_at)
+    )
+
+
+async def record_task_changes(
+    db: AsyncSession,
+    changes: Iterable[Tuple[Optional[TaskCounterState], Optional[TaskCounterState]]]
+) -> None:
+    """Apply task writes to the project counters, in the caller's transaction.
+
+    Each change is a (before, after) pair of task_counter_state() values,
+    with None before a create or after a delete. Every affected project is
+    updated by one executemany UPDATE issued before the caller commits.
+    """
+    deltas: Dict[UUID, Counter] = defaultdict(Counter)
+    for before, after in changes:
+        if before == after:
+            continue
+        for state, sign in ((before, -1), (after, 1)):
+            if state is None or state[0] is None:
+                continue
+            for column, value in _counter_values(state).items():
+                deltas[state[0]][column] += sign * value
+
+    rows = [
+        {"project_id": project_id, **{f"delta_{column}": delta[column] for column in TASK_COUNTER_COLUMNS}}
+        for project_id, delta in deltas.items()
+        if any(delta.values())
+    ]
+    if rows:
+        await db.execute(_counter_update(), rows)
+        _sync_loaded_projects(db, rows)
+
+
+def _sync_loaded_projects(db: AsyncSession, rows: List[dict]) -> None:
+    # The Core UPDATE bypasses the identity map; bring projects already loaded
+    # in this session up to date without marking them dirty
+    for row in rows:
+        project = db.identity_map.get(db.sync_session.identity_key(Project, row["project_id"]))
+        if project is None:
+            continue
+        for column in TASK_COUNTER_COLUMNS:
+            if column in project.__dict__:
+                set_committed_value(project, column, project.__dict__[column] + row[f"delta_{column}"])
+        if {"progress", "completed_impact_points", "task_impact_points"} <= project.__dict__.keys():
+            set_committed_value(project, "progress", _ratio(project.completed_impact_points, project.task_impact_points))
+
+
+async def reconcile_task_counters(db: AsyncSession) -> int:
+    """Recompute every project's task counters (and progress) from the tasks table and fix any drift.
+
+    Writes that bypass the services (scripts, manual SQL) leave the counters
+    wrong until this runs. Commits, and returns the number of projects fixed.
+    """
+    completed = Task.status == "completed"
+    aggregates = [
+        func.count(Task.id).label("task_count"),
+        *[
+            func.sum(case((Task.status == status, 1), else_=0)).label(column)
+            for status, column in TASK_STATUS_COUNTERS.items()
+        ],
+        func.sum(func.coalesce(Task.impact_points, 0)).label("task_impact_points"),
+        func.sum(case((completed, func.coalesce(Task.impact_points, 0)), else_=0)).label("completed_impact_points"),
+    ]
+    result = await db.execute(
+        select(Task.project_id, *aggregates).where(Task.project_id.is_not(None)).group_by(Task.project_id)
+    )
+    expected = {
+        row.project_id: {column: int(getattr(row, column) or 0) for column in TASK_COUNTER_COLUMNS}
+        for row in result.all()
+    }
+
+    result = await db.execute(select(
+        Project.id, Project.progress, *[getattr(Project, column) for column in TASK_COUNTER_COLUMNS]
+    ))
+    rows = []
+    for row in result.all():
+        actual = {column: getattr(row, column) for column in TASK_COUNTER_COLUMNS}
+        wanted = expected.get(row.id, dict.fromkeys(TASK_COUNTER_COLUMNS, 0))
+        progress = _ratio(wanted["completed_impact_points"], wanted["task_impact_points"])
+        if actual != wanted or abs(row.progress - progress) > 1e-9:
+            # Same UPDATE as record_task_changes, with the difference as the delta
+            rows.append({
+                "project_id": row.id,
+                **{f"delta_{column}": wanted[column] - actual[column] for column in TASK_COUNTER_COLUMNS}
+            })
+
+    if rows:
+        await db.execute(_counter_update(), rows)
+        _sync_loaded_projects(db, rows)
+    await db.commit()
+    return len(rows)
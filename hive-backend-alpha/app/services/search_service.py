@@ -0,0 +1,124 @@
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import String, and_, case, cast, column, func, literal_column, null, or_, select, table, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import ScoreCursorKey
+from app.models.project import Project
+from app.models.search import SEARCH_COLUMNS, SEARCH_LANGUAGE
+from app.models.task import Task
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+# (entity, relevance score, highlighted title, highlighted description excerpt)
+SearchHit = Tuple[object, float, Optional[str], Optional[str]]
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def _postgresql_search(model, query: str):
+    ts_query = func.websearch_to_tsquery(SEARCH_LANGUAGE, query)
+    vector = literal_column(f"{model.__tablename__}.search_vector")
+    score = func.ts_rank(vector, ts_query)
+    highlight = func.ts_headline(
+        SEARCH_LANGUAGE, func.coalesce(model.title, ""), ts_query,
+        f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, HighlightAll=true"
+    )
+    snippet = func.ts_headline(
+        SEARCH_LANGUAGE, func.coalesce(model.description, ""), ts_query,
+        f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxFragments=2, MaxWords=20, MinWords=5"
+    )
+    stmt = select(model).where(vector.op("@@")(ts_query))
+    return stmt, score, highlight, snippet
+
+
+def _sqlite_match_query(query: str) -> Optional[str]:
+    # Quote each word so user input can't hit FTS5 query syntax; words are ANDed
+    words = _WORD.findall(query)
+    return " ".join(f'"{word}"' for word in words) if words else None
+
+
+def _sqlite_search(model, query: str):
+    name = model.__tablename__
+    columns = SEARCH_COLUMNS[name]
+    fts = table(f"{name}_fts", column("id"))
+    fts_ref = literal_column(f"{name}_fts")
+    # Column 0 of the FTS table is the row id (weight 0); bm25 is lower-is-better,
+    # so negate it to sort by score descending like the other dialects
+    score = -func.bm25(fts_ref, 0.0, 10.0, 5.0, 2.0, 1.0)
+    highlight = func.highlight(fts_ref, columns.index("title") + 1, HIGHLIGHT_START, HIGHLIGHT_STOP)
+    snippet = func.snippet(fts_ref, columns.index("description") + 1, HIGHLIGHT_START, HIGHLIGHT_STOP, "…", 20)
+    stmt = (
+        select(model)
+        .join(fts, fts.c.id == literal_column(f"{name}.id"))
+        .where(fts_ref.op("MATCH")(_sqlite_match_query(query)))
+    )
+    return stmt, score, highlight, snippet
+
+
+def _like_pattern(word: str) -> str:
+    # Words are \w+, so "_" is the only LIKE wildcard they can contain
+    return "%" + word.replace("_", "\\_") + "%"
+
+
+def _like_search(model, query: str):
+    """Fallback for other backends: every word must appear in some searchable column.
+
+    Scored by the column weights of the words found, without highlights.
+    """
+    columns = [cast(getattr(model, name), String) for name in SEARCH_COLUMNS[model.__tablename__]]
+    words = _WORD.findall(query)
+    score = sum(
+        case((searched.ilike(_like_pattern(word), escape="\\"), weight), else_=0)
+        for word in words
+        for searched, weight in zip(columns, (4, 3, 2, 1))
+    )
+    stmt = select(model).where(and_(*(
+        or_(*(searched.ilike(_like_pattern(word), escape="\\") for searched in columns))
+        for word in words
+    )))
+    return stmt, score, null(), null()
+
+
+async def _search(
+    db: AsyncSession, model, query: str, limit: int, after: Optional[ScoreCursorKey]
+) -> Tuple[List[SearchHit], Optional[ScoreCursorKey]]:
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        stmt, score, highlight, snippet = _postgresql_search(model, query)
+    elif not _WORD.search(query):
+        return [], None
+    elif dialect_name == "sqlite":
+        stmt, score, highlight, snippet = _sqlite_search(model, query)
+    else:
+        stmt, score, highlight, snippet = _like_search(model, query)
+
+    stmt = stmt.add_columns(score.label("score"), highlight.label("highlight"), snippet.label("snippet"))
+    if after is not None:
+        stmt = stmt.where(tuple_(score, model.id) < tuple_(*after))
+    stmt = stmt.order_by(score.desc(), model.id.desc()).limit(limit + 1)
+
+    result = await db.execute(stmt)
+    hits = [(entity, float(rank), title, excerpt) for entity, rank, title, excerpt in result.all()]
+    if len(hits) <= limit:
+        return hits, None
+
+    hits = hits[:limit]
+    last = hits[-1]
+    return hits, (last[1], last[0].id)
+
+
+async def search_tasks(
+    db: AsyncSession, query: str, limit: int = 20, after: Optional[ScoreCursorKey] = None
+) -> Tuple[List[SearchHit], Optional[ScoreCursorKey]]:
+    """Ranked full-text search over task title, category, description and definition of done."""
+    return await _search(db, Task, query, limit, after)
+
+
+async def search_projects(
+    db: AsyncSession, query: str, limit: int = 20, after: Optional[ScoreCursorKey] = None
+) -> Tuple[List[SearchHit], Optional[ScoreCursorKey]]:
+    """Ranked full-text search over project title, category, description and definition of done."""
+    return await _search(db, Project, query, limit, after)
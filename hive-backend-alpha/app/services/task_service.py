@@ -1,17 +1,47 @@
-from typing import List, Optional
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
+
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import case, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.orm import selectinload
 
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.dependency_graph import DependencyCycleError
+from app.core.fieldsets import load_only_columns
+from app.core.pagination import CursorKey, ScoreCursorKey
+from app.database import after_commit, commit_or_flush
+from app.models.project import Project
 from app.models.task import Task
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import (
+    TaskBulkItemResult, TaskBulkUpdateItem, TaskCreate, TaskFilter, TaskRecommendation, TaskResponse,
+    TaskUpdate
+)
 from app.websockets.connection_manager import manager
-from app.schemas.websocket import TaskStatusUpdate as WSTaskStatusUpdate
+from app.schemas.websocket import TaskStatusUpdate as WSTaskStatusUpdate, TaskStatusBulkUpdate
+from app.services import dashboard_service, dependency_service, project_service
+from app.services.project_service import task_counter_state
+
+VALID_TASK_STATUSES = ["draft", "available", "in_progress", "completed"]
+
+# Recommendation pages keyed by (user id, user skills, cursor, limit). The
+# skills are part of the key so a profile edit never serves stale matches;
+# changes to the pool of open tasks clear the cache after commit.
+recommendation_cache = TTLCache(
+    "task_recommendations",
+    max_size=settings.recommendation_cache_max_size,
+    ttl=settings.recommendation_cache_ttl
+)
 
 
 async def create_task(db: AsyncSession, task_create: TaskCreate, owner: User) -> Task:
+    dependencies = await dependency_service.prepare_dependencies(
+        db, task_create.project_id, task_create.dependencies
+    )
     task = Task(
         title=task_create.title,
         description=task_create.description,
@@ -23,7 +53,7 @@ async def create_task(db: AsyncSession, task_create: TaskCreate, owner: User) ->
         team_size=task_create.team_size,
         due_date=task_create.due_date,
         required_skills=task_create.required_skills,
-        dependencies=task_create.dependencies,
+        dependencies=dependencies,
         definition_of_done=task_create.definition_of_done,
         success_metrics=task_create.success_metrics,
         deliverables=task_create.deliverables,
@@ -31,8 +61,12 @@ async def create_task(db: AsyncSession, task_create: TaskCreate, owner: User) ->
         project_id=task_create.project_id
     )
     db.add(task)
-    await db.commit()
-    await db.refresh(task)
+    await db.flush()
+    counter_changes = [(None, task_counter_state(task))]
+    await project_service.record_task_changes(db, counter_changes)
+    await commit_or_flush(db)
+    await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+    await after_commit(db, lambda: dependency_service.task_saved(task))
     return task
 
 
@@ -45,26 +79,197 @@ async def get_task_by_id(db: AsyncSession, task_id: UUID) -> Optional[Task]:
     return result.scalar_one_or_none()
 
 
-async def get_tasks(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Task]:
+# Newest first, with id as a tie-breaker so pages are deterministic
+TASK_LIST_ORDER = (Task.updated_at.desc(), Task.id.desc())
+DEFAULT_TASK_SORT = "-updated_at"
+
+PRIORITY_RANK = case(
+    {"urgent": 0, "high": 1, "medium": 2, "low": 3},
+    value=Task.priority,
+    else_=4
+)
+
+# Sort keys accepted by the task list; prefix with "-" for descending
+TASK_SORT_KEYS = {
+    "updated_at": Task.updated_at,
+    "created_at": Task.created_at,
+    "impact_points": Task.impact_points,
+    "title": Task.title,
+    "priority": PRIORITY_RANK,
+}
+
+
+def task_sort_order(sort: str) -> tuple:
+    """ORDER BY clauses for a sort key such as "-impact_points"; raises ValueError if unknown."""
+    if sort == DEFAULT_TASK_SORT:
+        return TASK_LIST_ORDER
+    descending = sort.startswith("-")
+    column = TASK_SORT_KEYS.get(sort.lstrip("-"))
+    if column is None:
+        raise ValueError(f"Unknown sort key: {sort}")
+    return (column.desc() if descending else column.asc(), Task.id.desc() if descending else Task.id.asc())
+
+
+def _skills_clause(dialect_name: str, skills: List[str], match_all: bool):
+    if dialect_name == "postgresql":
+        # Both operators are served by the GIN index on required_skills
+        if match_all:
+            return Task.required_skills.contains(skills)
+        return Task.required_skills.has_any(array(skills))
+
+    # Portable fallback (SQLite): match against the expanded JSON array
+    matched = _skills_overlap(dialect_name, skills)
+    return matched == len(set(skills)) if match_all else matched > 0
+
+
+def _skills_overlap(dialect_name: str, skills: List[str]):
+    """How many of ``skills`` a task requires, as a correlated scalar subquery."""
+    if dialect_name == "postgresql":
+        elements = func.jsonb_array_elements_text(Task.required_skills).table_valued("value")
+    else:
+        elements = func.json_each(Task.required_skills).table_valued("value")
+    return (
+        select(func.count(func.distinct(elements.c.value)))
+        .where(elements.c.value.in_(skills))
+        .scalar_subquery()
+    )
+
+
+def apply_task_filters(stmt, filters: Optional[TaskFilter], dialect_name: str):
+    """Add a WHERE clause for each filter that is set."""
+    if filters is None:
+        return stmt
+    for field in ("status", "priority", "category", "owner_id", "assignee_id", "project_id"):
+        value = getattr(filters, field)
+        if value is not None:
+            stmt = stmt.where(getattr(Task, field) == value)
+    if filters.skills:
+        stmt = stmt.where(_skills_clause(dialect_name, filters.skills, filters.skills_match == "all"))
+    return stmt
+
+
+def _dialect_name(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
+async def get_tasks(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[TaskFilter] = None,
+    sort: str = DEFAULT_TASK_SORT,
+    fields: Optional[List[str]] = None
+) -> List[Task]:
+    stmt = apply_task_filters(select(Task), filters, _dialect_name(db))
+    if fields:
+        stmt = stmt.options(load_only_columns(Task, fields))
     result = await db.execute(
-        select(Task)
+        stmt
+        .order_by(*task_sort_order(sort))
         .offset(skip)
         .limit(limit)
     )
     return result.scalars().all()
 
 
+async def get_tasks_page(
+    db: AsyncSession,
+    limit: int = 100,
+    after: Optional[CursorKey] = None,
+    filters: Optional[TaskFilter] = None,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[Task], Optional[CursorKey]]:
+    """Keyset page of tasks ordered by (updated_at, id) descending.
+
+    Returns the tasks and the key of the last one when more rows follow.
+    Uses idx_task_updated_at_id, so deep pages cost the same as the first.
+    """
+    stmt = apply_task_filters(select(Task), filters, _dialect_name(db))
+    if fields:
+        # updated_at is always needed to build the next cursor
+        stmt = stmt.options(load_only_columns(Task, [*fields, "updated_at"]))
+    stmt = stmt.order_by(*TASK_LIST_ORDER).limit(limit + 1)
+    if after is not None:
+        stmt = stmt.where(tuple_(Task.updated_at, Task.id) < tuple_(*after))
+
+    result = await db.execute(stmt)
+    tasks = list(result.scalars().all())
+    if len(tasks) <= limit:
+        return tasks, None
+
+    tasks = tasks[:limit]
+    return tasks, (tasks[-1].updated_at, tasks[-1].id)
+
+
+def recommended_tasks_query(dialect_name: str, skills: List[str], after: Optional[ScoreCursorKey] = None):
+    """Open, unassigned tasks sharing any of ``skills``, best overlap first.
+
+    The overlap filter is the GIN-indexed ``?|`` on PostgreSQL; the score
+    counts matching skills per candidate row.
+    """
+    score = _skills_overlap(dialect_name, skills).label("score")
+    stmt = (
+        select(Task, score)
+        .where(Task.status == "available")
+        .where(Task.assignee_id.is_(None))
+        .where(_skills_clause(dialect_name, skills, match_all=False))
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(score, Task.id) < tuple_(*after))
+    return stmt.order_by(score.desc(), Task.id.desc())
+
+
+async def get_recommended_tasks(
+    db: AsyncSession, user: User, limit: int = 20, after: Optional[ScoreCursorKey] = None
+) -> Tuple[List[TaskRecommendation], Optional[ScoreCursorKey]]:
+    """One page of tasks matching ``user``'s skills, served from the per-user cache when possible."""
+    skills = tuple(sorted(set(user.skills or [])))
+    if not skills:
+        return [], None
+
+    cache_key = (user.id, skills, after, limit)
+    cached = recommendation_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(recommended_tasks_query(_dialect_name(db), list(skills), after).limit(limit + 1))
+    rows = result.all()
+    items = [
+        TaskRecommendation(**TaskResponse.model_validate(task).model_dump(), score=score)
+        for task, score in rows[:limit]
+    ]
+    next_key = (items[-1].score, items[-1].id) if len(rows) > limit else None
+
+    recommendation_cache.set(cache_key, (items, next_key))
+    return items, next_key
+
+
+async def invalidate_recommendations() -> None:
+    """Drop every cached recommendation page; the open task pool changed."""
+    recommendation_cache.clear()
+
+
 async def update_task(db: AsyncSession, task: Task, task_update: TaskUpdate) -> Task:
     old_status = task.status
+    before = task_counter_state(task)
     update_data = task_update.model_dump(exclude_unset=True)
+    if update_data.get("dependencies"):
+        # Raises DependencyCycleError before anything is written
+        update_data["dependencies"] = await dependency_service.prepare_dependencies(
+            db, task.project_id, update_data["dependencies"], task.id
+        )
     for field, value in update_data.items():
         setattr(task, field, value)
-    await db.commit()
-    await db.refresh(task)
+    counter_changes = [(before, task_counter_state(task))]
+    await project_service.record_task_changes(db, counter_changes)
+    await commit_or_flush(db)
+    await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+    await after_commit(db, invalidate_recommendations)
+    await after_commit(db, lambda: dependency_service.task_saved(task))
     
     # Trigger real-time event if status changed
     if "status" in update_data and old_status != task.status:
-        await broadcast_task_status_update(task)
+        await after_commit(db, lambda: broadcast_task_status_update(task))
     
     return task
 
@@ -72,13 +277,18 @@ async def update_task(db: AsyncSession, task: Task, task_update: TaskUpdate) ->
 async def update_task_status(db: AsyncSession, task: Task, new_status: str) -> Task:
     """Update task status and broadcast the change."""
     old_status = task.status
+    before = task_counter_state(task)
     task.status = new_status
-    await db.commit()
-    await db.refresh(task)
+    counter_changes = [(before, task_counter_state(task))]
+    await project_service.record_task_changes(db, counter_changes)
+    await commit_or_flush(db)
     
     # Trigger real-time event
     if old_status != new_status:
-        await broadcast_task_status_update(task)
+        await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+        await after_commit(db, invalidate_recommendations)
+        await after_commit(db, lambda: dependency_service.task_saved(task))
+        await after_commit(db, lambda: broadcast_task_status_update(task))
     
     return task
 
@@ -97,6 +307,197 @@ async def broadcast_task_status_update(task: Task):
         print(f"Failed to broadcast task status update: {e}")
 
 
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'item'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+def _bulk_result(index: int, task_id: Optional[UUID] = None, error: Optional[str] = None) -> TaskBulkItemResult:
+    return TaskBulkItemResult(index=index, id=task_id, ok=error is None, error=error)
+
+
+async def bulk_create_tasks(
+    db: AsyncSession, items: List[Dict[str, Any]], owner: User
+) -> List[TaskBulkItemResult]:
+    """Validate a batch of TaskCreate payloads and insert the valid ones.
+
+    Valid rows go out as one multi-row INSERT in a single transaction;
+    invalid items are reported per index and don't block the rest.
+    Dependencies are resolved as in create_task, and may also name other
+    items of the batch; items on a loop, or depending on one, are rejected.
+    """
+    results: List[Optional[TaskBulkItemResult]] = [None] * len(items)
+    creates: List[Tuple[int, TaskCreate]] = []
+    for index, item in enumerate(items):
+        try:
+            creates.append((index, TaskCreate.model_validate(item)))
+        except ValidationError as e:
+            results[index] = _bulk_result(index, error=_validation_message(e))
+
+    # Check every referenced project with one query
+    project_ids = {create.project_id for _, create in creates if create.project_id}
+    existing_projects = set()
+    if project_ids:
+        result = await db.execute(select(Project.id).where(Project.id.in_(project_ids)))
+        existing_projects = set(result.scalars().all())
+
+    # Add every new task to the batch graphs first, so items can name each other
+    graphs = {}
+    pending: List[Tuple[int, TaskCreate, Task]] = []
+    for index, create in creates:
+        if create.project_id and create.project_id not in existing_projects:
+            results[index] = _bulk_result(index, error="Project not found")
+            continue
+        task = Task(
+            id=uuid.uuid4(),
+            title=create.title,
+            project_id=create.project_id,
+            estimated_hours=create.estimated_hours,
+            dependencies=[]
+        )
+        await dependency_service.check_batch_dependencies(db, graphs, task, [])
+        pending.append((index, create, task))
+
+    # Check the batch as a whole, so a loop fails every task on it
+    new_ids = {task.id for _, _, task in pending}
+    resolved = {}
+    for _, create, task in pending:
+        if create.dependencies:
+            resolved[task.id] = graphs[task.project_id].resolve(create.dependencies, task.id)
+    cycle_errors = dependency_service.batch_cycle_errors(
+        {
+            task.id: set(dependency_service.prerequisite_ids(resolved.get(task.id))) & new_ids
+            for _, _, task in pending
+        },
+        {task.id: task.title for _, _, task in pending}
+    )
+
+    rows = []
+    for index, create, task in pending:
+        if task.id in cycle_errors:
+            results[index] = _bulk_result(index, error=cycle_errors[task.id])
+            continue
+        values = create.model_dump(exclude_none=True)
+        if task.id in resolved:
+            values["dependencies"] = resolved[task.id]
+        rows.append({**values, "id": task.id, "owner_id": owner.id})
+        results[index] = _bulk_result(index, task.id)
+
+    if rows:
+        await db.execute(insert(Task), rows)
+        columns = Task.__table__.c
+        counter_changes = [
+            (None, (
+                row.get("project_id"),
+                row.get("status", columns.status.default.arg),
+                row.get("impact_points", columns.impact_points.default.arg)
+            ))
+            for row in rows
+        ]
+        await project_service.record_task_changes(db, counter_changes)
+        await commit_or_flush(db)
+        await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+        project_ids = {row.get("project_id") for row in rows}
+        await after_commit(db, lambda: dependency_service.invalidate_projects(project_ids))
+    return results
+
+
+async def bulk_update_tasks(
+    db: AsyncSession, items: List[Dict[str, Any]], user: User
+) -> List[TaskBulkItemResult]:
+    """Validate and apply a batch of partial task updates.
+
+    All targets are loaded with one SELECT. Owners may change any field;
+    assignees may only change status, as with PUT /tasks/{id}/status.
+    Updates are written by primary key in one executemany per column set,
+    committed once, and status changes go out as one WebSocket event.
+    """
+    results: List[Optional[TaskBulkItemResult]] = [None] * len(items)
+    updates: List[Tuple[int, TaskBulkUpdateItem]] = []
+    for index, item in enumerate(items):
+        try:
+            updates.append((index, TaskBulkUpdateItem.model_validate(item)))
+        except ValidationError as e:
+            results[index] = _bulk_result(index, error=_validation_message(e))
+
+    tasks = {}
+    if updates:
+        result = await db.execute(select(Task).where(Task.id.in_({item.id for _, item in updates})))
+        tasks = {task.id: task for task in result.scalars().all()}
+
+    rows = []
+    status_changes = []
+    graphs = {}
+    for index, item in updates:
+        task = tasks.get(item.id)
+        changes = item.model_dump(exclude_unset=True, exclude={"id"})
+        if task is None:
+            error = "Task not found"
+        elif task.owner_id != user.id and not (task.assignee_id == user.id and set(changes) <= {"status"}):
+            error = "Not authorized to update this task"
+        elif "status" in changes and changes["status"] not in VALID_TASK_STATUSES:
+            error = f"Invalid status. Must be one of: {', '.join(VALID_TASK_STATUSES)}"
+        else:
+            error = None
+
+        if error is None and changes.get("dependencies"):
+            try:
+                changes["dependencies"] = await dependency_service.check_batch_dependencies(
+                    db, graphs, task, changes["dependencies"]
+                )
+            except DependencyCycleError as e:
+                error = str(e)
+
+        results[index] = _bulk_result(index, item.id, error)
+        if error is None and changes:
+            rows.append({"id": item.id, **changes})
+            if "status" in changes and changes["status"] != task.status:
+                status_changes.append(WSTaskStatusUpdate(
+                    task_id=task.id,
+                    new_status=changes["status"],
+                    assignee_id=task.assignee_id
+                ))
+
+    if rows:
+        counter_changes = []
+        for row in rows:
+            before = task_counter_state(tasks[row["id"]])
+            after = (before[0], row.get("status", before[1]), row.get("impact_points", before[2]))
+            counter_changes.append((before, after))
+        await db.execute(update(Task), rows)
+        await project_service.record_task_changes(db, counter_changes)
+        await commit_or_flush(db)
+        await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+        project_ids = {tasks[row["id"]].project_id for row in rows}
+        # Loaded instances are stale after a bulk UPDATE
+        for row in rows:
+            db.expire(tasks[row["id"]])
+        await after_commit(db, invalidate_recommendations)
+        await after_commit(db, lambda: dependency_service.invalidate_projects(project_ids))
+    if status_changes:
+        await after_commit(db, lambda: broadcast_task_status_bulk_update(status_changes))
+    return results
+
+
+async def broadcast_task_status_bulk_update(updates: List[WSTaskStatusUpdate]):
+    """Broadcast many status changes as a single WebSocket event."""
+    try:
+        message = TaskStatusBulkUpdate(updates=updates)
+        await manager.broadcast(message.model_dump(mode="json"))
+    except Exception as e:
+        # Log error but don't fail the operation
+        print(f"Failed to broadcast bulk task status update: {e}")
+
+
 async def delete_task(db: AsyncSession, task: Task) -> None:
+    task_id, project_id = task.id, task.project_id
+    before = task_counter_state(task)
     await db.delete(task)
-    await db.commit()
\ No newline at end of file
+    counter_changes = [(before, None)]
+    await project_service.record_task_changes(db, counter_changes)
+    await commit_or_flush(db)
+    await after_commit(db, lambda: dashboard_service.tasks_changed(counter_changes))
+    await after_commit(db, invalidate_recommendations)
+    await after_commit(db, lambda: dependency_service.task_removed(task_id, project_id))
\ No newline at end of file
@@ -0,0 +1,107 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+
+def hash_refresh_token(token: str) -> str:
+    """Refresh tokens are 256-bit random strings, so a fast hash is sufficient."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def _new_token(user_id: UUID, family_id: UUID) -> Tuple[str, RefreshToken]:
+    token = secrets.token_urlsafe(32)
+    record = RefreshToken(
+        token_hash=hash_refresh_token(token),
+        user_id=user_id,
+        family_id=family_id,
+        expires_at=_utcnow() + timedelta(days=settings.refresh_token_expire_days)
+    )
+    return token, record
+
+
+async def issue_refresh_token(db: AsyncSession, user_id: UUID) -> str:
+    """Issue a refresh token that starts a new rotation family."""
+    token, record = _new_token(user_id, uuid.uuid4())
+    db.add(record)
+    await db.commit()
+    return token
+
+
+async def revoke_family(db: AsyncSession, family_id: UUID) -> None:
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=_utcnow())
+    )
+
+
+async def rotate_refresh_token(db: AsyncSession, token: str) -> Optional[Tuple[UUID, str]]:
+    """Exchange a refresh token for a new one in the same family.
+
+    Returns (user_id, new_token), or None if the token is unknown, expired or
+    revoked, or its user is gone or inactive. The token is consumed by a
+    conditional UPDATE, so of concurrent rotations of one token exactly one
+    wins. Presenting an already-rotated token means it leaked, so the whole
+    family is revoked.
+    """
+    token_hash = hash_refresh_token(token)
+    now = _utcnow()
+    result = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == token_hash)
+        .where(RefreshToken.revoked_at.is_(None))
+        .where(RefreshToken.expires_at > now)
+        .values(revoked_at=now)
+        .returning(RefreshToken.user_id, RefreshToken.family_id)
+        .execution_options(synchronize_session=False)
+    )
+    rotated = result.one_or_none()
+    if rotated is None:
+        result = await db.execute(
+            select(RefreshToken.family_id, RefreshToken.revoked_at)
+            .where(RefreshToken.token_hash == token_hash)
+        )
+        record = result.one_or_none()
+        if record is not None and record.revoked_at is not None:
+            await revoke_family(db, record.family_id)
+            await db.commit()
+        return None
+
+    user_id, family_id = rotated
+    result = await db.execute(select(User.is_active).where(User.id == user_id))
+    if not result.scalar_one_or_none():
+        # Keep the token consumed; its user can no longer sign in
+        await db.commit()
+        return None
+
+    new_token, new_record = _new_token(user_id, family_id)
+    db.add(new_record)
+    await db.commit()
+    return user_id, new_token
+
+
+async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
+    """Revoke a refresh token and every token rotated from the same login."""
+    result = await db.execute(
+        select(RefreshToken.family_id).where(RefreshToken.token_hash == hash_refresh_token(token))
+    )
+    family_id = result.scalar_one_or_none()
+    if family_id is None:
+        return False
+
+    await revoke_family(db, family_id)
+    await db.commit()
+    return True
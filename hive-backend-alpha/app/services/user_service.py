@@ -1,18 +1,29 @@
 from typing import Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.security import password_hasher
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.dashboard_service import counters as dashboard_counters, user_counter_state
+
+# Column snapshots of recently authenticated users, keyed by user id
+user_cache = TTLCache("users", max_size=settings.user_cache_max_size, ttl=settings.user_cache_ttl)
 
 
 async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
-    user = User(email=user_create.email)
-    user.set_password(user_create.password)
+    user = User(
+        email=user_create.email,
+        hashed_password=await password_hasher.hash(user_create.password)
+    )
     db.add(user)
     await db.commit()
-    await db.refresh(user)
+    dashboard_counters.user_changed(None, user_counter_state(user))
     return user
 
 
@@ -26,18 +37,45 @@ async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
     return result.scalar_one_or_none()
 
 
+def _snapshot(user: User) -> dict:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+async def get_cached_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
+    """Get a user, serving from the principal cache when possible.
+
+    A cache hit is attached to ``db`` as a persistent instance without
+    emitting a query, so it can still be modified and committed normally.
+    """
+    snapshot = user_cache.get(user_id)
+    if snapshot is None:
+        user = await get_user_by_id(db, user_id)
+        if user is not None:
+            user_cache.set(user_id, _snapshot(user))
+        return user
+
+    existing = db.identity_map.get(identity_key(User, user_id))
+    if existing is not None:
+        return existing
+
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
+
 async def update_user(db: AsyncSession, user: User, user_update: UserUpdate) -> User:
     update_data = user_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(user, field, value)
     await db.commit()
-    await db.refresh(user)
+    user_cache.invalidate(user.id)
     return user
 
 
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
     user = await get_user_by_email(db, email)
-    if not user or not user.verify_password(password):
+    if not user or not await password_hasher.verify(password, user.hashed_password):
         return None
     return user
 
@@ -48,9 +86,11 @@ async def set_user_online_status(db: AsyncSession, user_id: UUID, is_online: boo
     if not user:
         return None
     
+    before = user_counter_state(user)
     user.is_online = is_online
     await db.commit()
-    await db.refresh(user)
+    user_cache.invalidate(user.id)
+    dashboard_counters.user_changed(before, user_counter_state(user))
     return user
 
 
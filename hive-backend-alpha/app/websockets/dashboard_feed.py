@@ -0,0 +1,94 @@
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Set
+
+from fastapi import WebSocket
+
+from app.config import settings
+from app.schemas.websocket import DashboardDelta, DashboardSnapshot
+from app.services import dashboard_service
+from app.services.dashboard_service import DashboardCounters
+
+
+class DashboardFeed:
+    """Pushes the dashboard counters to subscribed WebSocket clients.
+
+    A new subscriber gets a snapshot of every stat, then delta frames with
+    only the stats that changed (as absolute values, so frames can be applied
+    in any state). Changes are coalesced: at most ``max_frames_per_second``
+    deltas go out, each carrying the latest values. Frames are built from the
+    in-process counters, so more viewers never means more queries.
+
+    Not thread-safe; intended to be used from the event loop only.
+    """
+
+    def __init__(self, counters: DashboardCounters, max_frames_per_second: float):
+        self.counters = counters
+        self.min_interval = 1.0 / max_frames_per_second
+        self.subscribers: Set[WebSocket] = set()
+        self.sequence = 0
+        self._sent: Dict[str, int] = {}
+        self._last_frame = float("-inf")
+        self._dirty = False
+        self._flush: Optional[asyncio.Task] = None
+        counters.add_listener(self.changed)
+
+    async def subscribe(self, websocket: WebSocket) -> None:
+        """Add a subscriber and send it a snapshot."""
+        if not self.counters.seeded:
+            try:
+                await dashboard_service.seed_counters_from_database()
+            except Exception as e:
+                print(f"Failed to seed dashboard counters: {e}")
+
+        stats = self.counters.stats()
+        if not self.subscribers:
+            # Nothing was sent while nobody listened; start diffing from here
+            self._sent = stats
+        self.subscribers.add(websocket)
+        snapshot = DashboardSnapshot(sequence=self.sequence, stats=stats)
+        await websocket.send_text(json.dumps(snapshot.model_dump()))
+
+    def unsubscribe(self, websocket: WebSocket) -> None:
+        self.subscribers.discard(websocket)
+
+    def changed(self) -> None:
+        """Counter listener: schedule a delta frame, unless one is already due."""
+        if not self.subscribers:
+            return
+        self._dirty = True
+        if self._flush is not None and not self._flush.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush = loop.create_task(self._send_deltas())
+
+    async def _send_deltas(self) -> None:
+        while self._dirty and self.subscribers:
+            delay = self._last_frame + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # Changes from here on are picked up by the next round
+            self._dirty = False
+
+            stats = self.counters.stats()
+            changes = {key: value for key, value in stats.items() if self._sent.get(key) != value}
+            if not changes:
+                continue
+            self._sent = stats
+            self._last_frame = time.monotonic()
+            self.sequence += 1
+            message = json.dumps(DashboardDelta(sequence=self.sequence, changes=changes).model_dump())
+            for websocket in list(self.subscribers):
+                try:
+                    await websocket.send_text(message)
+                except Exception:
+                    # Connection is probably closed
+                    self.subscribers.discard(websocket)
+
+
+# Global dashboard feed instance
+dashboard_feed = DashboardFeed(dashboard_service.counters, settings.dashboard_feed_max_frames_per_second)
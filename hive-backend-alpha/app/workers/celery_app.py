@@ -22,6 +22,12 @@ celery_app.conf.update(
     task_soft_time_limit=25 * 60,  # 25 minutes
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    beat_schedule={
+        "reconcile-project-counters": {
+            "task": "app.workers.tasks.reconcile_project_counters",
+            "schedule": settings.project_counter_reconcile_interval,
+        },
+    },
 )
 
 # Auto-discover tasks
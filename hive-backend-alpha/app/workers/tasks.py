@@ -69,4 +69,29 @@ def cleanup_old_data(self):
         "items_processed": 0,
         "status": "completed",
         "task_id": self.request.id
-    }
\ No newline at end of file
+    }
+
+
+@celery_app.task(bind=True)
+def reconcile_project_counters(self):
+    """Periodic task correcting projects' denormalized task counters."""
+    from app.database import async_session, engine
+    from app.services.project_service import reconcile_task_counters
+
+    async def reconcile():
+        try:
+            async with async_session() as db:
+                return await reconcile_task_counters(db)
+        finally:
+            # Pooled connections belong to this event loop, which asyncio.run closes
+            await engine.dispose()
+
+    fixed = asyncio.run(reconcile())
+    if fixed:
+        print(f"Reconciled task counters of {fixed} projects")
+
+    return {
+        "projects_fixed": fixed,
+        "status": "completed",
+        "task_id": self.request.id
+    }
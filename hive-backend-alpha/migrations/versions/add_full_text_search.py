@@ -0,0 +1,46 @@
+"""add_full_text_search
+
+Revision ID: add_full_text_search
+Revises: add_task_updated_at_index
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_full_text_search'
+down_revision = 'add_task_updated_at_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Generated tsvector columns + GIN indexes; SQLite builds its FTS5 tables at create_all
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(category, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C') || "
+        "setweight(to_tsvector('english', coalesce(definition_of_done, '')), 'D')) STORED"
+    )
+    op.execute('CREATE INDEX IF NOT EXISTS idx_task_search_vector ON tasks USING gin (search_vector)')
+    op.execute(
+        "ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(category, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C') || "
+        "setweight(to_tsvector('english', coalesce(definition_of_done::text, '')), 'D')) STORED"
+    )
+    op.execute('CREATE INDEX IF NOT EXISTS idx_project_search_vector ON projects USING gin (search_vector)')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('idx_project_search_vector', table_name='projects')
+    op.drop_column('projects', 'search_vector')
+    op.drop_index('idx_task_search_vector', table_name='tasks')
+    op.drop_column('tasks', 'search_vector')
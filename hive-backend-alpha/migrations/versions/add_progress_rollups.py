@@ -0,0 +1,46 @@
+"""add_progress_rollups
+
+Revision ID: add_progress_rollups
+Revises: add_project_task_counters
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_progress_rollups'
+down_revision = 'add_project_task_counters'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('milestone_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('tasks', sa.Column('completed_milestones', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('tasks', sa.Column('progress', sa.Float(), nullable=False, server_default='0'))
+    op.add_column('projects', sa.Column('progress', sa.Float(), nullable=False, server_default='0'))
+
+    # Backfill; updated_at is left alone
+    op.execute(
+        'UPDATE tasks SET '
+        'milestone_count = (SELECT COUNT(*) FROM milestones WHERE milestones.task_id = tasks.id), '
+        'completed_milestones = (SELECT COUNT(*) FROM milestones '
+        'WHERE milestones.task_id = tasks.id AND milestones.is_completed)'
+    )
+    op.execute(
+        'UPDATE tasks SET progress = CAST(completed_milestones AS FLOAT) / milestone_count '
+        'WHERE milestone_count > 0'
+    )
+    op.execute(
+        'UPDATE projects SET progress = CAST(completed_impact_points AS FLOAT) / task_impact_points '
+        'WHERE task_impact_points > 0'
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('projects', 'progress')
+    op.drop_column('tasks', 'progress')
+    op.drop_column('tasks', 'completed_milestones')
+    op.drop_column('tasks', 'milestone_count')
@@ -0,0 +1,48 @@
+"""add_project_task_counters
+
+Revision ID: add_project_task_counters
+Revises: add_full_text_search
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_task_counters'
+down_revision = 'add_full_text_search'
+branch_labels = None
+depends_on = None
+
+# Counter column -> expression summed over the project's tasks
+COUNTERS = {
+    'task_count': '1',
+    'draft_tasks': "CASE WHEN status = 'draft' THEN 1 ELSE 0 END",
+    'available_tasks': "CASE WHEN status = 'available' THEN 1 ELSE 0 END",
+    'in_progress_tasks': "CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END",
+    'completed_tasks': "CASE WHEN status = 'completed' THEN 1 ELSE 0 END",
+    'task_impact_points': 'COALESCE(impact_points, 0)',
+    'completed_impact_points': "CASE WHEN status = 'completed' THEN COALESCE(impact_points, 0) ELSE 0 END",
+}
+
+
+def upgrade() -> None:
+    for name in COUNTERS:
+        op.add_column('projects', sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from existing tasks; updated_at is left alone
+    assignments = ', '.join(
+        f'{name} = (SELECT COALESCE(SUM({expression}), 0) FROM tasks WHERE tasks.project_id = projects.id)'
+        for name, expression in COUNTERS.items()
+    )
+    op.execute(f'UPDATE projects SET {assignments}')
+
+    # The project list orders by updated_at
+    op.create_index('idx_project_updated_at', 'projects', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_project_updated_at', table_name='projects')
+    for name in reversed(list(COUNTERS)):
+        op.drop_column('projects', name)
@@ -0,0 +1,40 @@
+"""add_refresh_tokens_table
+
+Revision ID: add_refresh_tokens_table
+Revises: add_chat_messages_table, add_projects
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_refresh_tokens_table'
+down_revision = ('add_chat_messages_table', 'add_projects')
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('refresh_tokens',
+    sa.Column('token_hash', sa.String(length=64), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('family_id', sa.UUID(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_refresh_tokens_user_id_users')),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_refresh_tokens')),
+    sa.UniqueConstraint('token_hash', name=op.f('uq_refresh_tokens_token_hash'))
+    )
+    op.create_index('idx_refresh_token_user_id', 'refresh_tokens', ['user_id'])
+    op.create_index('idx_refresh_token_family_id', 'refresh_tokens', ['family_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_refresh_token_family_id', table_name='refresh_tokens')
+    op.drop_index('idx_refresh_token_user_id', table_name='refresh_tokens')
+    op.drop_table('refresh_tokens')
@@ -0,0 +1,24 @@
+"""add_task_updated_at_index
+
+Revision ID: add_task_updated_at_index
+Revises: add_refresh_tokens_table
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_task_updated_at_index'
+down_revision = 'add_refresh_tokens_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Backs keyset pagination ordered by (updated_at, id)
+    op.create_index('idx_task_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_task_updated_at_id', table_name='tasks')
@@ -9,6 +9,8 @@ from app.main import app
 from app.database import get_db, Base
 from app.models.user import User
 from app.core.security import create_access_token
+from app.core.query_stats import instrument_engine
+from app.services.dashboard_service import counters as dashboard_counters
 
 # Test database URL - use TEST_DATABASE_URL env var or in-memory SQLite as fallback
 TEST_DATABASE_URL = os.getenv(
@@ -30,11 +32,21 @@ else:
         poolclass=StaticPool,
     )
 
+instrument_engine(test_engine.sync_engine)
+
 TestSessionLocal = async_sessionmaker(
     test_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_dashboard_counters():
+    """Start every test with unseeded dashboard counters (each test has a fresh database)."""
+    dashboard_counters.reset()
+    yield
+    dashboard_counters.reset()
+
+
 @pytest_asyncio.fixture
 async def db_session():
     """Create a fresh database session for each test."""
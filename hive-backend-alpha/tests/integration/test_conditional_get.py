@@ -0,0 +1,137 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from httpx import AsyncClient
+
+from app.core.query_stats import track_queries
+from app.models.milestone import Milestone
+from app.models.task import Task
+from app.models.user import User
+
+
+@pytest_asyncio.fixture
+async def task(db_session, test_user):
+    task = Task(title="Cached", owner_id=test_user.id)
+    db_session.add(task)
+    await db_session.commit()
+    return task
+
+
+class TestConditionalGet:
+    """Test ETag / Last-Modified handling."""
+
+    @pytest.mark.asyncio
+    async def test_task_if_none_match(self, client: AsyncClient, task, auth_headers):
+        """Test a matching ETag answers 304 from the version query alone."""
+        first = await client.get(f"/api/v1/tasks/{task.id}", headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.headers["last-modified"]
+
+        with track_queries() as stats:
+            second = await client.get(
+                f"/api/v1/tasks/{task.id}", headers={**auth_headers, "If-None-Match": etag}
+            )
+
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+        assert not any("tasks.title" in shape for shape in stats.shapes)
+
+    @pytest.mark.asyncio
+    async def test_unconditional_get_is_one_query(self, client: AsyncClient, task, auth_headers):
+        """Test a GET without validators loads the task once and derives its validators from it."""
+        with track_queries() as stats:
+            response = await client.get(f"/api/v1/tasks/{task.id}", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["etag"] and response.headers["last-modified"]
+        assert len([shape for shape in stats.shapes if "FROM tasks" in shape]) == 1
+
+    @pytest.mark.asyncio
+    async def test_task_etag_changes_on_update(self, client: AsyncClient, db_session, task, auth_headers):
+        """Test a stale ETag gets the full, updated body."""
+        first = await client.get(f"/api/v1/tasks/{task.id}", headers=auth_headers)
+
+        task.title = "Renamed"
+        task.updated_at = datetime.now(timezone.utc) + timedelta(seconds=5)
+        await db_session.commit()
+
+        second = await client.get(
+            f"/api/v1/tasks/{task.id}", headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+        assert second.status_code == 200
+        assert second.json()["title"] == "Renamed"
+        assert second.headers["etag"] != first.headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_task_if_modified_since(self, client: AsyncClient, task, auth_headers):
+        """Test If-Modified-Since compares against updated_at."""
+        future = format_datetime(datetime.now(timezone.utc) + timedelta(days=1), usegmt=True)
+        past = format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc), usegmt=True)
+
+        response = await client.get(
+            f"/api/v1/tasks/{task.id}", headers={**auth_headers, "If-Modified-Since": future}
+        )
+        assert response.status_code == 304
+
+        response = await client.get(
+            f"/api/v1/tasks/{task.id}", headers={**auth_headers, "If-Modified-Since": past}
+        )
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_milestone_conditional_keeps_permissions(
+        self, client: AsyncClient, db_session, task, auth_headers
+    ):
+        """Test milestone ETags, with the permission check still applied."""
+        milestone = Milestone(title="Step", task_id=task.id)
+        db_session.add(milestone)
+        await db_session.commit()
+
+        first = await client.get(f"/api/v1/milestones/{milestone.id}", headers=auth_headers)
+        assert first.status_code == 200
+
+        second = await client.get(
+            f"/api/v1/milestones/{milestone.id}",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+        assert second.status_code == 304
+
+        other = User(email="other@example.com", hashed_password="x")
+        db_session.add(other)
+        await db_session.flush()
+        task.owner_id = other.id
+        await db_session.commit()
+        third = await client.get(
+            f"/api/v1/milestones/{milestone.id}",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+        assert third.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_list_body_etag(self, client: AsyncClient, task, auth_headers):
+        """Test list responses carry a body ETag honoured by If-None-Match."""
+        first = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = await client.get("/api/v1/tasks/", headers={**auth_headers, "If-None-Match": etag})
+        assert second.status_code == 304
+
+        third = await client.get("/api/v1/tasks/", headers={**auth_headers, "If-None-Match": '"stale"'})
+        assert third.status_code == 200
+        assert third.json() == first.json()
+
+    @pytest.mark.asyncio
+    async def test_list_not_modified_keeps_headers(self, client: AsyncClient, task, auth_headers):
+        """Test a body-ETag 304 keeps the response's other headers but drops its body headers."""
+        headers = {**auth_headers, "Origin": "http://example.com"}
+        first = await client.get("/api/v1/tasks/", headers=headers)
+
+        second = await client.get("/api/v1/tasks/", headers={**headers, "If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
+        assert second.headers["access-control-allow-origin"] == "*"
+        assert "content-type" not in second.headers
+        assert "content-length" not in second.headers
@@ -1,7 +1,11 @@
 import pytest
 from httpx import AsyncClient
+from app.core.query_stats import track_queries
 from app.models.user import User
 from app.models.task import Task
+from app.services import user_service
+from app.services.dashboard_service import counters
+from app.services.task_service import recommendation_cache
 
 
 class TestDashboardAPI:
@@ -186,4 +190,58 @@ class TestUserOnlineEndpoint:
     async def test_users_online_unauthorized(self, client: AsyncClient):
         """Test users online endpoint without authentication."""
         response = await client.get("/api/v1/users/online")
-        assert response.status_code == 401
\ No newline at end of file
+        assert response.status_code == 401
+
+class TestDashboardCounters:
+    """Test dashboard endpoints serve incrementally maintained counters."""
+    
+    @pytest.mark.asyncio
+    async def test_writes_update_counters_without_queries(
+        self, client: AsyncClient, db_session, test_user, auth_headers
+    ):
+        """Test task writes through the API show up on the dashboard without COUNT queries."""
+        await client.get("/api/v1/dashboard/summary")
+        
+        response = await client.post("/api/v1/tasks/", json={"title": "Plant"}, headers=auth_headers)
+        task_id = response.json()["id"]
+        await client.put(f"/api/v1/tasks/{task_id}/status", json={"status": "in_progress"}, headers=auth_headers)
+        
+        with track_queries() as stats:
+            summary = await client.get("/api/v1/dashboard/summary")
+            live = await client.get("/api/v1/dashboard/live-status")
+        
+        assert stats.count == 0
+        assert summary.json()["tasks"]["total"] == 1
+        assert summary.json()["tasks"]["by_status"]["in_progress"] == 1
+        assert summary.json()["tasks"]["by_status"]["draft"] == 0
+        assert live.json()["active_tasks_count"] == 1
+        assert live.json()["recent_activity_count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_project_delete_updates_counters(self, client: AsyncClient, db_session, test_user, auth_headers):
+        """Test tasks removed with their project leave the counters and recommendations."""
+        await client.get("/api/v1/dashboard/summary")
+        response = await client.post("/api/v1/projects/", json={"title": "Garden"}, headers=auth_headers)
+        project_id = response.json()["id"]
+        for title in ("Dig", "Plant", "Water"):
+            await client.post("/api/v1/tasks/", json={"title": title, "project_id": project_id}, headers=auth_headers)
+        assert counters.total_tasks == 3
+        recommendation_cache.set("stale", ([], None))
+        
+        response = await client.delete(f"/api/v1/projects/{project_id}", headers=auth_headers)
+        assert response.status_code in (200, 204)
+        
+        assert counters.total_tasks == 0
+        assert recommendation_cache.get("stale") is None
+        response = await client.get("/api/v1/dashboard/summary")
+        assert response.json()["tasks"]["total"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_online_status_updates_counters(self, client: AsyncClient, db_session, test_user):
+        """Test user_service online toggles move the online count."""
+        await client.get("/api/v1/dashboard/live-status")
+        
+        await user_service.set_user_online_status(db_session, test_user.id, True)
+        
+        response = await client.get("/api/v1/dashboard/live-status")
+        assert response.json()["online_users_count"] == 1
@@ -0,0 +1,68 @@
+import pytest
+from httpx import AsyncClient
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.core.metrics import Counter, Gauge, HistogramMetric
+from app.websockets.connection_manager import manager
+
+
+def test_histogram_metric_text_format():
+    """Test histogram families render buckets, sum and count per label set."""
+    metric = HistogramMetric("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    metric.observe(0.05, route="/a")
+    metric.observe(2.0, route="/a")
+
+    lines = metric.render()
+
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 2' in lines
+    assert 'latency_seconds_count{route="/a"} 2' in lines
+
+
+def test_counter_and_gauge_text_format():
+    """Test counters and callback gauges render one sample per label set."""
+    counter = Counter("jobs_total", "Jobs.", ("kind",))
+    counter.inc(kind="a")
+    counter.inc(2, kind="a")
+    gauge = Gauge("queue_depth", "Depth.", collect=lambda: [((), 7)])
+
+    assert 'jobs_total{kind="a"} 3' in counter.render()
+    assert "queue_depth 7" in gauge.render()
+
+
+class TestMetricsEndpoint:
+    """Test the /metrics endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_records_route_templates(self, client: AsyncClient, auth_headers):
+        """Test requests are counted per route template, not raw path."""
+        task_id = uuid4()
+        await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+        await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert str(task_id) not in body
+        assert 'http_requests_total{method="GET",route="/api/v1/tasks/{task_id}",status="404"}' in body
+        assert 'route="/api/v1/tasks/{task_id}",le="+Inf"}' in body
+        assert 'http_requests_total{method="GET",route="/api/v1/tasks/",status="200"}' in body
+        assert "http_response_size_bytes_count" in body
+        assert "http_requests_in_flight" in body
+
+    @pytest.mark.asyncio
+    async def test_websocket_gauges(self, client: AsyncClient):
+        """Test WebSocket gauges reflect the connection manager."""
+        user_id = uuid4()
+        manager.active_connections[user_id] = [MagicMock(), MagicMock()]
+        try:
+            response = await client.get("/metrics")
+        finally:
+            del manager.active_connections[user_id]
+
+        assert "websocket_connections 2" in response.text
+        assert "websocket_connected_users 1" in response.text
@@ -0,0 +1,123 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timezone
+from httpx import AsyncClient
+
+from app.core.query_stats import track_queries
+from app.models.project import Project
+from app.schemas.milestone import MilestoneCreate, MilestoneUpdate
+from app.schemas.task import TaskCreate
+from app.services import milestone_service, task_service
+
+
+@pytest_asyncio.fixture
+async def project(db_session, test_user):
+    project = Project(title="Garden", owner_id=test_user.id)
+    db_session.add(project)
+    await db_session.commit()
+    return project
+
+
+@pytest_asyncio.fixture
+async def task(db_session, project, test_user):
+    return await task_service.create_task(
+        db_session, TaskCreate(title="Dig", project_id=project.id, impact_points=30), test_user
+    )
+
+
+class TestTaskProgress:
+    """Test milestone writes roll up into task progress."""
+
+    @pytest.mark.asyncio
+    async def test_milestone_lifecycle(self, db_session, task):
+        """Test creating, completing, reopening and deleting milestones updates the task."""
+        first = await milestone_service.create_milestone(db_session, MilestoneCreate(title="A", task_id=task.id))
+        second = await milestone_service.create_milestone(db_session, MilestoneCreate(title="B", task_id=task.id))
+        assert (task.milestone_count, task.completed_milestones, task.progress) == (2, 0, 0.0)
+
+        await milestone_service.update_milestone(db_session, first, MilestoneUpdate(is_completed=True))
+        assert (task.completed_milestones, task.progress) == (1, 0.5)
+
+        # Repeating the same value changes nothing
+        await milestone_service.update_milestone(db_session, first, MilestoneUpdate(is_completed=True))
+        assert task.completed_milestones == 1
+
+        await milestone_service.delete_milestone(db_session, second)
+        assert (task.milestone_count, task.completed_milestones, task.progress) == (1, 1, 1.0)
+
+        await milestone_service.update_milestone(db_session, first, MilestoneUpdate(is_completed=False))
+        await db_session.refresh(task)
+        assert (task.milestone_count, task.completed_milestones, task.progress) == (1, 0, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_task_response_includes_progress(
+        self, client: AsyncClient, db_session, task, auth_headers
+    ):
+        """Test task responses carry progress from the task row, and its ETag changes with it."""
+        # SQLite timestamps have one-second resolution; start from an older version
+        task.updated_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        await db_session.commit()
+        response = await client.get(f"/api/v1/tasks/{task.id}", headers=auth_headers)
+        etag = response.headers["etag"]
+
+        milestone = await milestone_service.create_milestone(db_session, MilestoneCreate(title="A", task_id=task.id))
+        response = await client.put(
+            f"/api/v1/milestones/{milestone.id}", json={"is_completed": True}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        response = await client.get(f"/api/v1/tasks/{task.id}", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert (response.json()["milestone_count"], response.json()["progress"]) == (1, 1.0)
+
+        with track_queries() as stats:
+            response = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert not [shape for shape in stats.shapes if "FROM milestones" in shape]
+        assert response.json()[0]["progress"] == 1.0
+
+
+class TestProjectProgress:
+    """Test task status changes roll up into impact-weighted project progress."""
+
+    @pytest.mark.asyncio
+    async def test_weighted_by_impact_points(
+        self, client: AsyncClient, db_session, project, task, test_user, auth_headers
+    ):
+        """Test completing tasks moves project progress by their share of impact points."""
+        other = await task_service.create_task(
+            db_session, TaskCreate(title="Plant", project_id=project.id, impact_points=10), test_user
+        )
+        await task_service.update_task_status(db_session, other, "completed")
+
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert response.json()[0]["progress"] == pytest.approx(0.25)
+
+        await task_service.update_task_status(db_session, task, "completed")
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert response.json()[0]["progress"] == pytest.approx(1.0)
+
+        await task_service.delete_task(db_session, task)
+        await task_service.delete_task(db_session, other)
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert response.json()[0]["progress"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_project_response_includes_progress(
+        self, client: AsyncClient, db_session, project, task, auth_headers
+    ):
+        """Test GET /projects/{id} carries progress, and its ETag changes with the counters."""
+        response = await client.get(f"/api/v1/projects/{project.id}", headers=auth_headers)
+        assert response.json()["progress"] == 0.0
+        etag = response.headers["etag"]
+
+        await task_service.update_task_status(db_session, task, "completed")
+
+        headers = {**auth_headers, "If-None-Match": etag}
+        response = await client.get(f"/api/v1/projects/{project.id}", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["progress"] == 1.0
+        assert response.headers["etag"] != etag
+
+        headers = {**auth_headers, "If-None-Match": response.headers["etag"]}
+        response = await client.get(f"/api/v1/projects/{project.id}", headers=headers)
+        assert response.status_code == 304
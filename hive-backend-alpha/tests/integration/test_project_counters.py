@@ -0,0 +1,123 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from app.core.query_stats import track_queries
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.task import TaskCreate, TaskUpdate
+from app.services import assignment_service, task_service
+from app.services.project_service import reconcile_task_counters
+
+
+@pytest_asyncio.fixture
+async def project(db_session, test_user):
+    project = Project(title="Garden", owner_id=test_user.id)
+    db_session.add(project)
+    await db_session.commit()
+    return project
+
+
+async def _counters(db_session, project):
+    result = await db_session.execute(select(
+        Project.task_count, Project.draft_tasks, Project.available_tasks, Project.in_progress_tasks,
+        Project.completed_tasks, Project.task_impact_points, Project.completed_impact_points,
+        Project.updated_at
+    ).where(Project.id == project.id))
+    return result.one()._asdict()
+
+
+class TestProjectTaskCounters:
+    """Test task writes keep the project counters current."""
+
+    @pytest.mark.asyncio
+    async def test_create_status_change_and_delete(self, db_session, project, test_user):
+        """Test counters follow a task through its lifecycle without touching updated_at."""
+        before = await _counters(db_session, project)
+        task = await task_service.create_task(
+            db_session, TaskCreate(title="Dig", impact_points=40, project_id=project.id), test_user
+        )
+        counters = await _counters(db_session, project)
+        assert (counters["task_count"], counters["draft_tasks"], counters["task_impact_points"]) == (1, 1, 40)
+        assert counters["updated_at"] == before["updated_at"]
+
+        await task_service.update_task(db_session, task, TaskUpdate(status="completed", impact_points=50))
+        counters = await _counters(db_session, project)
+        assert (counters["draft_tasks"], counters["completed_tasks"]) == (0, 1)
+        assert (counters["task_impact_points"], counters["completed_impact_points"]) == (50, 50)
+
+        await task_service.delete_task(db_session, task)
+        counters = await _counters(db_session, project)
+        assert all(counters[name] == 0 for name in counters if name != "updated_at")
+
+    @pytest.mark.asyncio
+    async def test_claim_and_unassign(self, db_session, project, test_user):
+        """Test claiming moves a task from available to in progress, and unassigning back."""
+        owner = User(email="owner@example.com", hashed_password="x")
+        db_session.add(owner)
+        await db_session.commit()
+        task = await task_service.create_task(
+            db_session, TaskCreate(title="Water", project_id=project.id), owner
+        )
+        await task_service.update_task_status(db_session, task, "available")
+
+        task = await assignment_service.claim_task(db_session, task.id, test_user)
+        counters = await _counters(db_session, project)
+        assert (counters["available_tasks"], counters["in_progress_tasks"]) == (0, 1)
+
+        await assignment_service.unassign_task(db_session, task)
+        counters = await _counters(db_session, project)
+        assert (counters["available_tasks"], counters["in_progress_tasks"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_and_update(self, db_session, project, test_user):
+        """Test batches update the counters with the same results as single writes."""
+        await task_service.bulk_create_tasks(db_session, [
+            {"title": "A", "project_id": str(project.id)},
+            {"title": "B", "project_id": str(project.id), "impact_points": 10},
+        ], test_user)
+        counters = await _counters(db_session, project)
+        assert (counters["task_count"], counters["draft_tasks"], counters["task_impact_points"]) == (2, 2, 110)
+
+        result = await db_session.execute(select(Task.id).where(Task.project_id == project.id))
+        await task_service.bulk_update_tasks(
+            db_session, [{"id": str(task_id), "status": "completed"} for task_id in result.scalars()], test_user
+        )
+        counters = await _counters(db_session, project)
+        assert (counters["draft_tasks"], counters["completed_tasks"], counters["completed_impact_points"]) == (0, 2, 110)
+
+    @pytest.mark.asyncio
+    async def test_reconcile_fixes_drift(self, db_session, project, test_user):
+        """Test reconciliation rewrites counters that no longer match the tasks."""
+        await task_service.create_task(db_session, TaskCreate(title="Dig", project_id=project.id), test_user)
+        await db_session.execute(update(Project).values(task_count=7, completed_tasks=3))
+        await db_session.commit()
+
+        assert await reconcile_task_counters(db_session) == 1
+        counters = await _counters(db_session, project)
+        assert (counters["task_count"], counters["completed_tasks"]) == (1, 0)
+        assert await reconcile_task_counters(db_session) == 0
+
+
+class TestProjectListCounters:
+    """Test the project list reads counters instead of aggregating tasks."""
+
+    @pytest.mark.asyncio
+    async def test_list_is_one_query_without_tasks(
+        self, client: AsyncClient, db_session, project, test_user, auth_headers
+    ):
+        """Test listing projects doesn't join or group the tasks table."""
+        await task_service.create_task(db_session, TaskCreate(title="Dig", project_id=project.id), test_user)
+
+        with track_queries() as stats:
+            response = await client.get("/api/v1/projects/", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()[0]["task_count"] == 1
+        assert response.json()[0]["draft_tasks"] == 1
+        project_selects = [shape for shape in stats.shapes if "FROM projects" in shape]
+        assert len(project_selects) == 1
+        assert "JOIN" not in project_selects[0]
+        assert "GROUP BY" not in project_selects[0]
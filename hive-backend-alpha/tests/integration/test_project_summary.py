@@ -0,0 +1,86 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+
+from app.core.query_stats import track_queries
+from app.models.project import Project
+from app.services.project_service import summary_cache
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def empty_summary_cache():
+    summary_cache.clear()
+    yield
+    summary_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def projects(db_session, test_user):
+    start = datetime(2026, 1, 1)
+    rows = [
+        ("Garden", "active", "high"),
+        ("Well", "active", "medium"),
+        ("School", "planning", "high"),
+        ("Bridge", "completed", "low"),
+        ("Clinic", "planning", "medium"),
+        ("Market", "active", "low"),
+    ]
+    projects = [
+        Project(title=title, status=status, priority=priority, owner_id=test_user.id,
+                updated_at=start + timedelta(days=index))
+        for index, (title, status, priority) in enumerate(rows)
+    ]
+    db_session.add_all(projects)
+    await db_session.commit()
+    return projects
+
+
+class TestProjectSummary:
+    """Test the single-statement, cached project summary."""
+
+    @pytest.mark.asyncio
+    async def test_summary_is_one_query(self, client: AsyncClient, projects, auth_headers):
+        """Test totals, breakdowns and recent activity come from one statement."""
+        with track_queries() as stats:
+            response = await client.get("/api/v1/projects/summary", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert len([shape for shape in stats.shapes if "FROM projects" in shape]) == 1
+        data = response.json()
+        assert data["total_projects"] == 6
+        assert data["by_status"] == {"active": 3, "planning": 2, "completed": 1}
+        assert data["by_priority"] == {"high": 2, "medium": 2, "low": 2}
+        assert [item["title"] for item in data["recent_activity"]] == [
+            "Market", "Clinic", "Bridge", "School", "Well"
+        ]
+        assert data["recent_activity"][0]["status"] == "active"
+        assert data["cache_age"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_cached_until_project_write(self, client: AsyncClient, projects, auth_headers):
+        """Test repeat reads skip the database and report their age until a project changes."""
+        await client.get("/api/v1/projects/summary", headers=auth_headers)
+
+        with track_queries() as stats:
+            response = await client.get("/api/v1/projects/summary", headers=auth_headers)
+        assert not [shape for shape in stats.shapes if "FROM projects" in shape]
+        assert response.json()["cache_age"] > 0
+
+        response = await client.post(
+            "/api/v1/projects/", json={"title": "Orchard", "description": "Fruit trees"}, headers=auth_headers
+        )
+        assert response.status_code in (200, 201)
+
+        response = await client.get("/api/v1/projects/summary", headers=auth_headers)
+        assert response.json()["total_projects"] == 7
+        assert response.json()["cache_age"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_empty(self, client: AsyncClient, auth_headers):
+        """Test the summary of no projects."""
+        response = await client.get("/api/v1/projects/summary", headers=auth_headers)
+
+        assert response.json() == {
+            "total_projects": 0, "by_status": {}, "by_priority": {}, "recent_activity": [], "cache_age": 0.0
+        }
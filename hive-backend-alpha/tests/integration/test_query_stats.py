@@ -0,0 +1,76 @@
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+from app.core.query_stats import QueryStats, statement_shape
+from app.models.task import Task
+from tests.utils.test_utils import assert_max_queries
+
+
+def test_statement_shape_ignores_parameters():
+    """Test statements differing only in parameters share a shape."""
+    first = statement_shape("SELECT * FROM tasks WHERE id IN (?, ?, ?) LIMIT 10")
+    second = statement_shape("SELECT *\n  FROM tasks WHERE id IN (?) LIMIT 25")
+    assert first == second
+
+
+def test_suspected_n_plus_one_threshold():
+    """Test repeated shapes are flagged once they reach the threshold."""
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("SELECT * FROM users WHERE users.id = ?", 0.001)
+    stats.record("SELECT * FROM tasks", 0.001)
+
+    assert stats.count == 4
+    assert stats.suspected_n_plus_one(threshold=3) == [("SELECT * FROM users WHERE users.id = ?", 3)]
+    assert stats.suspected_n_plus_one(threshold=4) == []
+
+
+class TestQueryStatsMiddleware:
+    """Test per-request query reporting."""
+
+    @pytest.mark.asyncio
+    async def test_debug_headers(self, client: AsyncClient, auth_headers, monkeypatch):
+        """Test X-DB-Queries / X-DB-Time headers in debug mode."""
+        monkeypatch.setattr(settings, "debug", True)
+
+        response = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert int(response.headers["x-db-queries"]) >= 1
+        assert float(response.headers["x-db-time"]) >= 0
+
+    @pytest.mark.asyncio
+    async def test_no_headers_outside_debug(self, client: AsyncClient, auth_headers, monkeypatch):
+        """Test headers are not added in production mode."""
+        monkeypatch.setattr(settings, "debug", False)
+
+        response = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert "x-db-queries" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_flags_n_plus_one(self, client: AsyncClient, db_session, test_user, auth_headers, monkeypatch):
+        """Test chat rooms (one query per task per participant) are flagged."""
+        monkeypatch.setattr(settings, "debug", True)
+        monkeypatch.setattr(settings, "query_repeat_threshold", 3)
+        db_session.add_all([Task(title=f"Task {i}", owner_id=test_user.id) for i in range(4)])
+        await db_session.commit()
+
+        response = await client.get("/api/v1/chat/task-rooms", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert int(response.headers["x-db-suspected-n-plus-one"]) >= 1
+
+    @pytest.mark.asyncio
+    async def test_assert_max_queries_helper(self, client: AsyncClient, auth_headers):
+        """Test the max-query assertion helper around an endpoint."""
+        with assert_max_queries(2) as stats:
+            response = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert stats.count >= 1
+
+        with pytest.raises(AssertionError):
+            with assert_max_queries(0):
+                await client.get("/api/v1/tasks/", headers=auth_headers)
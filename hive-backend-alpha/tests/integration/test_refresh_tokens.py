@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from httpx import AsyncClient
+from unittest.mock import patch
+from sqlalchemy import select
+
+from app.models.refresh_token import RefreshToken
+from app.services.token_service import hash_refresh_token, issue_refresh_token, rotate_refresh_token
+from tests.conftest import TestSessionLocal
+
+
+async def _login(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestRefreshTokenAPI:
+    """Test the refresh token flow."""
+
+    @pytest.mark.asyncio
+    async def test_login_issues_refresh_token(self, client: AsyncClient, db_session, test_user):
+        """Test login returns a refresh token that is stored hashed."""
+        tokens = await _login(client)
+
+        assert tokens["refresh_token"]
+        result = await db_session.execute(select(RefreshToken))
+        stored = result.scalar_one()
+        assert stored.user_id == test_user.id
+        assert stored.token_hash == hash_refresh_token(tokens["refresh_token"])
+        assert stored.token_hash != tokens["refresh_token"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_rotates_without_password_check(self, client: AsyncClient, test_user):
+        """Test /auth/refresh mints new tokens without touching passlib."""
+        tokens = await _login(client)
+
+        with patch("app.core.security.pwd_context.verify") as verify:
+            response = await client.post(
+                "/api/v1/auth/refresh",
+                json={"refresh_token": tokens["refresh_token"]}
+            )
+            verify.assert_not_called()
+
+        assert response.status_code == 200
+        refreshed = response.json()
+        assert refreshed["refresh_token"] != tokens["refresh_token"]
+
+        me = await client.get(
+            "/api/v1/users/me",
+            headers={"Authorization": f"Bearer {refreshed['access_token']}"}
+        )
+        assert me.status_code == 200
+        assert me.json()["id"] == str(test_user.id)
+
+    @pytest.mark.asyncio
+    async def test_reused_refresh_token_revokes_family(self, client: AsyncClient, test_user):
+        """Test replaying a rotated token revokes every token from that login."""
+        tokens = await _login(client)
+        first = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        current = first.json()["refresh_token"]
+
+        replay = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert replay.status_code == 401
+
+        after_replay = await client.post("/api/v1/auth/refresh", json={"refresh_token": current})
+        assert after_replay.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_concurrent_rotations_issue_one_token(self, db_session, test_user):
+        """Test two simultaneous rotations of one token yield exactly one new token."""
+        token = await issue_refresh_token(db_session, test_user.id)
+
+        async def rotate():
+            async with TestSessionLocal() as session:
+                return await rotate_refresh_token(session, token)
+
+        results = await asyncio.gather(rotate(), rotate())
+
+        assert sorted(result is None for result in results) == [False, True]
+        result = await db_session.execute(
+            select(RefreshToken).where(RefreshToken.revoked_at.is_(None)).execution_options(populate_existing=True)
+        )
+        assert len(result.scalars().all()) == 0
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_cannot_refresh(self, client: AsyncClient, db_session, test_user):
+        """Test a deactivated user's refresh token is rejected."""
+        tokens = await _login(client)
+        test_user.is_active = False
+        await db_session.commit()
+
+        response = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_logout_revokes_refresh_token(self, client: AsyncClient, test_user):
+        """Test logout makes the refresh token unusable."""
+        tokens = await _login(client)
+
+        response = await client.post("/api/v1/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 200
+
+        response = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_unknown_refresh_token(self, client: AsyncClient):
+        """Test an unknown refresh token is rejected."""
+        response = await client.post("/api/v1/auth/refresh", json={"refresh_token": "bogus"})
+        assert response.status_code == 401
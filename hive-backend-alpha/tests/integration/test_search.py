@@ -0,0 +1,140 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.models.project import Project
+from app.models.task import Task
+from app.services.search_service import _postgresql_search
+
+
+def test_postgres_search_uses_tsvector_index():
+    """Test the Postgres query matches on the indexed search_vector and ranks with ts_rank."""
+    stmt, score, highlight, _ = _postgresql_search(Task, "solar panels")
+    sql = str(stmt.add_columns(score, highlight).compile(dialect=postgresql.dialect()))
+    assert "tasks.search_vector @@ websearch_to_tsquery" in sql
+    assert "ts_rank(tasks.search_vector" in sql
+    assert "ts_headline" in sql
+
+
+@pytest_asyncio.fixture
+async def search_tasks(db_session, test_user):
+    tasks = [
+        Task(title="Install solar panels", description="Mount solar panels on the community hall roof.",
+             category="Energy", owner_id=test_user.id),
+        Task(title="Community garden", description="Plan beds; a solar pump waters them.",
+             category="Agriculture", owner_id=test_user.id),
+        Task(title="Repair bikes", description="Fix donated bicycles.",
+             category="Transport", owner_id=test_user.id),
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+    return tasks
+
+
+async def _search(client: AsyncClient, auth_headers, path="/api/v1/tasks/search", **params):
+    response = await client.get(path, params=params, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestTaskSearch:
+    """Test GET /tasks/search."""
+
+    @pytest.mark.asyncio
+    async def test_results_ranked_by_relevance(self, client: AsyncClient, search_tasks, auth_headers):
+        """Test title matches outrank description-only matches and non-matches are excluded."""
+        page = await _search(client, auth_headers, q="solar")
+        assert [hit["title"] for hit in page["items"]] == ["Install solar panels", "Community garden"]
+        assert page["items"][0]["score"] > page["items"][1]["score"]
+        assert page["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_highlight_and_snippet(self, client: AsyncClient, search_tasks, auth_headers):
+        """Test matched terms are wrapped in <mark>."""
+        hit = (await _search(client, auth_headers, q="solar"))["items"][0]
+        assert hit["highlight"] == "Install <mark>solar</mark> panels"
+        assert "<mark>solar</mark>" in hit["snippet"]
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages(self, client: AsyncClient, search_tasks, auth_headers):
+        """Test next_cursor walks the ranked results without overlap."""
+        first = await _search(client, auth_headers, q="solar", limit=1)
+        assert len(first["items"]) == 1 and first["next_cursor"]
+
+        second = await _search(client, auth_headers, q="solar", limit=1, cursor=first["next_cursor"])
+        assert [hit["title"] for hit in first["items"] + second["items"]] == [
+            "Install solar panels", "Community garden"
+        ]
+        assert second["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_index_follows_updates_and_deletes(
+        self, client: AsyncClient, db_session, search_tasks, auth_headers
+    ):
+        """Test edits and deletes are reflected in search results."""
+        search_tasks[2].description = "Fix donated bicycles with solar lights."
+        await db_session.delete(search_tasks[0])
+        await db_session.commit()
+
+        titles = [hit["title"] for hit in (await _search(client, auth_headers, q="solar"))["items"]]
+        assert sorted(titles) == ["Community garden", "Repair bikes"]
+
+    @pytest.mark.asyncio
+    async def test_index_keyed_by_task_id(self, client: AsyncClient, db_session, search_tasks, auth_headers):
+        """Test the SQLite index follows task ids, not rowids (which VACUUM may renumber)."""
+        await db_session.execute(text("UPDATE tasks SET rowid = rowid + 100"))
+        await db_session.commit()
+
+        result = await db_session.execute(text("SELECT id FROM tasks_fts"))
+        indexed = set(result.scalars().all())
+        result = await db_session.execute(text("SELECT id FROM tasks"))
+        assert indexed == set(result.scalars().all())
+
+        page = await _search(client, auth_headers, q="bikes")
+        assert [hit["title"] for hit in page["items"]] == ["Repair bikes"]
+        assert page["items"][0]["highlight"] == "Repair <mark>bikes</mark>"
+
+    @pytest.mark.asyncio
+    async def test_other_backends_fall_back_to_ilike(
+        self, client: AsyncClient, db_session, search_tasks, auth_headers, monkeypatch
+    ):
+        """Test backends without full-text support get a plain ILIKE search instead of an error."""
+        monkeypatch.setattr(db_session.get_bind().dialect, "name", "mysql")
+
+        page = await _search(client, auth_headers, q="Solar")
+        assert [hit["title"] for hit in page["items"]] == ["Install solar panels", "Community garden"]
+        assert page["items"][0]["highlight"] is None
+
+    @pytest.mark.asyncio
+    async def test_query_syntax_is_literal(self, client: AsyncClient, search_tasks, auth_headers):
+        """Test punctuation in the query is not parsed as search operators."""
+        page = await _search(client, auth_headers, q='solar" -(*')
+        assert len(page["items"]) == 2
+        assert (await _search(client, auth_headers, q="!!!"))["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, client: AsyncClient, search_tasks, auth_headers):
+        """Test a malformed cursor is rejected."""
+        response = await client.get(
+            "/api/v1/tasks/search", params={"q": "solar", "cursor": "nope"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
+
+class TestProjectSearch:
+    """Test GET /projects/search."""
+
+    @pytest.mark.asyncio
+    async def test_project_search(self, client: AsyncClient, db_session, test_user, auth_headers):
+        """Test projects are searchable and highlighted."""
+        db_session.add_all([
+            Project(title="Solar village", description="Power every home.", owner_id=test_user.id),
+            Project(title="Seed library", description="Share heirloom seeds.", owner_id=test_user.id),
+        ])
+        await db_session.commit()
+
+        page = await _search(client, auth_headers, path="/api/v1/projects/search", q="heirloom")
+        assert [hit["title"] for hit in page["items"]] == ["Seed library"]
+        assert "<mark>heirloom</mark>" in page["items"][0]["snippet"]
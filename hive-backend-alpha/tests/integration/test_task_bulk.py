@@ -0,0 +1,108 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from unittest.mock import AsyncMock, patch
+
+from app.config import settings
+from app.core.query_stats import track_queries
+from app.models.task import Task
+from app.models.user import User
+
+
+class TestBulkCreate:
+    """Test POST /tasks/bulk."""
+
+    @pytest.mark.asyncio
+    async def test_creates_valid_items_and_reports_failures(
+        self, client: AsyncClient, db_session, auth_headers
+    ):
+        """Test valid items are inserted together and invalid ones reported by index."""
+        payload = {"tasks": [
+            {"title": "One", "required_skills": ["python"]},
+            {"description": "missing title"},
+            {"title": "Two", "project_id": "00000000-0000-0000-0000-000000000001"},
+            {"title": "Three", "priority": "high"},
+        ]}
+
+        with track_queries() as stats:
+            response = await client.post("/api/v1/tasks/bulk", json=payload, headers=auth_headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["succeeded"], body["failed"]) == (2, 2)
+        assert [r["ok"] for r in body["results"]] == [True, False, False, True]
+        assert "title" in body["results"][1]["error"]
+        assert body["results"][2]["error"] == "Project not found"
+        inserts = [shape for shape in stats.shapes if shape.startswith("INSERT INTO tasks")]
+        assert sum(stats.shapes[shape] for shape in inserts) == 1
+
+        tasks = (await db_session.execute(select(Task).order_by(Task.title))).scalars().all()
+        assert [(t.title, t.priority, t.status) for t in tasks] == [
+            ("One", "medium", "draft"), ("Three", "high", "draft")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batch(self, client: AsyncClient, auth_headers, monkeypatch):
+        """Test batches above bulk_max_items are refused."""
+        monkeypatch.setattr(settings, "bulk_max_items", 2)
+        payload = {"tasks": [{"title": str(i)} for i in range(3)]}
+
+        response = await client.post("/api/v1/tasks/bulk", json=payload, headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestBulkUpdate:
+    """Test PATCH /tasks/bulk."""
+
+    @pytest.mark.asyncio
+    async def test_updates_with_permissions_and_one_broadcast(
+        self, client: AsyncClient, db_session, test_user, auth_headers
+    ):
+        """Test per-item permission checks and a single batched status event."""
+        other = User(email="other@example.com", hashed_password="x")
+        db_session.add(other)
+        await db_session.flush()
+        mine = [Task(title=f"Mine {i}", owner_id=test_user.id) for i in range(3)]
+        assigned = Task(title="Assigned", owner_id=other.id, assignee_id=test_user.id)
+        foreign = Task(title="Foreign", owner_id=other.id)
+        db_session.add_all([*mine, assigned, foreign])
+        await db_session.commit()
+
+        payload = {"tasks": [
+            *({"id": str(task.id), "status": "available"} for task in mine),
+            {"id": str(assigned.id), "status": "in_progress"},
+            {"id": str(assigned.id), "title": "Renamed by assignee"},
+            {"id": str(foreign.id), "status": "completed"},
+            {"id": str(mine[0].id), "status": "bogus"},
+        ]}
+
+        with patch(
+            "app.services.task_service.manager.broadcast", new_callable=AsyncMock
+        ) as broadcast:
+            response = await client.patch("/api/v1/tasks/bulk", json=payload, headers=auth_headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [r["ok"] for r in body["results"]] == [True, True, True, True, False, False, False]
+        assert body["results"][5]["error"] == "Not authorized to update this task"
+
+        broadcast.assert_awaited_once()
+        event = broadcast.await_args.args[0]
+        assert event["type"] == "task_status_bulk_update"
+        assert len(event["updates"]) == 4
+
+        statuses = dict((await db_session.execute(select(Task.title, Task.status))).all())
+        assert statuses == {
+            "Mine 0": "available", "Mine 1": "available", "Mine 2": "available",
+            "Assigned": "in_progress", "Foreign": "draft",
+        }
+
+    @pytest.mark.asyncio
+    async def test_unknown_task(self, client: AsyncClient, db_session, auth_headers):
+        """Test unknown ids fail individually."""
+        payload = {"tasks": [{"id": "00000000-0000-0000-0000-000000000001", "status": "available"}]}
+
+        response = await client.patch("/api/v1/tasks/bulk", json=payload, headers=auth_headers)
+
+        assert response.json()["results"][0]["error"] == "Task not found"
+        assert await db_session.scalar(select(func.count(Task.id))) == 0
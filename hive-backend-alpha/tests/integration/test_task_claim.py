@@ -0,0 +1,89 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.query_stats import track_queries
+from app.models.task import Task
+from app.models.user import User
+from app.models.user_task_association import UserTaskAssociation
+from app.services.assignment_service import claim_task
+
+
+@pytest_asyncio.fixture
+async def other_user(db_session):
+    user = User(email="owner@example.com", hashed_password="x")
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest_asyncio.fixture
+async def open_task(db_session, other_user):
+    task = Task(title="Plant trees", status="available", owner_id=other_user.id)
+    db_session.add(task)
+    await db_session.commit()
+    return task
+
+
+class TestClaimTask:
+    """Test the conditional-UPDATE claim."""
+
+    @pytest.mark.asyncio
+    async def test_claim_is_one_update_and_one_insert(self, db_session, open_task, test_user):
+        """Test a claim writes the task and its association without reading first."""
+        with track_queries() as stats:
+            task = await claim_task(db_session, open_task.id, test_user)
+
+        assert stats.count == 2
+        assert task.assignee_id == test_user.id
+        assert task.status == "in_progress"
+
+        result = await db_session.execute(select(UserTaskAssociation.user_id).where(
+            UserTaskAssociation.task_id == open_task.id
+        ))
+        assert result.scalars().all() == [test_user.id]
+
+    @pytest.mark.asyncio
+    async def test_second_claimer_loses(self, db_session, open_task, test_user):
+        """Test only the first of two claimers wins the task."""
+        rival = User(email="rival@example.com", hashed_password="x")
+        db_session.add(rival)
+        await db_session.commit()
+
+        assert await claim_task(db_session, open_task.id, rival) is not None
+        assert await claim_task(db_session, open_task.id, test_user) is None
+
+        result = await db_session.execute(select(UserTaskAssociation).where(
+            UserTaskAssociation.task_id == open_task.id
+        ))
+        assert len(result.scalars().all()) == 1
+
+    @pytest.mark.asyncio
+    async def test_claim_endpoint(self, client: AsyncClient, open_task, auth_headers, test_user):
+        """Test POST /tasks/{id}/claim assigns the caller."""
+        response = await client.post(f"/api/v1/tasks/{open_task.id}/claim", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["assignee_id"] == str(test_user.id)
+        assert response.json()["status"] == "in_progress"
+
+        response = await client.post(f"/api/v1/tasks/{open_task.id}/claim", headers=auth_headers)
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Task is already assigned"
+
+    @pytest.mark.asyncio
+    async def test_claim_rejections(self, client: AsyncClient, db_session, other_user, test_user, auth_headers):
+        """Test missing, unavailable and own tasks can't be claimed."""
+        draft = Task(title="Draft", status="draft", owner_id=other_user.id)
+        own = Task(title="Mine", status="available", owner_id=test_user.id)
+        db_session.add_all([draft, own])
+        await db_session.commit()
+
+        response = await client.post(f"/api/v1/tasks/{draft.id}/claim", headers=auth_headers)
+        assert response.json()["detail"] == "Task is not available for claiming"
+
+        response = await client.post(f"/api/v1/tasks/{own.id}/claim", headers=auth_headers)
+        assert response.json()["detail"] == "Cannot claim your own task"
+
+        response = await client.post(f"/api/v1/tasks/{other_user.id}/claim", headers=auth_headers)
+        assert response.status_code == 404
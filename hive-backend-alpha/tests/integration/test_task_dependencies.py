@@ -0,0 +1,196 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.models.project import Project
+from app.models.task import Task
+from app.services.dependency_service import graph_cache
+
+
+@pytest_asyncio.fixture
+async def project(db_session, test_user):
+    graph_cache.clear()
+    project = Project(title="Community solar", owner_id=test_user.id)
+    db_session.add(project)
+    await db_session.commit()
+    return project
+
+
+async def _create(client: AsyncClient, auth_headers, project, title, dependencies=(), hours=None):
+    payload = {"title": title, "project_id": str(project.id), "dependencies": list(dependencies)}
+    if hours:
+        payload["estimated_hours"] = hours
+    response = await client.post("/api/v1/tasks/", json=payload, headers=auth_headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest_asyncio.fixture
+async def plan(client: AsyncClient, project, auth_headers):
+    survey = await _create(client, auth_headers, project, "Site survey", hours="2")
+    permits = await _create(client, auth_headers, project, "Permits", ["site survey"], hours="10")
+    install = await _create(client, auth_headers, project, "Install panels", ["Permits", "Buy panels"], hours="8")
+    return survey, permits, install
+
+
+class TestTaskDependencies:
+    """Test dependency resolution and the dependency graph endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_titles_resolve_to_ids(self, plan):
+        """Test dependencies naming a task in the project are stored as its id."""
+        survey, permits, install = plan
+        assert permits["dependencies"] == [survey["id"]]
+        assert install["dependencies"] == [permits["id"], "Buy panels"]
+
+    @pytest.mark.asyncio
+    async def test_project_graph(self, client: AsyncClient, project, plan, auth_headers):
+        """Test topological order, critical path and ready/blocked sets."""
+        survey, permits, install = plan
+        response = await client.get(f"/api/v1/projects/{project.id}/dependencies", headers=auth_headers)
+        assert response.status_code == 200
+        graph = response.json()
+        assert graph["order"] == [survey["id"], permits["id"], install["id"]]
+        assert graph["critical_path"] == [survey["id"], permits["id"], install["id"]]
+        assert graph["critical_path_hours"] == 20.0
+        assert graph["ready"] == [survey["id"]]
+        assert graph["blocked"] == [permits["id"], install["id"]]
+
+    @pytest.mark.asyncio
+    async def test_completion_unblocks(self, client: AsyncClient, plan, auth_headers):
+        """Test task dependency status follows status changes without a rebuild."""
+        survey, permits, install = plan
+        response = await client.get(f"/api/v1/tasks/{permits['id']}/dependencies", headers=auth_headers)
+        assert response.json()["blocked_by"] == [survey["id"]]
+        assert response.json()["is_blocked"] is True
+
+        response = await client.get(f"/api/v1/tasks/{survey['id']}/dependencies", headers=auth_headers)
+        assert response.json()["unblocks"] == [permits["id"]]
+
+        response = await client.put(
+            f"/api/v1/tasks/{survey['id']}/status", json={"status": "completed"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        misses = graph_cache.misses
+        response = await client.get(f"/api/v1/tasks/{permits['id']}/dependencies", headers=auth_headers)
+        assert response.json()["blocked_by"] == []
+        assert response.json()["is_blocked"] is False
+        assert graph_cache.misses == misses
+
+    @pytest.mark.asyncio
+    async def test_cycle_rejected(self, client: AsyncClient, plan, auth_headers):
+        """Test an update that would make the graph cyclic is refused."""
+        survey, permits, install = plan
+        response = await client.put(
+            f"/api/v1/tasks/{survey['id']}", json={"dependencies": ["Install panels"]}, headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert "cycle" in response.json()["detail"]
+
+        response = await client.get(f"/api/v1/tasks/{survey['id']}", headers=auth_headers)
+        assert response.json()["dependencies"] == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_cycle_across_items(self, client: AsyncClient, project, auth_headers):
+        """Test a cycle formed by two items of one bulk update fails the second item."""
+        first = await _create(client, auth_headers, project, "First")
+        second = await _create(client, auth_headers, project, "Second")
+        response = await client.patch("/api/v1/tasks/bulk", json={"tasks": [
+            {"id": first["id"], "dependencies": ["Second"]},
+            {"id": second["id"], "dependencies": [first["id"]]},
+        ]}, headers=auth_headers)
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results[0]["ok"] is True
+        assert "cycle" in results[1]["error"]
+
+        response = await client.get(f"/api/v1/tasks/{first['id']}/dependencies", headers=auth_headers)
+        assert response.json()["blocked_by"] == [second["id"]]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_resolves_titles(self, client: AsyncClient, plan, project, auth_headers):
+        """Test bulk-created tasks resolve titles of existing tasks and of other items, before or after."""
+        survey, permits, install = plan
+        response = await client.post("/api/v1/tasks/bulk", json={"tasks": [
+            {"title": "Celebrate", "project_id": str(project.id), "dependencies": ["Wire inverter"]},
+            {"title": "Wire inverter", "project_id": str(project.id), "dependencies": ["Install panels"]},
+        ]}, headers=auth_headers)
+        assert response.status_code == 200
+        celebrate, wire = response.json()["results"]
+        assert celebrate["ok"] is True and wire["ok"] is True
+
+        response = await client.get(f"/api/v1/tasks/{celebrate['id']}", headers=auth_headers)
+        assert response.json()["dependencies"] == [wire["id"]]
+        response = await client.get(f"/api/v1/tasks/{wire['id']}/dependencies", headers=auth_headers)
+        assert response.json()["blocked_by"] == [install["id"]]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_rejects_cycles(
+        self, client: AsyncClient, db_session, project, auth_headers
+    ):
+        """Test a loop within one batch fails every task on it and those depending on it."""
+        response = await client.post("/api/v1/tasks/bulk", json={"tasks": [
+            {"title": "A", "project_id": str(project.id), "dependencies": ["B"]},
+            {"title": "B", "project_id": str(project.id), "dependencies": ["A"]},
+            {"title": "After", "project_id": str(project.id), "dependencies": ["B"]},
+            {"title": "Free", "project_id": str(project.id)},
+        ]}, headers=auth_headers)
+        assert response.status_code == 200
+        a, b, after, free = response.json()["results"]
+        assert a["error"] == "Dependencies would form a cycle: A -> B -> A"
+        assert b["error"] == "Dependencies would form a cycle: B -> A -> B"
+        assert after["error"] == "Depends on a task that would form a cycle: B"
+        assert free["ok"] is True
+
+        result = await db_session.execute(select(Task.id, Task.dependencies))
+        rows = result.all()
+        stored_ids = {str(task_id) for task_id, _ in rows}
+        assert [str(task_id) for task_id, _ in rows] == [free["id"]]
+        assert all(set(dependencies or []) <= stored_ids for _, dependencies in rows)
+
+    @pytest.mark.asyncio
+    async def test_delete_releases_dependents(self, client: AsyncClient, plan, auth_headers):
+        """Test deleting a prerequisite unblocks the tasks that listed it."""
+        survey, permits, install = plan
+        response = await client.delete(f"/api/v1/tasks/{survey['id']}", headers=auth_headers)
+        assert response.status_code == 200
+
+        response = await client.get(f"/api/v1/tasks/{permits['id']}/dependencies", headers=auth_headers)
+        assert response.json()["is_blocked"] is False
+
+    @pytest.mark.asyncio
+    async def test_missing(self, client: AsyncClient, project, auth_headers):
+        """Test unknown tasks and projects are 404s."""
+        response = await client.get(f"/api/v1/tasks/{project.id}/dependencies", headers=auth_headers)
+        assert response.status_code == 404
+        response = await client.get(f"/api/v1/projects/{project.owner_id}/dependencies", headers=auth_headers)
+        assert response.status_code == 404
+
+
+class TestImportLinksDependencies:
+    """Test master plan imports link dependencies by title."""
+
+    @pytest.mark.asyncio
+    async def test_confirm_import(self, client: AsyncClient, db_session, auth_headers):
+        """Test dependencies on tasks defined later in the plan are linked, and cycles left as text."""
+        preview = {
+            "projects": [{"name": "Garden"}],
+            "tasks": [
+                {"title": "Plant beds", "project": "Garden", "dependencies": ["Build beds", "Buy seeds"]},
+                {"title": "Build beds", "project": "Garden", "dependencies": ["Clear site"]},
+                {"title": "Clear site", "project": "Garden", "dependencies": ["Plant beds"]},
+            ],
+        }
+        response = await client.post(
+            "/api/v1/import/confirm", json={"preview_data": preview}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["linked_dependencies"] == 2
+
+        result = await db_session.execute(select(Task.title, Task.id, Task.dependencies))
+        tasks = {title: (task_id, dependencies) for title, task_id, dependencies in result.all()}
+        assert tasks["Plant beds"][1] == [str(tasks["Build beds"][0]), "Buy seeds"]
+        assert tasks["Build beds"][1] == [str(tasks["Clear site"][0])]
+        assert tasks["Clear site"][1] == ["Plant beds"]
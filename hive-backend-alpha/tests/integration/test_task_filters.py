@@ -0,0 +1,87 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.task import Task
+from app.schemas.task import TaskFilter
+from app.services.task_service import apply_task_filters
+
+
+def _compile_pg(filters: TaskFilter) -> str:
+    stmt = apply_task_filters(select(Task), filters, "postgresql")
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_postgres_skills_use_gin_operators():
+    """Test skills filters compile to the jsonb operators the GIN index serves."""
+    assert "@>" in _compile_pg(TaskFilter(skills=["python"]))
+    assert "?|" in _compile_pg(TaskFilter(skills=["python", "sql"], skills_match="any"))
+
+
+@pytest_asyncio.fixture
+async def filter_tasks(db_session, test_user):
+    tasks = [
+        Task(title="Solar", status="available", priority="high", category="Energy",
+             impact_points=300, required_skills=["python", "sql"], owner_id=test_user.id),
+        Task(title="Compost", status="available", priority="low", category="Agriculture",
+             impact_points=100, required_skills=["python"], owner_id=test_user.id),
+        Task(title="Wind", status="completed", priority="urgent", category="Energy",
+             impact_points=200, required_skills=["rust"], owner_id=test_user.id),
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+    return tasks
+
+
+async def _titles(client: AsyncClient, auth_headers, **params):
+    response = await client.get("/api/v1/tasks/", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    return [task["title"] for task in response.json()]
+
+
+class TestTaskListFilters:
+    """Test server-side filtering and sorting of GET /tasks."""
+
+    @pytest.mark.asyncio
+    async def test_field_filters_combine(self, client: AsyncClient, filter_tasks, auth_headers):
+        """Test equality filters are ANDed together."""
+        assert sorted(await _titles(client, auth_headers, status="available")) == ["Compost", "Solar"]
+        assert await _titles(client, auth_headers, status="available", category="Energy") == ["Solar"]
+        assert await _titles(client, auth_headers, priority="urgent") == ["Wind"]
+
+    @pytest.mark.asyncio
+    async def test_skills_all_and_any(self, client: AsyncClient, filter_tasks, auth_headers):
+        """Test skills containment (all) and overlap (any)."""
+        assert await _titles(client, auth_headers, skills=["python", "sql"]) == ["Solar"]
+        assert sorted(await _titles(client, auth_headers, skills=["sql", "rust"], skills_match="any")) == [
+            "Solar", "Wind"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sort_keys(self, client: AsyncClient, filter_tasks, auth_headers):
+        """Test explicit sort keys in both directions."""
+        assert await _titles(client, auth_headers, sort="-impact_points") == ["Solar", "Wind", "Compost"]
+        assert await _titles(client, auth_headers, sort="priority") == ["Wind", "Solar", "Compost"]
+        assert await _titles(client, auth_headers, sort="title") == ["Compost", "Solar", "Wind"]
+
+    @pytest.mark.asyncio
+    async def test_filters_with_cursor(self, client: AsyncClient, filter_tasks, auth_headers):
+        """Test filters apply to keyset pages too."""
+        response = await client.get(
+            "/api/v1/tasks/", params={"cursor": "", "category": "Energy"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert sorted(task["title"] for task in response.json()["items"]) == ["Solar", "Wind"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_sort(self, client: AsyncClient, auth_headers):
+        """Test unknown sort keys and cursor with custom sort are rejected."""
+        response = await client.get("/api/v1/tasks/", params={"sort": "password"}, headers=auth_headers)
+        assert response.status_code == 400
+
+        response = await client.get(
+            "/api/v1/tasks/", params={"sort": "title", "cursor": ""}, headers=auth_headers
+        )
+        assert response.status_code == 400
@@ -0,0 +1,74 @@
+import pytest
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+from uuid import uuid4
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.task import Task
+
+
+def test_cursor_round_trip():
+    """Test cursors decode back to the encoded keyset position."""
+    key = (datetime(2026, 1, 2, 3, 4, 5, 678901), uuid4())
+    assert decode_cursor(encode_cursor(*key)) == key
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", "eyJ1IjoieCIsImkiOiJ5In0"])
+def test_invalid_cursor(cursor):
+    """Test malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+class TestTaskCursorPagination:
+    """Test keyset pagination on GET /tasks."""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_tasks_in_order(
+        self, client: AsyncClient, db_session, test_user, auth_headers
+    ):
+        """Test walking next_cursor returns every task once, newest first, ties by id."""
+        base = datetime(2026, 1, 1)
+        tasks = [
+            Task(title=f"Task {i}", owner_id=test_user.id, updated_at=base + timedelta(minutes=i // 2))
+            for i in range(7)
+        ]
+        db_session.add_all(tasks)
+        await db_session.commit()
+        expected = [
+            str(t.id) for t in sorted(tasks, key=lambda t: (t.updated_at, t.id), reverse=True)
+        ]
+
+        seen, cursor = [], ""
+        while True:
+            response = await client.get(
+                "/api/v1/tasks/", params={"cursor": cursor, "limit": 3}, headers=auth_headers
+            )
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page["items"]) <= 3
+            seen.extend(item["id"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+
+    @pytest.mark.asyncio
+    async def test_offset_path_unchanged(self, client: AsyncClient, db_session, test_user, auth_headers):
+        """Test requests without a cursor still return a plain list."""
+        db_session.add(Task(title="Listed", owner_id=test_user.id))
+        await db_session.commit()
+
+        response = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert [task["title"] for task in response.json()] == ["Listed"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self, client: AsyncClient, auth_headers):
+        """Test a tampered cursor returns 400."""
+        response = await client.get(
+            "/api/v1/tasks/", params={"cursor": "garbage"}, headers=auth_headers
+        )
+        assert response.status_code == 400
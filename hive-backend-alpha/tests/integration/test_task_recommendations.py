@@ -0,0 +1,121 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.dialects import postgresql
+
+from app.models.task import Task
+from app.models.user import User
+from app.services.task_service import recommendation_cache, recommended_tasks_query
+
+
+def test_postgres_recommendations_use_gin_overlap():
+    """Test the candidate filter is the GIN-indexed ?| overlap, scored in SQL."""
+    sql = str(recommended_tasks_query("postgresql", ["python", "sql"]).compile(dialect=postgresql.dialect()))
+    assert "tasks.required_skills ?|" in sql
+    assert "jsonb_array_elements_text(tasks.required_skills)" in sql
+
+
+@pytest_asyncio.fixture
+async def skilled_user(db_session, test_user):
+    recommendation_cache.clear()
+    test_user.skills = ["python", "sql", "gis"]
+    await db_session.commit()
+    return test_user
+
+
+@pytest_asyncio.fixture
+async def open_tasks(db_session, skilled_user):
+    other = User(email="other@example.com", hashed_password="x")
+    db_session.add(other)
+    await db_session.commit()
+
+    tasks = [
+        Task(title="Map watersheds", status="available", required_skills=["python", "sql", "gis"],
+             owner_id=other.id),
+        Task(title="Sensor dashboard", status="available", required_skills=["python", "react"],
+             owner_id=other.id),
+        Task(title="Soil database", status="available", required_skills=["sql", "python"],
+             owner_id=other.id),
+        Task(title="Write grant", status="available", required_skills=["writing"], owner_id=other.id),
+        Task(title="Draft plan", status="draft", required_skills=["python"], owner_id=other.id),
+        Task(title="Taken", status="available", required_skills=["python"], owner_id=other.id,
+             assignee_id=other.id),
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+    return tasks
+
+
+async def _recommended(client: AsyncClient, auth_headers, **params):
+    response = await client.get("/api/v1/tasks/recommended", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestRecommendedTasks:
+    """Test GET /tasks/recommended."""
+
+    @pytest.mark.asyncio
+    async def test_ranked_by_skill_overlap(self, client: AsyncClient, open_tasks, auth_headers):
+        """Test only open, unassigned, overlapping tasks are returned, best match first."""
+        page = await _recommended(client, auth_headers)
+        assert [(item["title"], item["score"]) for item in page["items"]] == [
+            ("Map watersheds", 3), ("Soil database", 2), ("Sensor dashboard", 1)
+        ]
+        assert page["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages(self, client: AsyncClient, open_tasks, auth_headers):
+        """Test next_cursor walks the ranking without overlap."""
+        titles, cursor = [], None
+        while True:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            page = await _recommended(client, auth_headers, **params)
+            titles += [item["title"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert titles == ["Map watersheds", "Soil database", "Sensor dashboard"]
+
+    @pytest.mark.asyncio
+    async def test_no_skills(self, client: AsyncClient, open_tasks, auth_headers):
+        """Test a user without skills gets an empty feed."""
+        response = await client.put("/api/v1/users/me", json={"skills": []}, headers=auth_headers)
+        assert response.status_code == 200
+        assert (await _recommended(client, auth_headers))["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_cached_per_user(self, client: AsyncClient, open_tasks, auth_headers):
+        """Test a repeated request is served from the cache."""
+        await _recommended(client, auth_headers)
+        hits = recommendation_cache.hits
+        await _recommended(client, auth_headers)
+        assert recommendation_cache.hits == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_skills_change_refreshes(self, client: AsyncClient, open_tasks, auth_headers):
+        """Test editing skills changes the feed immediately."""
+        await _recommended(client, auth_headers)
+        response = await client.put("/api/v1/users/me", json={"skills": ["writing"]}, headers=auth_headers)
+        assert response.status_code == 200
+
+        page = await _recommended(client, auth_headers)
+        assert [item["title"] for item in page["items"]] == ["Write grant"]
+
+    @pytest.mark.asyncio
+    async def test_task_status_change_invalidates(
+        self, client: AsyncClient, open_tasks, auth_headers
+    ):
+        """Test claiming a task removes it from cached feeds."""
+        await _recommended(client, auth_headers)
+        response = await client.post(f"/api/v1/tasks/{open_tasks[0].id}/claim", headers=auth_headers)
+        assert response.status_code == 200
+
+        page = await _recommended(client, auth_headers)
+        assert "Map watersheds" not in [item["title"] for item in page["items"]]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, client: AsyncClient, open_tasks, auth_headers):
+        """Test a malformed cursor is rejected."""
+        response = await client.get("/api/v1/tasks/recommended", params={"cursor": "x"}, headers=auth_headers)
+        assert response.status_code == 400
@@ -0,0 +1,109 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from app.core.query_stats import track_queries
+from app.models.file import TaskFile
+from app.models.milestone import Milestone
+from app.models.task import Task
+from app.models.user import User
+
+
+@pytest_asyncio.fixture
+async def task(db_session, test_user):
+    task = Task(title="Scoped", owner_id=test_user.id)
+    db_session.add(task)
+    await db_session.commit()
+    return task
+
+
+@pytest_asyncio.fixture
+async def milestone(db_session, task):
+    milestone = Milestone(title="Step", task_id=task.id)
+    db_session.add(milestone)
+    await db_session.commit()
+    return milestone
+
+
+@pytest_asyncio.fixture
+async def foreign_milestone(db_session):
+    other = User(email="other@example.com", hashed_password="x")
+    db_session.add(other)
+    await db_session.flush()
+    task = Task(title="Not mine", owner_id=other.id)
+    db_session.add(task)
+    await db_session.flush()
+    milestone = Milestone(title="Hidden", task_id=task.id)
+    db_session.add(milestone)
+    await db_session.commit()
+    return milestone
+
+
+async def _queries(client: AsyncClient, auth_headers, method: str, url: str, **kwargs):
+    # Warm the principal cache so only the endpoint's own queries are counted
+    await client.get("/api/v1/users/me", headers=auth_headers)
+    with track_queries() as stats:
+        response = await client.request(method, url, headers=auth_headers, **kwargs)
+    return response, stats
+
+
+class TestTaskScopedAccess:
+    """Test task-scoped rows are fetched and authorized in one joined query."""
+
+    @pytest.mark.asyncio
+    async def test_get_milestone_single_query(self, client: AsyncClient, milestone, auth_headers):
+        """Test GET /milestones/{id} loads and authorizes with one SELECT."""
+        response, stats = await _queries(client, auth_headers, "GET", f"/api/v1/milestones/{milestone.id}")
+        assert response.status_code == 200
+        assert response.json()["title"] == "Step"
+        assert stats.count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_milestone_reuses_loaded_row(self, client: AsyncClient, milestone, auth_headers):
+        """Test PUT /milestones/{id} is one SELECT plus the UPDATE."""
+        response, stats = await _queries(
+            client, auth_headers, "PUT", f"/api/v1/milestones/{milestone.id}", json={"title": "Renamed"}
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+        assert stats.count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_milestone(self, client: AsyncClient, milestone, auth_headers):
+        """Test DELETE /milestones/{id} is one SELECT plus the DELETE and the task rollup UPDATE."""
+        response, stats = await _queries(client, auth_headers, "DELETE", f"/api/v1/milestones/{milestone.id}")
+        assert response.status_code == 200
+        assert stats.count == 3
+
+        response = await client.get(f"/api/v1/milestones/{milestone.id}", headers=auth_headers)
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_foreign_milestone_forbidden(self, client: AsyncClient, foreign_milestone, auth_headers):
+        """Test users who neither own nor are assigned the task get 403."""
+        for method in ("GET", "PUT", "DELETE"):
+            kwargs = {"json": {"title": "x"}} if method == "PUT" else {}
+            response = await client.request(
+                method, f"/api/v1/milestones/{foreign_milestone.id}", headers=auth_headers, **kwargs
+            )
+            assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_delete_file(self, client: AsyncClient, db_session, task, test_user, auth_headers, tmp_path):
+        """Test DELETE /files/{id} authorizes via the joined query and removes the file."""
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+        record = TaskFile(
+            filename="notes.txt", original_filename="notes.txt", file_path=str(path),
+            file_size=5, task_id=task.id, uploaded_by=test_user.id
+        )
+        db_session.add(record)
+        await db_session.commit()
+
+        response, stats = await _queries(client, auth_headers, "DELETE", f"/api/v1/files/{record.id}")
+        assert response.status_code == 200
+        assert stats.count == 2
+        assert not path.exists()
+
+        response = await client.get(f"/api/v1/files/{record.id}/download", headers=auth_headers)
+        assert response.status_code == 404
@@ -0,0 +1,137 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.database import after_commit, unit_of_work
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.task import TaskCreate
+from app.services.assignment_service import assign_task, unassign_task
+from app.services.dependency_service import graph_cache
+from app.services.task_service import create_task, recommendation_cache
+
+
+def _count_commits(db_session, monkeypatch) -> list:
+    commits = []
+    original = db_session.commit
+
+    async def counting_commit():
+        commits.append(1)
+        await original()
+
+    monkeypatch.setattr(db_session, "commit", counting_commit)
+    return commits
+
+
+class TestUnitOfWork:
+    """Test grouping service writes into one transaction."""
+
+    @pytest.mark.asyncio
+    async def test_commits_once(self, db_session, test_user, monkeypatch):
+        """Test services flush inside a unit of work and the block commits once."""
+        commits = _count_commits(db_session, monkeypatch)
+
+        async with unit_of_work(db_session):
+            for i in range(3):
+                task = await create_task(db_session, TaskCreate(title=f"Task {i}"), test_user)
+                assert task.id is not None
+
+        assert len(commits) == 1
+        count = await db_session.scalar(select(func.count(Task.id)))
+        assert count == 3
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_error(self, db_session, test_user):
+        """Test nothing is persisted when the block raises."""
+        with pytest.raises(RuntimeError):
+            async with unit_of_work(db_session):
+                await create_task(db_session, TaskCreate(title="Doomed"), test_user)
+                raise RuntimeError("boom")
+
+        count = await db_session.scalar(select(func.count(Task.id)))
+        assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_rollback_leaves_no_cached_graph(self, db_session, test_user):
+        """Test a dependency graph built from uncommitted rows isn't cached."""
+        graph_cache.clear()
+        with pytest.raises(RuntimeError):
+            async with unit_of_work(db_session):
+                await create_task(db_session, TaskCreate(title="Doomed"), test_user)
+                await create_task(db_session, TaskCreate(title="Later", dependencies=["Doomed"]), test_user)
+                raise RuntimeError("boom")
+
+        assert graph_cache.get(None) is None
+
+    @pytest.mark.asyncio
+    async def test_assignment_defers_commit(self, db_session, test_user, monkeypatch):
+        """Test assigning and unassigning inside a unit of work commit and invalidate once, at the end."""
+        owner = User(email="owner@example.com", hashed_password="x")
+        db_session.add(owner)
+        task = Task(title="Water", status="available", owner=owner)
+        db_session.add(task)
+        await db_session.commit()
+        commits = _count_commits(db_session, monkeypatch)
+        recommendation_cache.set("page", ([], None))
+
+        async with unit_of_work(db_session):
+            await assign_task(db_session, task, test_user, owner)
+            await unassign_task(db_session, task)
+            assert commits == []
+            assert recommendation_cache.get("page") is not None
+
+        assert commits == [1]
+        assert recommendation_cache.get("page") is None
+
+    @pytest.mark.asyncio
+    async def test_after_commit_deferred(self, db_session):
+        """Test after_commit callbacks run only once the outermost block commits."""
+        calls = []
+
+        async def callback():
+            calls.append("sent")
+
+        async with unit_of_work(db_session):
+            async with unit_of_work(db_session):
+                await after_commit(db_session, callback)
+            assert calls == []
+
+        assert calls == ["sent"]
+
+
+class TestImportConfirm:
+    """Test the master plan import commits once."""
+
+    @pytest.mark.asyncio
+    async def test_confirm_import_single_transaction(
+        self, client: AsyncClient, db_session, test_user, auth_headers, monkeypatch
+    ):
+        """Test projects and tasks are imported with a single commit."""
+        preview = {
+            "projects": [{"name": "Alpha"}, {"name": "Beta"}],
+            "tasks": [
+                {"title": "Task A", "project": "Alpha"},
+                {"title": "Task B", "project": "Beta"},
+                {"title": "Task C"},
+            ],
+        }
+        commits = _count_commits(db_session, monkeypatch)
+
+        response = await client.post(
+            "/api/v1/import/confirm", json={"preview_data": preview}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "success",
+            "imported_projects": 2,
+            "imported_tasks": 3,
+            "total_imported": 5,
+            "linked_dependencies": 0,
+        }
+        assert len(commits) == 1
+        linked = await db_session.scalar(
+            select(func.count(Task.id)).join(Project, Task.project_id == Project.id)
+        )
+        assert linked == 2
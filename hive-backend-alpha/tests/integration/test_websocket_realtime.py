@@ -4,6 +4,8 @@ from httpx import AsyncClient
 from fastapi.testclient import TestClient
 from app.main import app
 from app.core.security import create_access_token
+from app.schemas.dashboard import TaskStats, UserStats
+from app.services.dashboard_service import counters as dashboard_counters
 
 
 @pytest.mark.asyncio
@@ -90,4 +92,27 @@ async def test_websocket_invalid_message(test_user):
             received_message = json.loads(data)
             
             assert received_message["type"] == "error"
-            assert "Invalid message format" in received_message["message"]
\ No newline at end of file
+            assert "Invalid message format" in received_message["message"]
+
+
+@pytest.mark.asyncio
+async def test_websocket_dashboard_subscription(test_user):
+    """Test subscribing to the dashboard returns a snapshot of the counters."""
+    token = create_access_token(data={"sub": str(test_user.id)})
+    
+    with TestClient(app) as client:
+        dashboard_counters.load(
+            TaskStats(total=3, by_status={"in_progress": 1, "draft": 2}, by_priority={}, by_category={}),
+            UserStats(total_users=1, active_users=1, online_users=1)
+        )
+        with client.websocket_connect(f"/api/v1/ws?token={token}") as websocket:
+            websocket.send_text(json.dumps({"type": "subscribe_dashboard", "payload": {}}))
+            
+            received_message = json.loads(websocket.receive_text())
+            
+            assert received_message["type"] == "dashboard_snapshot"
+            assert received_message["stats"]["total_tasks"] == 3
+            assert received_message["stats"]["active_tasks"] == 1
+            assert received_message["stats"]["online_users"] == 1
+            
+            websocket.send_text(json.dumps({"type": "unsubscribe_dashboard", "payload": {}}))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark: concurrent task claiming, read-check-write vs conditional UPDATE.
+
+CLAIMERS users each try to claim a random task from a pool of TASK_COUNT.
+"read-check-write" is the old flow (SELECT, check assignee/status in Python,
+write, commit); "conditional UPDATE" is assignment_service.claim_task. Each
+run reports latency, winners and double claims (tasks with more than one
+association row; anything above 0 is a lost update). Uses BENCH_DATABASE_URL
+if set (e.g. a Postgres test database), otherwise a temporary SQLite file,
+where writers serialise and the race mostly shows up as lock errors.
+
+    DATABASE_URL=sqlite+aiosqlite:///:memory: SECRET_KEY=bench python tests/performance/claim_contention_benchmark.py
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+from app.models.user_task_association import UserTaskAssociation
+from app.services import assignment_service, task_service
+
+
+CLAIMERS = int(os.environ.get("BENCH_CLAIMERS", 300))
+TASK_COUNT = int(os.environ.get("BENCH_TASK_COUNT", 10))
+CONCURRENCY = 50  # sessions in flight at once (kept under the pool size)
+
+
+async def read_check_write(db: AsyncSession, task_id, user: User) -> bool:
+    task = (await db.execute(select(Task).where(Task.id == task_id))).scalar_one()
+    if task.assignee_id is not None or task.status != "available":
+        return False
+    task.assignee_id = user.id
+    task.status = "in_progress"
+    db.add(UserTaskAssociation(user_id=user.id, task_id=task.id))
+    await db.commit()
+    return True
+
+
+async def conditional_update(db: AsyncSession, task_id, user: User) -> bool:
+    return await assignment_service.claim_task(db, task_id, user) is not None
+
+
+async def reset(session_factory, task_ids):
+    async with session_factory() as db:
+        await db.execute(delete(UserTaskAssociation))
+        await db.execute(
+            update(Task).where(Task.id.in_(task_ids)).values(assignee_id=None, status="available")
+        )
+        await db.commit()
+
+
+async def run(session_factory, claim, users, task_ids):
+    await reset(session_factory, task_ids)
+    task_service.recommendation_cache.clear()
+    gate = asyncio.Semaphore(CONCURRENCY)
+    latencies, outcomes = [], []
+
+    async def attempt(user):
+        async with gate, session_factory() as db:
+            start = time.perf_counter()
+            try:
+                outcomes.append(await claim(db, random.choice(task_ids), user))
+            except Exception:
+                await db.rollback()
+                outcomes.append(None)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(attempt(user) for user in users))
+    elapsed = time.perf_counter() - start
+
+    async with session_factory() as db:
+        per_task = (
+            select(func.count().label("claims"))
+            .select_from(UserTaskAssociation)
+            .group_by(UserTaskAssociation.task_id)
+            .subquery()
+        )
+        double_claims = (await db.execute(
+            select(func.count()).select_from(per_task).where(per_task.c.claims > 1)
+        )).scalar_one()
+    return elapsed, latencies, outcomes, double_claims
+
+
+def describe(latencies) -> str:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95)]
+    return f"median {statistics.median(latencies) * 1000:7.2f} ms   p95 {p95 * 1000:7.2f} ms"
+
+
+async def main():
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        path = os.path.join(tempfile.mkdtemp(), "claim_bench.db")
+        url = f"sqlite+aiosqlite:///{path}"
+        engine = create_async_engine(url, connect_args={"timeout": 30})
+    else:
+        engine = create_async_engine(url, pool_size=CONCURRENCY, max_overflow=0)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as db:
+        owner = User(email="owner@example.com", hashed_password="x")
+        db.add(owner)
+        await db.flush()
+        await db.execute(insert(User), [
+            {"email": f"claimer{i}@example.com", "hashed_password": "x"} for i in range(CLAIMERS)
+        ])
+        await db.execute(insert(Task), [
+            {"title": f"Task {i}", "status": "available", "owner_id": owner.id,
+             "required_skills": [], "dependencies": []}
+            for i in range(TASK_COUNT)
+        ])
+        await db.commit()
+        users = (await db.execute(select(User).where(User.id != owner.id))).scalars().all()
+        task_ids = (await db.execute(select(Task.id))).scalars().all()
+
+    print("=" * 60)
+    print(f"TASK CLAIM CONTENTION ({CLAIMERS} claimers, {TASK_COUNT} tasks, {engine.dialect.name})")
+    print("=" * 60)
+    for label, claim in (("read-check-write", read_check_write), ("conditional UPDATE", conditional_update)):
+        elapsed, latencies, outcomes, double_claims = await run(session_factory, claim, users, task_ids)
+        print(f"{label}: {elapsed:.2f}s total, {describe(latencies)}")
+        print(f"  won {outcomes.count(True)}, lost {outcomes.count(False)}, "
+              f"errors {outcomes.count(None)}, double-claimed tasks {double_claims}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
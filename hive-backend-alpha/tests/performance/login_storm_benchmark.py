@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Login storm benchmark for HIVE Backend Alpha.
+
+Measures latency of a cheap endpoint (/health) while many concurrent logins
+are in flight. With bcrypt running on the password hasher's worker pool the
+probe latency should stay flat; if hashing ran on the event loop, every probe
+would queue behind the logins.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import List
+import httpx
+
+
+BASE_URL = "http://localhost:8000"
+LOGIN_CONCURRENCY = 50
+LOGIN_ROUNDS = 4
+PROBE_INTERVAL = 0.02  # seconds between /health probes
+
+
+async def probe_latency(client: httpx.AsyncClient, stop: asyncio.Event) -> List[float]:
+    """Hit /health repeatedly until stopped, returning latencies in ms."""
+    times = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get(f"{BASE_URL}/health")
+        if response.status_code == 200:
+            times.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(PROBE_INTERVAL)
+    return times
+
+
+async def login_storm(client: httpx.AsyncClient, credentials: dict) -> List[float]:
+    """Run rounds of concurrent logins, returning login latencies in ms."""
+    times = []
+
+    async def login():
+        start = time.perf_counter()
+        response = await client.post(f"{BASE_URL}/api/v1/auth/login", json=credentials)
+        if response.status_code == 200:
+            times.append((time.perf_counter() - start) * 1000)
+
+    for _ in range(LOGIN_ROUNDS):
+        await asyncio.gather(*(login() for _ in range(LOGIN_CONCURRENCY)))
+    return times
+
+
+def summarize(name: str, times: List[float]):
+    if not times:
+        print(f"{name}: no successful requests")
+        return
+    ordered = sorted(times)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0]
+    print(f"{name}:")
+    print(f"  Requests: {len(times)}")
+    print(f"  Median:   {statistics.median(times):.2f}ms")
+    print(f"  p95:      {p95:.2f}ms")
+    print(f"  Max:      {max(times):.2f}ms")
+
+
+async def main():
+    print("Starting login storm benchmark...")
+    print(f"Make sure the server is running on {BASE_URL}")
+    print()
+
+    credentials = {
+        "email": f"storm_user_{int(time.time())}@example.com",
+        "password": "stormpassword123"
+    }
+
+    limits = httpx.Limits(max_connections=LOGIN_CONCURRENCY + 10)
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        await client.post(f"{BASE_URL}/api/v1/auth/register", json=credentials)
+
+        # Baseline probe latency with no logins running
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_latency(client, stop))
+        await asyncio.sleep(2)
+        stop.set()
+        baseline = await probe
+
+        # Probe latency during the storm
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_latency(client, stop))
+        storm_start = time.perf_counter()
+        logins = await login_storm(client, credentials)
+        storm_elapsed = time.perf_counter() - storm_start
+        stop.set()
+        during_storm = await probe
+
+        stats = (await client.get(f"{BASE_URL}/health/password-hasher")).json()
+
+    print("=" * 60)
+    print("LOGIN STORM RESULTS")
+    print("=" * 60)
+    summarize("HEALTH (idle)", baseline)
+    summarize("HEALTH (during storm)", during_storm)
+    summarize("LOGIN", logins)
+    print(f"\nLogin throughput: {len(logins) / storm_elapsed:.1f} logins/s")
+    print(f"Password hasher: {stats.get('password_hasher')}")
+
+    if baseline and during_storm:
+        ratio = statistics.median(during_storm) / statistics.median(baseline)
+        verdict = "FLAT" if ratio < 3 else "DEGRADED"
+        print(f"\nProbe median during storm is {ratio:.1f}x idle - {verdict}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
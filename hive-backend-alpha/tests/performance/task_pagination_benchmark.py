@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark: offset vs keyset (cursor) pagination on a large tasks table.
+
+Seeds TASK_COUNT tasks, then times fetching pages at increasing depth with
+task_service.get_tasks (OFFSET) and task_service.get_tasks_page (cursor).
+Uses BENCH_DATABASE_URL if set (e.g. a Postgres test database), otherwise
+a temporary SQLite file.
+
+    DATABASE_URL=sqlite+aiosqlite:///:memory: SECRET_KEY=bench python tests/performance/task_pagination_benchmark.py
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+from app.services import task_service
+
+
+TASK_COUNT = int(os.environ.get("BENCH_TASK_COUNT", 100_000))
+PAGE_SIZE = 50
+DEPTHS = (0, 100, 500, 1000, 1900)
+REPEATS = 5
+BATCH = 5000
+
+
+def task_id() -> uuid.UUID:
+    # SQLite gives the UUID column numeric affinity, so an all-digit hex string
+    # (optionally with one "e") would be stored as a number; skip those
+    while True:
+        value = uuid.uuid4()
+        if any(c not in "0123456789e" for c in value.hex):
+            return value
+
+
+async def seed(session_factory):
+    async with session_factory() as db:
+        owner = User(email="bench@example.com", hashed_password="x")
+        db.add(owner)
+        await db.commit()
+
+        start = datetime(2026, 1, 1)
+        for offset in range(0, TASK_COUNT, BATCH):
+            rows = [
+                {
+                    "id": task_id(),
+                    "title": f"Task {i}",
+                    "owner_id": owner.id,
+                    "required_skills": [],
+                    "dependencies": [],
+                    "created_at": start + timedelta(seconds=i),
+                    "updated_at": start + timedelta(seconds=i // 3),
+                }
+                for i in range(offset, min(offset + BATCH, TASK_COUNT))
+            ]
+            await db.execute(insert(Task), rows)
+        await db.commit()
+
+
+async def time_offset(session_factory, page: int) -> float:
+    timings = []
+    async with session_factory() as db:
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            await task_service.get_tasks(db, skip=page * PAGE_SIZE, limit=PAGE_SIZE)
+            timings.append(time.perf_counter() - start)
+            db.expunge_all()
+    return statistics.median(timings)
+
+
+async def time_keyset(session_factory, page: int) -> float:
+    async with session_factory() as db:
+        # Walk to the page once to obtain its cursor, as a client would
+        after = None
+        for _ in range(page):
+            _, after = await task_service.get_tasks_page(db, limit=PAGE_SIZE, after=after)
+            db.expunge_all()
+
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            await task_service.get_tasks_page(db, limit=PAGE_SIZE, after=after)
+            timings.append(time.perf_counter() - start)
+            db.expunge_all()
+    return statistics.median(timings)
+
+
+async def main():
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        path = os.path.join(tempfile.mkdtemp(), "pagination_bench.db")
+        url = f"sqlite+aiosqlite:///{path}"
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    print(f"Seeding {TASK_COUNT} tasks ({engine.dialect.name})...")
+    await seed(session_factory)
+
+    print("=" * 60)
+    print(f"TASK LIST PAGINATION ({PAGE_SIZE} per page)")
+    print("=" * 60)
+    print(f"{'page':>6} {'offset ms':>12} {'cursor ms':>12}")
+    for page in DEPTHS:
+        if page * PAGE_SIZE >= TASK_COUNT:
+            continue
+        offset_time = await time_offset(session_factory, page)
+        keyset_time = await time_keyset(session_factory, page)
+        print(f"{page:>6} {offset_time * 1000:>12.2f} {keyset_time * 1000:>12.2f}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark: task write latency with and without a post-commit refresh().
+
+"refresh" is the old add/commit/refresh pattern; "returning" relies on the
+models' eager_defaults, which fetch server defaults in the INSERT/UPDATE
+itself. Uses BENCH_DATABASE_URL if set (e.g. a Postgres test database),
+otherwise a temporary SQLite file.
+
+    DATABASE_URL=sqlite+aiosqlite:///:memory: SECRET_KEY=bench python tests/performance/write_path_benchmark.py
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.query_stats import instrument_engine, track_queries
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+
+
+ITERATIONS = 500
+
+
+async def run(session_factory, owner_id, refresh: bool):
+    create_times, update_times, statements = [], [], 0
+    async with session_factory() as db:
+        for i in range(ITERATIONS):
+            with track_queries() as stats:
+                start = time.perf_counter()
+                task = Task(title=f"Bench task {i}", owner_id=owner_id)
+                db.add(task)
+                await db.commit()
+                if refresh:
+                    await db.refresh(task)
+                create_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                task.status = "in_progress"
+                await db.commit()
+                if refresh:
+                    await db.refresh(task)
+                update_times.append(time.perf_counter() - start)
+            assert task.updated_at is not None
+            statements += stats.count
+    return create_times, update_times, statements / ITERATIONS
+
+
+def describe(label: str, times) -> str:
+    times = sorted(times)
+    p95 = times[int(len(times) * 0.95)]
+    return f"{label:<20} median {statistics.median(times) * 1000:7.3f} ms   p95 {p95 * 1000:7.3f} ms"
+
+
+async def main():
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        path = os.path.join(tempfile.mkdtemp(), "write_bench.db")
+        url = f"sqlite+aiosqlite:///{path}"
+
+    engine = create_async_engine(url)
+    instrument_engine(engine.sync_engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as db:
+        owner = User(email="bench@example.com", hashed_password="x")
+        db.add(owner)
+        await db.commit()
+        owner_id = owner.id
+
+    print("=" * 60)
+    print(f"TASK WRITE PATH ({ITERATIONS} creates + updates, {engine.dialect.name})")
+    print("=" * 60)
+    for label, refresh in (("commit + refresh", True), ("commit (RETURNING)", False)):
+        creates, updates, per_iteration = await run(session_factory, owner_id, refresh)
+        print(f"{label}: {per_iteration:.1f} statements per create+update")
+        print("  " + describe("create", creates))
+        print("  " + describe("update", updates))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.schemas.dashboard import TaskStats, UserStats
+from app.services.dashboard_service import DashboardCounters
+from app.websockets.dashboard_feed import DashboardFeed
+
+
+@pytest.fixture
+def counters():
+    """Fresh, seeded counters."""
+    counters = DashboardCounters()
+    counters.load(
+        TaskStats(total=2, by_status={"draft": 2}, by_priority={}, by_category={}),
+        UserStats(total_users=3, active_users=3, online_users=1)
+    )
+    return counters
+
+
+def mock_websocket():
+    websocket = MagicMock()
+    websocket.send_text = AsyncMock()
+    return websocket
+
+
+def frames(websocket) -> list:
+    return [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+
+
+class TestDashboardFeed:
+    """Test dashboard snapshots and coalesced deltas."""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_sends_snapshot(self, counters):
+        """Test a subscriber first receives every stat."""
+        feed = DashboardFeed(counters, max_frames_per_second=100)
+        websocket = mock_websocket()
+
+        await feed.subscribe(websocket)
+
+        [snapshot] = frames(websocket)
+        assert snapshot["type"] == "dashboard_snapshot"
+        assert snapshot["stats"]["total_tasks"] == 2
+        assert snapshot["stats"]["draft_tasks"] == 2
+        assert snapshot["stats"]["online_users"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changes_are_coalesced(self, counters):
+        """Test a burst of changes goes out as one delta with only the changed stats."""
+        feed = DashboardFeed(counters, max_frames_per_second=20)
+        websockets = [mock_websocket(), mock_websocket()]
+        for websocket in websockets:
+            await feed.subscribe(websocket)
+
+        counters.task_changed("draft", "in_progress")
+        counters.task_changed(None, "draft")
+        counters.user_changed((True, False), (True, True))
+        await feed._flush
+
+        for websocket in websockets:
+            snapshot, delta = frames(websocket)
+            assert delta["type"] == "dashboard_delta"
+            assert delta["sequence"] == 1
+            assert delta["changes"] == {
+                "total_tasks": 3, "active_tasks": 1, "in_progress_tasks": 1, "online_users": 2
+            }
+
+    @pytest.mark.asyncio
+    async def test_frame_rate_limited(self, counters):
+        """Test changes after a frame wait for the next frame slot."""
+        feed = DashboardFeed(counters, max_frames_per_second=10)
+        websocket = mock_websocket()
+        await feed.subscribe(websocket)
+
+        counters.task_changed(None, "draft")
+        await feed._flush
+        counters.task_changed(None, "draft")
+        await asyncio.sleep(0)
+        assert len(frames(websocket)) == 2
+
+        await feed._flush
+        assert frames(websocket)[-1]["changes"] == {"total_tasks": 4, "draft_tasks": 4}
+
+    @pytest.mark.asyncio
+    async def test_no_subscribers_no_frames(self, counters):
+        """Test changes are ignored while nobody is subscribed."""
+        feed = DashboardFeed(counters, max_frames_per_second=100)
+        websocket = mock_websocket()
+        await feed.subscribe(websocket)
+        feed.unsubscribe(websocket)
+
+        counters.task_changed(None, "draft")
+
+        assert feed._flush is None
+        assert len(frames(websocket)) == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_connection_dropped(self, counters):
+        """Test a subscriber whose send fails is removed."""
+        feed = DashboardFeed(counters, max_frames_per_second=100)
+        websocket = mock_websocket()
+        await feed.subscribe(websocket)
+        websocket.send_text.side_effect = RuntimeError("closed")
+
+        counters.task_changed(None, "draft")
+        await feed._flush
+
+        assert websocket not in feed.subscribers
@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.core.metrics import Histogram
+from app.database import InstrumentedAsyncQueuePool, _engine_options, get_pool_status
+
+
+def test_histogram_cumulative_buckets():
+    """Test histogram buckets are cumulative and include +Inf."""
+    histogram = Histogram([0.1, 1.0])
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 3}
+    assert snapshot["count"] == 3
+    assert snapshot["sum"] == pytest.approx(5.55)
+
+
+def test_engine_options_sqlite_skips_pool_sizing():
+    """Test SQLite URLs keep the default pool."""
+    options = _engine_options("sqlite+aiosqlite:///:memory:")
+
+    assert "poolclass" not in options
+    assert "pool_size" not in options
+
+
+def test_engine_options_postgres_pool_settings(monkeypatch):
+    """Test pool sizing and statement cache come from settings."""
+    monkeypatch.setattr(settings, "db_pool_size", 20)
+    monkeypatch.setattr(settings, "db_statement_cache_size", 50)
+    monkeypatch.setattr(settings, "db_pgbouncer_mode", False)
+
+    options = _engine_options("postgresql+asyncpg://u:p@localhost/db")
+
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["pool_size"] == 20
+    assert options["pool_pre_ping"] == settings.db_pool_pre_ping
+    assert options["connect_args"]["statement_cache_size"] == 50
+    assert options["connect_args"]["prepared_statement_cache_size"] == 50
+
+
+def test_engine_options_pgbouncer_mode(monkeypatch):
+    """Test PgBouncer mode disables prepared statement caching."""
+    monkeypatch.setattr(settings, "db_pgbouncer_mode", True)
+
+    options = _engine_options("postgresql+asyncpg://u:p@localhost/db")
+    connect_args = options["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["prepared_statement_name_func"]() != connect_args["prepared_statement_name_func"]()
+
+
+@pytest.mark.asyncio
+async def test_pool_status_reports_checkouts(tmp_path):
+    """Test live pool statistics while a connection is checked out."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = get_pool_status(engine)
+            assert stats["checked_out"] == 1
+            assert stats["max_overflow"] == 1
+
+        stats = get_pool_status(engine)
+        assert stats["checked_out"] == 0
+        assert stats["checkout_wait_seconds"]["count"] >= 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,94 @@
+from uuid import uuid4
+
+import pytest
+
+from app.core.dependency_graph import DependencyCycleError, DependencyGraph, parse_hours
+
+
+def _chain():
+    """design -> build -> ship, plus docs depending on design."""
+    graph = DependencyGraph()
+    design, build, ship, docs = uuid4(), uuid4(), uuid4(), uuid4()
+    graph.upsert(design, "Design", [], hours=2)
+    graph.upsert(build, "Build", [design], hours=5)
+    graph.upsert(ship, "Ship", [build], hours=1)
+    graph.upsert(docs, "Docs", [design], hours=3)
+    return graph, design, build, ship, docs
+
+
+def test_topological_order_and_critical_path():
+    """Test prerequisites come first and the critical path follows the longest chain."""
+    graph, design, build, ship, docs = _chain()
+    order = graph.topological_order()
+    assert order.index(design) < order.index(build) < order.index(ship)
+    assert order.index(design) < order.index(docs)
+    assert graph.critical_path() == ([design, build, ship], 8.0)
+
+
+def test_completion_updates_ready_and_blocked_incrementally():
+    """Test completing a task unblocks its dependents and shortens the critical path."""
+    graph, design, build, ship, docs = _chain()
+    assert graph.ready == {design}
+    assert set(graph.unblocks(design)) == {build, docs}
+
+    graph.set_completed(design, True)
+    assert graph.ready == {build, docs}
+    assert graph.blocked_by(ship) == [build]
+    assert graph.critical_path()[1] == 6.0
+
+    graph.set_completed(design, False)
+    assert graph.blocked == {build, ship, docs}
+
+
+def test_cycle_rejected_with_path():
+    """Test an edge closing a loop is refused and the graph is unchanged."""
+    graph, design, build, ship, docs = _chain()
+    with pytest.raises(DependencyCycleError) as error:
+        graph.set_prerequisites(design, [ship])
+    assert error.value.cycle == [design, ship, build, design]
+    assert graph.prerequisites[design] == set()
+    assert graph.topological_order()
+
+
+def test_stored_cycle_reported_by_order():
+    """Test cycles loaded without checks surface from topological_order."""
+    graph = DependencyGraph()
+    a, b = uuid4(), uuid4()
+    graph.upsert(a, "A", [b], check_cycles=False)
+    graph.upsert(b, "B", [a], check_cycles=False)
+    with pytest.raises(DependencyCycleError) as error:
+        graph.topological_order()
+    assert set(error.value.cycle) == {a, b}
+
+
+def test_dangling_ids_activate_when_task_appears():
+    """Test a listed id only becomes an edge once that task is in the graph, and stops on removal."""
+    graph = DependencyGraph()
+    later, task = uuid4(), uuid4()
+    graph.upsert(task, "Task", [later])
+    assert graph.ready == {task}
+
+    graph.upsert(later, "Later", [])
+    assert graph.blocked_by(task) == [later]
+
+    graph.remove(later)
+    assert graph.ready == {task}
+    assert graph.blocked_by(task) == []
+
+
+def test_resolve_titles():
+    """Test dependency text naming a task resolves to its id; ids and unknown text are kept."""
+    graph, design, build, ship, docs = _chain()
+    other = str(uuid4())
+    assert graph.resolve(["  design ", "Budget approval", other, "Build"], ship) == [
+        str(design), "Budget approval", other, str(build)
+    ]
+    assert graph.resolve(["Ship"], ship) == ["Ship"]
+
+
+def test_parse_hours():
+    """Test estimated hour strings become durations."""
+    assert parse_hours("4-6 hours") == 6.0
+    assert parse_hours("2.5") == 2.5
+    assert parse_hours(None) == 1.0
+    assert parse_hours("a while") == 1.0
@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import inspect
+
+from app.core.query_stats import track_queries
+from app.schemas.task import TaskCreate
+from app.services.task_service import create_task, update_task_status
+
+
+class TestSingleRoundTripWrites:
+    """Test writes return server defaults without a follow-up SELECT."""
+
+    @pytest.mark.asyncio
+    async def test_create_returns_server_defaults(self, db_session, test_user):
+        """Test create_task issues one INSERT and has timestamps populated."""
+        with track_queries() as stats:
+            task = await create_task(db_session, TaskCreate(title="Write path"), test_user)
+
+        assert stats.count == 1
+        assert task.created_at is not None
+        assert task.updated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_update_returns_onupdate_value(self, db_session, test_user):
+        """Test update_task_status issues one UPDATE and refreshes updated_at."""
+        task = await create_task(db_session, TaskCreate(title="Write path"), test_user)
+
+        with track_queries() as stats:
+            task = await update_task_status(db_session, task, "in_progress")
+
+        assert stats.count == 1
+        assert task.status == "in_progress"
+        assert "updated_at" not in inspect(task).expired_attributes
@@ -0,0 +1,59 @@
+import asyncio
+import time
+import pytest
+
+from app.core.security import PasswordHasher, verify_password
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_roundtrip():
+    """Test hashes produced off-loop verify with the standard context."""
+    hasher = PasswordHasher(max_workers=2)
+
+    hashed = await hasher.hash("s3cret")
+
+    assert verify_password("s3cret", hashed)
+    assert await hasher.verify("s3cret", hashed) is True
+    assert await hasher.verify("wrong", hashed) is False
+
+
+@pytest.mark.asyncio
+async def test_stats_track_completed_work():
+    """Test queue metrics after a burst of concurrent hashes."""
+    hasher = PasswordHasher(max_workers=1)
+
+    await asyncio.gather(*(hasher.hash(f"password{i}") for i in range(3)))
+
+    stats = hasher.stats()
+    assert stats["completed"] == 3
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+    assert stats["queue_wait_seconds"]["count"] == 3
+    # With a single worker the later hashes had to wait for the earlier ones
+    assert stats["queue_wait_seconds"]["sum"] > 0
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive():
+    """Test other coroutines keep running while bcrypt work is in flight."""
+    hasher = PasswordHasher(max_workers=2)
+    gaps = []
+    done = False
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(hasher.hash("password") for _ in range(4)))
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker_task
+
+    # The loop was never blocked for anything close to the hashing time
+    assert max(gaps) < elapsed / 2
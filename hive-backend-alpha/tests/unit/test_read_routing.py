@@ -0,0 +1,101 @@
+import pytest
+import pytest_asyncio
+from uuid import uuid4
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app import database
+from app.core.security import create_access_token
+from app.database import RecentWriters
+from app.dependencies import get_read_db
+
+
+async def _make_database(path, name):
+    """Create a SQLite database whose single row identifies it."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE whoami (name TEXT)"))
+        await conn.execute(text("INSERT INTO whoami VALUES (:name)"), {"name": name})
+    return engine
+
+
+async def _whoami(session):
+    result = await session.execute(text("SELECT name FROM whoami"))
+    return result.scalar()
+
+
+async def _resolve(primary, credentials=None):
+    generator = get_read_db(primary=primary, credentials=credentials)
+    session = await generator.__anext__()
+    try:
+        return await _whoami(session)
+    finally:
+        await generator.aclose()
+
+
+@pytest_asyncio.fixture
+async def two_databases(tmp_path, monkeypatch):
+    """Primary and replica databases, with the replica wired into get_read_db."""
+    primary_engine = await _make_database(tmp_path / "primary.db", "primary")
+    replica_engine = await _make_database(tmp_path / "replica.db", "replica")
+
+    monkeypatch.setattr(
+        database,
+        "read_async_session",
+        async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    monkeypatch.setattr(database, "recent_writers", RecentWriters(window=60))
+    monkeypatch.setattr("app.dependencies.recent_writers", database.recent_writers)
+
+    async with AsyncSession(primary_engine) as primary:
+        yield primary
+
+    await primary_engine.dispose()
+    await replica_engine.dispose()
+
+
+def test_recent_writers_window():
+    """Test writes are remembered only for the configured window."""
+    user_id = uuid4()
+
+    writers = RecentWriters(window=60)
+    assert not writers.wrote_recently(user_id)
+    writers.mark(user_id)
+    assert writers.wrote_recently(user_id)
+
+    expired = RecentWriters(window=0)
+    expired.mark(user_id)
+    assert not expired.wrote_recently(user_id)
+
+
+@pytest.mark.asyncio
+async def test_read_db_uses_primary_without_replica(tmp_path, monkeypatch):
+    """Test reads stay on the primary when no replica is configured."""
+    engine = await _make_database(tmp_path / "only.db", "primary")
+    monkeypatch.setattr(database, "read_async_session", None)
+
+    async with AsyncSession(engine) as primary:
+        assert await _resolve(primary) == "primary"
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_db_routes_anonymous_reads_to_replica(two_databases):
+    """Test unauthenticated reads go to the replica."""
+    assert await _resolve(two_databases) == "replica"
+
+
+@pytest.mark.asyncio
+async def test_read_db_read_your_writes(two_databases):
+    """Test a user's reads fall back to the primary right after their own write."""
+    user_id = uuid4()
+    token = create_access_token(data={"sub": str(user_id)})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    assert await _resolve(two_databases, credentials) == "replica"
+
+    database.recent_writers.mark(user_id)
+
+    assert await _resolve(two_databases, credentials) == "primary"
@@ -0,0 +1,51 @@
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+from app.core import auth
+from app.core.auth import token_cache, verify_access_token
+from app.core.cache import TTLCache
+from app.core.security import create_access_token
+
+
+def test_valid_token_is_cached():
+    """Test a validated token is served from the cache on the next call."""
+    user_id = uuid4()
+    token = create_access_token(data={"sub": str(user_id)})
+
+    assert verify_access_token(token) == user_id
+    hits = token_cache.hits
+    assert verify_access_token(token) == user_id
+    assert token_cache.hits == hits + 1
+
+
+def test_invalid_token_is_not_cached():
+    """Test rejected tokens never enter the cache."""
+    size = len(token_cache)
+
+    assert verify_access_token("not-a-jwt") is None
+    assert len(token_cache) == size
+
+
+def test_cached_entry_expires_with_token(monkeypatch):
+    """Test cache entries are evicted at the token's exp."""
+    user_id = uuid4()
+    token = create_access_token(data={"sub": str(user_id)}, expires_delta=timedelta(seconds=30))
+    assert verify_access_token(token) == user_id
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+
+    assert token_cache.get(token) is None
+
+
+def test_cache_size_is_bounded(monkeypatch):
+    """Test the token cache never grows past its size bound."""
+    bounded = TTLCache("test-access-tokens", max_size=3, ttl=300)
+    monkeypatch.setattr(auth, "token_cache", bounded)
+
+    for _ in range(5):
+        verify_access_token(create_access_token(data={"sub": str(uuid4())}))
+
+    assert len(bounded) == 3
+    assert bounded.evictions == 2
@@ -0,0 +1,109 @@
+import time
+import pytest
+from sqlalchemy import event
+
+from app.core.cache import TTLCache, get_cache_stats
+from app.schemas.user import UserUpdate
+from app.services import user_service
+from tests.conftest import TestSessionLocal, test_engine
+
+
+class TestTTLCache:
+    """Test the bounded TTL/LRU cache."""
+
+    def test_hit_and_miss_counters(self):
+        cache = TTLCache("test-counters", max_size=10, ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_lru_eviction(self):
+        cache = TTLCache("test-lru", max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_entries_expire(self, monkeypatch):
+        cache = TTLCache("test-expiry", max_size=10, ttl=60)
+        cache.set("a", 1, ttl=5)
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = TTLCache("test-disabled", max_size=10, ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_registered_for_diagnostics(self):
+        TTLCache("test-registry", max_size=1, ttl=1)
+        assert "test-registry" in [stats["name"] for stats in get_cache_stats()]
+
+
+class TestCachedUserLookup:
+    """Test the authenticated-user cache in user_service."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_query(self, db_session, test_user):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        user_service.user_cache.invalidate(test_user.id)
+
+        async with TestSessionLocal() as session:
+            user = await user_service.get_cached_user_by_id(session, test_user.id)
+            assert user.email == test_user.email
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            async with TestSessionLocal() as session:
+                user = await user_service.get_cached_user_by_id(session, test_user.id)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+        assert user.id == test_user.id
+        assert user.email == test_user.email
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_cached_user_can_be_updated(self, db_session, test_user):
+        user_service.user_cache.invalidate(test_user.id)
+        async with TestSessionLocal() as session:
+            await user_service.get_cached_user_by_id(session, test_user.id)
+
+        async with TestSessionLocal() as session:
+            user = await user_service.get_cached_user_by_id(session, test_user.id)
+            await user_service.update_user(session, user, UserUpdate(role="Data Analyst"))
+
+        # update_user invalidates the entry, so the next lookup sees the change
+        assert user_service.user_cache.get(test_user.id) is None
+        async with TestSessionLocal() as session:
+            user = await user_service.get_cached_user_by_id(session, test_user.id)
+            assert user.role == "Data Analyst"
+
+    @pytest.mark.asyncio
+    async def test_online_status_invalidates(self, db_session, test_user):
+        async with TestSessionLocal() as session:
+            await user_service.get_cached_user_by_id(session, test_user.id)
+        assert user_service.user_cache.get(test_user.id) is not None
+
+        async with TestSessionLocal() as session:
+            await user_service.set_user_online_status(session, test_user.id, True)
+
+        assert user_service.user_cache.get(test_user.id) is None
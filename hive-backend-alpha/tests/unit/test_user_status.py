@@ -31,7 +31,7 @@ class TestUserOnlineStatus:
         assert result is not None
         assert result.is_online is True
         mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once_with(mock_user)
+        mock_db.refresh.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_set_user_online_status_user_not_found(self):
@@ -1,4 +1,20 @@
 """Test utilities and helper functions."""
 
-# Placeholder for test utility functions
-# This will be expanded as needed for the alpha version
\ No newline at end of file
+from contextlib import contextmanager
+
+from app.core.query_stats import track_queries
+
+
+@contextmanager
+def assert_max_queries(max_queries: int):
+    """Fail if the block executes more than ``max_queries`` SQL statements.
+
+    The test engine is instrumented in conftest, so this works around API
+    calls made through the ``client`` fixture as well as direct service calls.
+    """
+    with track_queries() as stats:
+        yield stats
+    assert stats.count <= max_queries, (
+        f"Expected at most {max_queries} queries, got {stats.count}:\n"
+        + "\n".join(f"  {count}x {shape}" for shape, count in stats.shapes.most_common())
+    )